@@ -0,0 +1,79 @@
+// Load the options of select[data-autocomplete-url] fields on demand.
+(function () {
+  'use strict';
+
+  var DELAY = 250;
+
+  function keepSelected(select) {
+    Array.prototype.slice.call(select.options).forEach(function (option) {
+      if (!option.selected && option.value) {
+        select.removeChild(option);
+      }
+    });
+  }
+
+  function addOptions(select, results) {
+    var known = {};
+    Array.prototype.slice.call(select.options).forEach(function (option) {
+      known[option.value] = true;
+    });
+    results.forEach(function (result) {
+      if (!known[result.id]) {
+        select.appendChild(new Option(result.text, result.id));
+      }
+    });
+  }
+
+  function setUp(select) {
+    var url = select.getAttribute('data-autocomplete-url');
+    var search = document.createElement('input');
+    var more = document.createElement('button');
+    var timer = null;
+    var next = null;
+    var loaded = false;
+
+    search.type = 'search';
+    search.className = 'form-control form-control-sm mb-1';
+    search.setAttribute('aria-label', select.getAttribute('name'));
+    more.type = 'button';
+    more.className = 'btn btn-link btn-sm p-0';
+    more.textContent = '…';
+    more.hidden = true;
+
+    function load(cursor) {
+      loaded = true;
+      var query = new URLSearchParams({q: search.value});
+      if (cursor) {
+        query.set('cursor', cursor);
+      }
+      fetch(url + '?' + query.toString(), {credentials: 'same-origin'})
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          if (!cursor) {
+            keepSelected(select);
+          }
+          addOptions(select, data.results);
+          next = data.next;
+          more.hidden = !next;
+        });
+    }
+
+    search.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () { load(null); }, DELAY);
+    });
+    select.addEventListener('focus', function () {
+      if (!loaded) {
+        load(null);
+      }
+    });
+    more.addEventListener('click', function () { load(next); });
+
+    select.parentNode.insertBefore(search, select);
+    select.parentNode.insertBefore(more, select.nextSibling);
+  }
+
+  document.addEventListener('DOMContentLoaded', function () {
+    document.querySelectorAll('select[data-autocomplete-url]').forEach(setUp);
+  });
+}());
@@ -0,0 +1,66 @@
+// Load board columns lazily and move dropped cards to their new status.
+(function () {
+  'use strict';
+
+  function loadMore(button) {
+    button.disabled = true;
+    fetch(button.getAttribute('data-board-more'), {credentials: 'same-origin'})
+      .then(function (response) { return response.text(); })
+      .then(function (html) {
+        button.insertAdjacentHTML('beforebegin', html);
+        button.parentNode.removeChild(button);
+      });
+  }
+
+  function move(card, column, token) {
+    var origin = card.parentNode;
+    var next = card.nextSibling;
+    var body = new FormData();
+    body.append('status', column.getAttribute('data-board-column'));
+
+    column.insertBefore(card, column.querySelector('[data-board-more]'));
+    fetch(card.getAttribute('data-move-url'), {
+      method: 'POST',
+      body: body,
+      credentials: 'same-origin',
+      headers: {'X-CSRFToken': token},
+    }).then(function (response) {
+      if (!response.ok) {
+        origin.insertBefore(card, next);
+      }
+    });
+  }
+
+  function setUp(board) {
+    var token = board.querySelector('[name=csrfmiddlewaretoken]').value;
+    var dragged = null;
+
+    board.addEventListener('click', function (event) {
+      var button = event.target.closest('[data-board-more]');
+      if (button) {
+        loadMore(button);
+      }
+    });
+    board.addEventListener('dragstart', function (event) {
+      dragged = event.target.closest('[data-move-url]');
+      event.dataTransfer.effectAllowed = 'move';
+    });
+    board.addEventListener('dragover', function (event) {
+      if (dragged && event.target.closest('[data-board-column]')) {
+        event.preventDefault();
+      }
+    });
+    board.addEventListener('drop', function (event) {
+      var column = event.target.closest('[data-board-column]');
+      event.preventDefault();
+      if (dragged && column && column !== dragged.parentNode) {
+        move(dragged, column, token);
+      }
+      dragged = null;
+    });
+  }
+
+  document.addEventListener('DOMContentLoaded', function () {
+    document.querySelectorAll('[data-board]').forEach(setUp);
+  });
+}());
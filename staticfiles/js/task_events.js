@@ -0,0 +1,69 @@
+// Patch the rows of the tasks table from the task events stream.
+(function () {
+  'use strict';
+
+  // Events of one task coming together are applied once.
+  var REFRESH_DELAY = 100;
+
+  function setUp(table) {
+    var body = table.tBodies[0];
+    var rowUrl = table.getAttribute('data-row-url');
+    var appendCreated = table.hasAttribute('data-append-created');
+    var timers = {};
+
+    function findRow(pk) {
+      return body.querySelector('tr[data-task="' + pk + '"]');
+    }
+
+    function refresh(pk) {
+      var url = rowUrl.replace('/0/', '/' + pk + '/') + window.location.search;
+      fetch(url, {credentials: 'same-origin'})
+        .then(function (response) { return response.text(); })
+        .then(function (html) {
+          var row = findRow(pk);
+          var checked;
+          if (row && html) {
+            // The selection for the bulk actions is kept.
+            checked = row.querySelector('[name=tasks]').checked;
+            row.outerHTML = html;
+            findRow(pk).querySelector('[name=tasks]').checked = checked;
+          } else if (row) {
+            row.parentNode.removeChild(row);
+          } else if (html && appendCreated) {
+            body.insertAdjacentHTML('beforeend', html);
+          }
+        });
+    }
+
+    function apply(task) {
+      var row = findRow(task.id);
+      if (task.action === 'deleted') {
+        if (row) {
+          row.parentNode.removeChild(row);
+        }
+      } else if (row || task.action === 'created') {
+        clearTimeout(timers[task.id]);
+        timers[task.id] = setTimeout(function () {
+          delete timers[task.id];
+          refresh(task.id);
+        }, REFRESH_DELAY);
+      }
+    }
+
+    var source = new EventSource(table.getAttribute('data-events-url'));
+    source.addEventListener('task', function (event) {
+      apply(JSON.parse(event.data));
+    });
+    source.addEventListener('reset', function () {
+      source.close();
+      window.location.reload();
+    });
+  }
+
+  document.addEventListener('DOMContentLoaded', function () {
+    var table = document.querySelector('[data-events-url]');
+    if (table) {
+      setUp(table);
+    }
+  });
+}());
@@ -0,0 +1,10 @@
+"""API application configuration."""
+
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    """API config."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.api'
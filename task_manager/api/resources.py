@@ -0,0 +1,157 @@
+"""API application resources."""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+
+from task_manager.labels.forms import LabelForm
+from task_manager.labels.models import Label
+from task_manager.labels.views import PROTECTED_ERROR_MESSAGE as LABEL_PROTECTED_MESSAGE
+from task_manager.statuses.forms import StatusForm
+from task_manager.statuses.models import Status
+from task_manager.statuses.views import (
+    PROTECTED_ERROR_MESSAGE as STATUS_PROTECTED_MESSAGE,
+)
+from task_manager.users.forms import UserCreateForm
+from task_manager.users.views import (
+    PERMISSION_DENIED_MESSAGE as USER_PERMISSION_MESSAGE,
+)
+from task_manager.users.views import PROTECTED_ERROR_MESSAGE as USER_PROTECTED_MESSAGE
+
+User = get_user_model()
+
+ID = 'id'
+NAME = 'name'
+
+USER_FIELDS = (ID, 'first_name', 'last_name')
+
+
+class ResourcePermissions(object):
+    """Who may write a resource and what blocks a deletion."""
+
+    public_methods = frozenset()
+    permission_message = ''
+    protected_error_message = ''
+
+    def can_change(self, user, instance):
+        """Return True if the user may change the object."""
+        return True
+
+    def can_delete(self, user, instance):
+        """Return True if the user may delete the object."""
+        return self.can_change(user, instance)
+
+    def is_in_use(self, instance):
+        """Return True if other objects still reference the object."""
+        return bool(self.protected_error_message) and instance.is_in_use()
+
+
+class Resource(ResourcePermissions):
+    """JSON representation of a model built from ``values()`` rows.
+
+    ``fields`` maps the public field names to the model lookups. The
+    rows are read with ``values()``, renamed and completed by the
+    functions of ``includes``, so no model instance is created to
+    answer a read.
+    """
+
+    name = ''
+    model = None
+    fields = {}
+    includes = {}
+    default_ordering = (ID,)
+    form_class = None
+
+    def get_queryset(self, request):
+        """Return the rows the request may read, or raise ValueError."""
+        return self.model.objects.all()
+
+    async def aget_queryset(self, request):
+        """Return the rows the request may read, from an async view."""
+        return self.get_queryset(request)
+
+    def get_ordering(self, queryset):
+        """Return the keyset ordering of the queryset."""
+        return self.default_ordering
+
+    def get_form(self, request, form_values, instance=None):
+        """Return the bound form validating a write."""
+        return self.form_class(data=form_values, instance=instance)
+
+    def save(self, request, form):
+        """Save the valid form and return the object."""
+        return form.save()
+
+    def serialize(self, rows, fields, includes):
+        """Return the public representation of the values() rows."""
+        records = [
+            {field: row[self.fields[field]] for field in fields}
+            for row in rows
+        ]
+        for include in includes:
+            self.includes[include](records)
+
+        return records
+
+    async def aserialize(self, rows, fields, includes):
+        """Serialize from an async view, the includes read in one thread."""
+        if includes:
+            return await sync_to_async(self.serialize)(rows, fields, includes)
+
+        return self.serialize(rows, fields, includes)
+
+
+def include_users(records, field):
+    """Replace user ids by the users, in one query."""
+    ids = {record[field] for record in records} - {None}
+    users = {
+        user[ID]: user
+        for user in User.objects.filter(pk__in=ids).values(*USER_FIELDS)
+    }
+
+    for record in records:
+        record[field] = users.get(record[field])
+
+
+class NamedResource(Resource):
+    """Objects identified by a unique name."""
+
+    fields = {field: field for field in (ID, NAME, 'created_at')}
+    default_ordering = (NAME, ID)
+
+
+class StatusResource(NamedResource):
+    """Statuses."""
+
+    name = 'statuses'
+    model = Status
+    form_class = StatusForm
+    protected_error_message = STATUS_PROTECTED_MESSAGE
+
+
+class LabelResource(NamedResource):
+    """Labels."""
+
+    name = 'labels'
+    model = Label
+    form_class = LabelForm
+    protected_error_message = LABEL_PROTECTED_MESSAGE
+
+
+class UserResource(Resource):
+    """Users, readable by anyone like the users page."""
+
+    name = 'users'
+    model = User
+    fields = {
+        field: field
+        for field in (*USER_FIELDS, 'username', 'date_joined')
+    }
+    default_ordering = ('first_name', 'last_name', ID)
+    form_class = UserCreateForm
+    public_methods = frozenset(('GET', 'HEAD', 'POST'))
+    permission_message = USER_PERMISSION_MESSAGE
+    protected_error_message = USER_PROTECTED_MESSAGE
+
+    def can_change(self, user, instance):
+        """Users only change themselves."""
+        return user.pk == instance.pk
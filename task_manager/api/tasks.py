@@ -0,0 +1,107 @@
+"""API application task resource."""
+
+from functools import partial
+
+from asgiref.sync import sync_to_async
+
+from task_manager.api.resources import ID, NAME, Resource, include_users
+from task_manager.labels.choices import label_choices
+from task_manager.statuses.choices import status_choices
+from task_manager.tasks.filters import TasktFilter
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.models import Relationships, Task
+from task_manager.tasks.search import SEARCH_RANK
+from task_manager.tasks.views import (
+    PERMISSION_DENIED_MESSAGE as TASK_PERMISSION_MESSAGE,
+)
+
+STATUS = 'status'
+
+
+def include_status(tasks):
+    """Replace the status id by the status, from the cached choices."""
+    for task in tasks:
+        task[STATUS] = {
+            ID: task[STATUS],
+            NAME: status_choices.get_name(task[STATUS]),
+        }
+
+
+def include_labels(tasks):
+    """Add the labels of the tasks, in one query."""
+    labels = {task[ID]: [] for task in tasks}
+    relationships = Relationships.objects.filter(
+        task_id__in=labels,
+    ).order_by('label_id').values_list('task_id', 'label_id')
+
+    for task_id, label_id in relationships:
+        labels[task_id].append({
+            ID: label_id,
+            NAME: label_choices.get_name(label_id),
+        })
+
+    for task in tasks:
+        task['labels'] = labels[task[ID]]
+
+
+class TaskResource(Resource):
+    """Tasks, filtered with the tasks page filter."""
+
+    name = 'tasks'
+    model = Task
+    fields = {
+        ID: ID,
+        NAME: NAME,
+        'description': 'description',
+        STATUS: 'status_id',
+        'executor': 'executor_id',
+        'author': 'created_by_id',
+        'created_at': 'created_at',
+    }
+    includes = {
+        STATUS: include_status,
+        'executor': partial(include_users, field='executor'),
+        'author': partial(include_users, field='author'),
+        'labels': include_labels,
+    }
+    default_ordering = ('created_at', ID)
+    form_class = TaskForm
+    permission_message = TASK_PERMISSION_MESSAGE
+
+    def get_queryset(self, request):
+        """Return the tasks matched by the filter parameters.
+
+        Raises:
+            ValueError: the filter parameters are invalid.
+        """
+        filterset = TasktFilter(
+            request.GET,
+            queryset=Task.objects.all(),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise ValueError(filterset.errors.get_json_data())
+
+        return filterset.qs
+
+    async def aget_queryset(self, request):
+        """Validate the filter, which may query the database, in a thread."""
+        return await sync_to_async(self.get_queryset)(request)
+
+    def get_ordering(self, queryset):
+        """List search results best match first."""
+        if SEARCH_RANK in queryset.query.annotations:
+            return (SEARCH_RANK, ID)
+
+        return self.default_ordering
+
+    def save(self, request, form):
+        """Save the task, authored by the user when created."""
+        if form.instance.pk is None:
+            form.instance.created_by = request.user
+
+        return form.save()
+
+    def can_delete(self, user, instance):
+        """Only the author deletes a task."""
+        return user.pk == instance.created_by_id
@@ -0,0 +1,32 @@
+"""API application URL Configuration."""
+
+from django.urls import include, path
+
+from task_manager.api.resources import LabelResource, StatusResource, UserResource
+from task_manager.api.tasks import TaskResource
+from task_manager.api.views import ResourceDetailView, ResourceListView
+
+app_name = 'api'
+
+RESOURCES = (TaskResource(), StatusResource(), LabelResource(), UserResource())
+
+
+def get_resource_patterns(resource):
+    """Return the URL patterns of a resource."""
+    return [
+        path('', ResourceListView.as_view(resource=resource), name='list'),
+        path(
+            '<int:pk>/',
+            ResourceDetailView.as_view(resource=resource),
+            name='detail',
+        ),
+    ]
+
+
+urlpatterns = [
+    path(
+        '{0}/'.format(resource.name),
+        include((get_resource_patterns(resource), resource.name)),
+    )
+    for resource in RESOURCES
+]
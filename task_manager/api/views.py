@@ -0,0 +1,262 @@
+"""API application views."""
+
+import json
+from functools import partial
+from http import HTTPStatus
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.db.models.deletion import ProtectedError
+from django.http import HttpResponse, JsonResponse
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.mixins import LOGIN_REQUIRED_MESSAGE, is_authenticated
+from task_manager.pagination import KeysetPaginator
+
+PAGE_SIZE = 50
+
+INVALID_JSON_MESSAGE = _('The request body must be a JSON object.')
+INVALID_CURSOR_MESSAGE = _('Invalid cursor.')
+UNKNOWN_FIELDS_MESSAGE = _('Unknown fields: {fields}.')
+NOT_FOUND_MESSAGE = _('Not found.')
+
+
+def get_error_response(status, errors):
+    """Return the errors, or a single message, as a JSON response."""
+    if not isinstance(errors, dict):
+        errors = {NON_FIELD_ERRORS: [{'message': str(errors), 'code': ''}]}
+
+    return JsonResponse({'errors': errors}, status=status)
+
+
+def get_json_object(request):
+    """Return the JSON object of the request body.
+
+    Raises:
+        ValueError: the body is not a JSON object.
+    """
+    if not request.body:
+        return {}
+
+    payload = json.loads(request.body)
+    if not isinstance(payload, dict):
+        raise ValueError(payload)
+
+    return payload
+
+
+def split_list(query_value):
+    """Return the items of a comma separated query parameter."""
+    return [part for part in (query_value or '').split(',') if part]
+
+
+class ResourceView(View):
+    """Answer the requests on an API resource with JSON.
+
+    The views are async. Reads use the async ORM; forms and included
+    relations, which only run on the sync ORM, are each handled in a
+    single ``sync_to_async`` call.
+    """
+
+    resource = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        public = request.method in self.resource.public_methods
+        if not public and not await is_authenticated(request):
+            return get_error_response(
+                HTTPStatus.UNAUTHORIZED,
+                LOGIN_REQUIRED_MESSAGE,
+            )
+
+        return await super().dispatch(request, *args, **kwargs)
+
+    def get_fields(self):
+        """Return the requested fields and includes.
+
+        Raises:
+            ValueError: a field or an include is unknown.
+        """
+        resource = self.resource
+        fields = split_list(self.request.GET.get('fields'))
+        fields = fields or list(resource.fields)
+        includes = split_list(self.request.GET.get('include'))
+        unknown = [field for field in fields if field not in resource.fields]
+        unknown += [name for name in includes if name not in resource.includes]
+        if unknown:
+            raise ValueError(UNKNOWN_FIELDS_MESSAGE.format(fields=', '.join(unknown)))
+
+        # The id identifies the objects and an included relation
+        # replaces its field, so both are always read.
+        included_fields = [field for field in includes if field in resource.fields]
+
+        return list(dict.fromkeys(['id', *fields, *included_fields])), includes
+
+    def get_rows(self, queryset, fields, ordering=()):
+        """Return the values() rows holding the fields and the ordering."""
+        lookups = [self.resource.fields[field] for field in fields]
+
+        return queryset.values(*dict.fromkeys([*lookups, *ordering]))
+
+    async def get_object(self, pk):
+        """Return the model instance or None."""
+        return await self.resource.model.objects.filter(pk=pk).afirst()
+
+    async def render_object(self, pk, fields, includes, status=HTTPStatus.OK):
+        """Return the object as a JSON response."""
+        queryset = self.resource.model.objects.filter(pk=pk)
+        rows = [row async for row in self.get_rows(queryset, fields)]
+        records = await self.resource.aserialize(rows, fields, includes)
+        if not records:
+            return get_error_response(HTTPStatus.NOT_FOUND, NOT_FOUND_MESSAGE)
+
+        return JsonResponse(records[0], status=status)
+
+    def save_form(self, get_form):
+        """Build the form and save it if valid, return (form, object pk)."""
+        form = get_form()
+        if not form.is_valid():
+            return form, None
+
+        return form, self.resource.save(self.request, form).pk
+
+    async def save(self, get_form, status):
+        """Save a valid form and return the object, or the form errors."""
+        form, pk = await sync_to_async(self.save_form)(get_form)
+        if pk is None:
+            return get_error_response(
+                HTTPStatus.BAD_REQUEST,
+                form.errors.get_json_data(),
+            )
+
+        return await self.render_object(
+            pk,
+            list(self.resource.fields),
+            (),
+            status=status,
+        )
+
+
+class ResourceListView(ResourceView):
+    """List the objects a page at a time, or create one."""
+
+    async def get(self, request):
+        try:
+            fields, includes = self.get_fields()
+        except ValueError as error:
+            return get_error_response(HTTPStatus.BAD_REQUEST, error.args[0])
+
+        return await self.render_page(fields, includes)
+
+    async def post(self, request):
+        try:
+            payload = get_json_object(request)
+        except ValueError:
+            return get_error_response(HTTPStatus.BAD_REQUEST, INVALID_JSON_MESSAGE)
+
+        return await self.save(
+            partial(self.resource.get_form, request, payload),
+            HTTPStatus.CREATED,
+        )
+
+    async def render_page(self, fields, includes):
+        """Return a page of the objects as a JSON response."""
+        try:
+            queryset = await self.resource.aget_queryset(self.request)
+        except ValueError as error:
+            return get_error_response(HTTPStatus.BAD_REQUEST, error.args[0])
+
+        ordering = self.resource.get_ordering(queryset)
+        paginator = KeysetPaginator(
+            self.get_rows(queryset, fields, ordering),
+            PAGE_SIZE,
+            ordering,
+        )
+        try:
+            page = await paginator.apage(self.request.GET.get('cursor'))
+        except ValueError:
+            return get_error_response(HTTPStatus.BAD_REQUEST, INVALID_CURSOR_MESSAGE)
+
+        return JsonResponse({
+            'results': await self.resource.aserialize(page, fields, includes),
+            'next': self.get_page_url(page.next_cursor()),
+            'previous': self.get_page_url(page.previous_cursor()),
+        })
+
+    def get_page_url(self, cursor):
+        """Return the URL of the page the cursor points to."""
+        if cursor is None:
+            return None
+
+        query = self.request.GET.copy()
+        query['cursor'] = cursor
+
+        return '{0}?{1}'.format(self.request.path, query.urlencode())
+
+
+class ResourceDetailView(ResourceView):
+    """Read, change or delete one object."""
+
+    async def get(self, request, pk):
+        try:
+            fields, includes = self.get_fields()
+        except ValueError as error:
+            return get_error_response(HTTPStatus.BAD_REQUEST, error.args[0])
+
+        return await self.render_object(pk, fields, includes)
+
+    async def patch(self, request, pk):
+        instance = await self.get_object(pk)
+        if instance is None:
+            return get_error_response(HTTPStatus.NOT_FOUND, NOT_FOUND_MESSAGE)
+        if not self.resource.can_change(request.user, instance):
+            return get_error_response(
+                HTTPStatus.FORBIDDEN,
+                self.resource.permission_message,
+            )
+
+        try:
+            changes = get_json_object(request)
+        except ValueError:
+            return get_error_response(HTTPStatus.BAD_REQUEST, INVALID_JSON_MESSAGE)
+
+        return await self.save(
+            partial(self.get_update_form, instance, changes),
+            HTTPStatus.OK,
+        )
+
+    async def delete(self, request, pk):
+        instance = await self.get_object(pk)
+        if instance is None:
+            return get_error_response(HTTPStatus.NOT_FOUND, NOT_FOUND_MESSAGE)
+        if not self.resource.can_delete(request.user, instance):
+            return get_error_response(
+                HTTPStatus.FORBIDDEN,
+                self.resource.permission_message,
+            )
+        if await sync_to_async(self.resource.is_in_use)(instance):
+            return get_error_response(
+                HTTPStatus.CONFLICT,
+                self.resource.protected_error_message,
+            )
+
+        try:
+            await instance.adelete()
+        except ProtectedError:
+            return get_error_response(
+                HTTPStatus.CONFLICT,
+                self.resource.protected_error_message,
+            )
+
+        return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+    def get_update_form(self, instance, changes):
+        """Return the form of the object with the changes applied."""
+        # The fields missing from the body keep their current values.
+        form_values = {
+            bound_field.name: bound_field.value()
+            for bound_field in self.resource.get_form(self.request, None, instance)
+        }
+        form_values.update(changes)
+
+        return self.resource.get_form(self.request, form_values, instance)
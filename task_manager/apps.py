@@ -0,0 +1,20 @@
+"""Task manager project configuration."""
+
+from django.apps import AppConfig
+from django.core import checks
+
+from task_manager.checks import check_async_middleware
+
+
+class TaskManagerConfig(AppConfig):
+    """Task manager config."""
+
+    name = 'task_manager'
+
+    def ready(self):
+        """Register the system checks."""
+        checks.register(
+            check_async_middleware,
+            checks.Tags.compatibility,
+            deploy=True,
+        )
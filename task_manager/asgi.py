@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
+# Async views run their sync code in a new thread for every request,
+# so persistent database connections would never be reused.
+os.environ.setdefault('CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
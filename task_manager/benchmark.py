@@ -0,0 +1,202 @@
+"""Page benchmark helpers."""
+
+import math
+import statistics
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+
+from task_manager.api.tasks import TaskResource
+from task_manager.labels.models import Label
+
+MILLISECONDS = 1000
+SLOW_PERCENT = 95
+DIGITS = 2
+
+GIT_DIR = settings.BASE_DIR / '.git'
+REF_PREFIX = 'ref: '
+SHORT_COMMIT = 7
+
+# Pages that change data on GET or accept POST only.
+SKIPPED_URLS = frozenset(('logout', 'tasks:bulk', 'tasks:move'))
+SKIPPED_NAMESPACES = frozenset(('admin',))
+
+FILTERED_LISTS = ('tasks:index', 'api:tasks:list')
+
+
+def get_url_names(patterns=None, namespace=''):
+    """Yield (URL name, route parameters) of every named URL pattern.
+
+    Yields:
+        The URL name and the names of its route parameters.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace not in SKIPPED_NAMESPACES:
+                yield from get_url_names(
+                    pattern.url_patterns,
+                    '{0}{1}:'.format(namespace, pattern.namespace),
+                )
+        elif pattern.name:
+            yield (
+                '{0}{1}'.format(namespace, pattern.name),
+                tuple(pattern.pattern.converters),
+            )
+
+
+def get_percentile(timings, percent):
+    """Return the nearest-rank percentile of the timings."""
+    ordered = sorted(timings)
+    rank = math.ceil(len(ordered) * percent / 100)
+
+    return ordered[max(rank - 1, 0)]
+
+
+def read_ref(ref):
+    """Return the commit of a git reference, loose or packed."""
+    ref_path = GIT_DIR / ref
+    if ref_path.exists():
+        return ref_path.read_text().strip()
+
+    packed_refs = GIT_DIR / 'packed-refs'
+    if not packed_refs.exists():
+        return None
+
+    for line in packed_refs.read_text().splitlines():
+        commit, _, name = line.partition(' ')
+        if name == ref:
+            return commit
+
+    return None
+
+
+def get_commit():
+    """Return the current git commit or None outside a checkout."""
+    try:
+        head = (GIT_DIR / 'HEAD').read_text().strip()
+    except OSError:
+        return None
+
+    if head.startswith(REF_PREFIX):
+        head = read_ref(head[len(REF_PREFIX):])
+
+    return head[:SHORT_COMMIT] if head else None
+
+
+class PageUrls(object):
+    """Pages to benchmark, with sample objects in their URLs."""
+
+    def __init__(self, task, user, exclude):
+        """Pick the sample objects from the task and the user."""
+        self.task = task
+        self.user = user
+        self.skipped = SKIPPED_URLS.union(exclude)
+        self.label = Label.objects.values_list('pk', flat=True).first()
+        self.samples = {
+            'tasks': task.pk,
+            'statuses': task.status_id,
+            'labels': self.label,
+            'users': user.pk,
+        }
+
+    def __iter__(self):
+        """Yield (URL name, URL) pairs of the pages to request.
+
+        Yields:
+            The URL name and the URL of every page.
+        """
+        for name, converters in get_url_names():
+            kwargs = self.get_kwargs(name, converters)
+            if name not in self.skipped and None not in kwargs.values():
+                yield name, reverse(name, kwargs=kwargs)
+
+        yield from self.get_filter_urls()
+
+    def get_kwargs(self, name, converters):
+        """Return the route parameters of the URL name."""
+        namespace = name.rpartition(':')[0]
+        route_kwargs = {
+            'pk': self.samples.get(namespace.rpartition(':')[2]),
+            'status_pk': self.task.status_id,
+            'export_format': 'csv',
+        }
+
+        return {key: route_kwargs[key] for key in converters}
+
+    def get_filter_urls(self):
+        """Yield the filtered tasks lists, as pages and as JSON.
+
+        Yields:
+            The list name with the filter and the filtered URL.
+        """
+        filters = {
+            'status': self.task.status_id,
+            'executor': self.user.pk,
+            'labels': self.label,
+            'self_tasks': 'on',
+        }
+        for name in FILTERED_LISTS:
+            for field, field_value in filters.items():
+                if field_value is not None:
+                    yield '{0}?{1}'.format(name, field), '{0}?{1}={2}'.format(
+                        reverse(name),
+                        field,
+                        field_value,
+                    )
+
+        yield 'api:tasks:list?include', '{0}?include={1}'.format(
+            reverse('api:tasks:list'),
+            ','.join(TaskResource.includes),
+        )
+
+
+class PageTimer(object):
+    """Request pages as a user and time them."""
+
+    def __init__(self, user, repeat, cold):
+        """Log the user in."""
+        self.client = Client()
+        self.client.force_login(user)
+        self.repeat = repeat
+        self.cold = cold
+
+    def measure(self, name, url):
+        """Request the page repeatedly and return its statistics."""
+        timings = []
+        queries = []
+
+        # The first request warms up the caches and the CSRF cookie.
+        self.request(url)
+        for _ in range(self.repeat):
+            if self.cold:
+                cache.clear()
+
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                status_code = self.request(url)
+                timings.append((time.perf_counter() - start) * MILLISECONDS)
+                queries.append(len(context.captured_queries))
+
+        return {
+            'name': name,
+            'url': url,
+            'status': status_code,
+            'p50_ms': round(statistics.median(timings), DIGITS),
+            'p95_ms': round(get_percentile(timings, SLOW_PERCENT), DIGITS),
+            'queries': max(queries),
+        }
+
+    def request(self, url):
+        """Request the page, read the whole body and return the status."""
+        response = self.client.get(url)
+        response.getvalue()
+
+        return response.status_code
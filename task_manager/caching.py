@@ -0,0 +1,124 @@
+"""Task manager project caching utilities."""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+VERSION_KEY = 'version:{0}'
+CHOICES_KEY = 'choices:{0}:{1}'
+
+
+def get_label(model):
+    """Return the import path of the model, which names it in the keys."""
+    return '{0}.{1}'.format(model.__module__, model.__qualname__)
+
+
+def get_version(model):
+    """Return the shared version of the model table."""
+    key = VERSION_KEY.format(get_label(model))
+    version = cache.get(key)
+
+    if version is None:
+        version = time.time()
+        if not cache.add(key, version, timeout=settings.CACHE_VERSION_TIMEOUT):
+            version = cache.get(key, version)
+
+    return version
+
+
+def bump_version(model):
+    """Mark every cached value built from the model table as stale."""
+    cache.set(
+        VERSION_KEY.format(get_label(model)),
+        time.time(),
+        timeout=settings.CACHE_VERSION_TIMEOUT,
+    )
+
+
+def watch_model(model, ignore_fields=()):
+    """Bump the model version after every committed change.
+
+    Saves that only touch ``ignore_fields`` are not counted as changes.
+    For a many-to-many through model the relation changes are counted
+    as well.
+    """
+    receiver = ModelWatcher(model, ignore_fields)
+    uid = 'watch_model:{0}'.format(get_label(model))
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    m2m_changed.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+
+
+class ModelWatcher(object):
+    """Signal receiver bumping the model version once a change commits."""
+
+    def __init__(self, model, ignore_fields):
+        """Remember the model and the fields whose changes do not count."""
+        self.model = model
+        self.ignore_fields = frozenset(ignore_fields)
+
+    def __call__(self, update_fields=None, **kwargs):
+        """Bump the version after the commit, unless no field counts."""
+        if update_fields and self.ignore_fields.issuperset(update_fields):
+            return
+
+        transaction.on_commit(self.bump)
+
+    def bump(self):
+        """Mark the cached values of the model as stale."""
+        bump_version(self.model)
+
+
+class CachedChoices(object):
+    """Ordered (pk, name) choices of a small, rarely changing model.
+
+    The list is kept both in the process and in the shared cache. Each
+    read costs a single cache lookup of the model version; the database
+    is only queried once per version across all workers. A row missing
+    from the list may have been added by a process whose version bump
+    this one does not see yet, so its name is read from the database.
+    """
+
+    def __init__(self, model, field='name'):
+        """Remember the model and the field used as the choice label."""
+        self.model = model
+        self.field = field
+        self._local = (None, [], {})
+
+    def get(self):
+        """Return the list of (pk, name) pairs."""
+        return self._load()[1]
+
+    def get_name(self, pk):
+        """Return the name of the row with the primary key or None."""
+        name = self._load()[2].get(pk)
+        if name is None and pk is not None:
+            name = self.model.objects.filter(pk=pk).values_list(
+                self.field,
+                flat=True,
+            ).first()
+
+        return name
+
+    def _load(self):
+        version = get_version(self.model)
+        if self._local[0] == version:
+            return self._local
+
+        key = CHOICES_KEY.format(get_label(self.model), version)
+        choices = cache.get(key)
+        if choices is None:
+            choices = list(
+                self.model.objects.order_by(self.field, 'pk').values_list(
+                    'pk',
+                    self.field,
+                ),
+            )
+            cache.set(key, choices)
+
+        self._local = (version, choices, dict(choices))
+
+        return self._local
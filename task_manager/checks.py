@@ -0,0 +1,21 @@
+"""Task manager project system checks."""
+
+from django.conf import settings
+from django.core import checks
+from django.utils.module_loading import import_string
+
+SYNC_MIDDLEWARE_MESSAGE = '{0} does not support async requests.'
+SYNC_MIDDLEWARE_HINT = 'Under ASGI, it and the views after it run in sync adapters.'
+
+
+def check_async_middleware(app_configs, **kwargs):
+    """Warn about middleware without async support."""
+    return [
+        checks.Warning(
+            SYNC_MIDDLEWARE_MESSAGE.format(middleware_path),
+            hint=SYNC_MIDDLEWARE_HINT,
+            id='task_manager.W001',
+        )
+        for middleware_path in settings.MIDDLEWARE
+        if not getattr(import_string(middleware_path), 'async_capable', False)
+    ]
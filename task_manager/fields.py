@@ -0,0 +1,105 @@
+"""Task manager project form fields."""
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator
+
+
+class CachedChoiceIterator(ModelChoiceIterator):
+    """Iterate over cached choices instead of the field queryset."""
+
+    def __iter__(self):
+        """Yield the empty choice and the cached (pk, name) pairs.
+
+        Yields:
+            The choices of the field.
+        """
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        yield from self.field.cached_choices.get()
+
+    def __len__(self):
+        """Return the number of choices."""
+        empty = 0 if self.field.empty_label is None else 1
+
+        return len(self.field.cached_choices.get()) + empty
+
+    def __bool__(self):
+        """Return True if there is at least one choice."""
+        return self.field.empty_label is not None or bool(
+            self.field.cached_choices.get(),
+        )
+
+    def selected(self, choice_values):
+        """Return the choices with the given values."""
+        names = [
+            (pk, self.field.cached_choices.get_name(pk))
+            for pk in map(int, choice_values)
+        ]
+
+        return [(pk, name) for pk, name in names if name is not None]
+
+
+class CachedChoicesMixin(object):
+    """Validate model choices against a CachedChoices list."""
+
+    iterator = CachedChoiceIterator
+
+    def __init__(self, *args, cached_choices, **kwargs):
+        """Remember the cached choices."""
+        self.cached_choices = cached_choices
+        super().__init__(*args, **kwargs)
+
+    def get_instance(self, choice_value):
+        """Build a model instance for the choice without a query.
+
+        Raises:
+            ValidationError: the choice is not in the cached choices.
+        """
+        if isinstance(choice_value, self.queryset.model):
+            choice_value = choice_value.pk
+
+        try:
+            pk = int(choice_value)
+        except (TypeError, ValueError):
+            pk = None
+
+        name = self.cached_choices.get_name(pk)
+        if name is None:
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': choice_value},
+            )
+
+        # The other fields are deferred, as if the row had been read with
+        # only() from the database of the queryset.
+        pk_attname = self.queryset.query.get_meta().pk.attname
+        field_names = [pk_attname, self.cached_choices.field]
+
+        return self.queryset.model.from_db(
+            self.queryset.db,
+            field_names,
+            [pk, name],
+        )
+
+
+class CachedModelChoiceField(CachedChoicesMixin, forms.ModelChoiceField):
+    """Model choice field backed by cached choices."""
+
+    def to_python(self, choice_value):
+        """Return the chosen model instance."""
+        if choice_value in self.empty_values:
+            return None
+
+        return self.get_instance(choice_value)
+
+
+class CachedModelMultipleChoiceField(
+    CachedChoicesMixin,
+    forms.ModelMultipleChoiceField,
+):
+    """Model multiple choice field backed by cached choices."""
+
+    def _check_values(self, choice_values):
+        return [self.get_instance(choice_value) for choice_value in choice_values]
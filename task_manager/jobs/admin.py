@@ -0,0 +1,23 @@
+"""Jobs application admin interface."""
+
+from django.contrib import admin
+
+from task_manager.jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin interface configuretion."""
+
+    list_display = (
+        'name',
+        'status',
+        'attempts',
+        'run_at',
+        'created_by',
+        'created_at',
+        'finished_at',
+    )
+    list_filter = ('status', 'name')
+    list_select_related = ('created_by',)
+    ordering = ('-created_at',)
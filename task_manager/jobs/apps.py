@@ -0,0 +1,21 @@
+"""Jobs application configuration."""
+
+from django.apps import AppConfig
+from django.db.models.signals import post_delete
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    """Jobs config."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.jobs'
+
+    def ready(self):
+        """Register the jobs of the apps and clean up deleted outputs."""
+        autodiscover_modules('jobs')
+        post_delete.connect(
+            self.models_module.delete_output,
+            sender=self.get_model('Job'),
+            dispatch_uid='jobs.delete_output',
+        )
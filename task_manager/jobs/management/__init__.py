@@ -0,0 +1 @@
+"""Jobs application management."""
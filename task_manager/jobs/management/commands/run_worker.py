@@ -0,0 +1,64 @@
+"""Run the queued background jobs."""
+
+import signal
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.jobs.worker import Worker
+
+DEFAULT_CONCURRENCY = 2
+DEFAULT_POLL_INTERVAL = 1
+STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+INVALID_CONCURRENCY_MESSAGE = 'The concurrency must be at least 1.'
+
+
+class Command(BaseCommand):
+    """Run background jobs until stopped."""
+
+    help = 'Run the due background jobs, several at a time, until stopped.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help='Number of jobs run at the same time.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=DEFAULT_POLL_INTERVAL,
+            help='Seconds to wait before looking for jobs again when idle.',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once no job is due instead of waiting for more.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the worker.
+
+        SIGTERM and SIGINT let the running jobs finish before exiting.
+
+        Raises:
+            CommandError: the concurrency is less than 1.
+        """
+        if options['concurrency'] < 1:
+            raise CommandError(INVALID_CONCURRENCY_MESSAGE)
+
+        worker = Worker(options['concurrency'], options['poll_interval'])
+        self.stdout.write(
+            'Running jobs, {0} at a time.'.format(options['concurrency']),
+        )
+        with ExitStack() as stack:
+            for signal_number in STOP_SIGNALS:
+                previous_handler = signal.signal(signal_number, worker.stop)
+                stack.callback(signal.signal, signal_number, previous_handler)
+
+            worker.run(burst=options['burst'])
+
+        self.stdout.write('Worker stopped.')
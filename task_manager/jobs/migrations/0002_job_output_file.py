@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Keep job outputs in the file storage instead of the jobs table.
+
+    Outputs saved in the table are dropped with the column: finished
+    jobs are deleted after a week anyway.
+    """
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='job',
+            name='output',
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='output',
+            field=models.FileField(blank=True, editable=False, upload_to='jobs/'),
+        ),
+    ]
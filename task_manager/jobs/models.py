@@ -0,0 +1,74 @@
+"""Jobs application models."""
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.users.models import User
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+STATUSES = (
+    (QUEUED, _('Queued')),
+    (RUNNING, _('Running')),
+    (DONE, _('Done')),
+    (FAILED, _('Failed')),
+)
+
+
+def delete_output(instance, **kwargs):
+    """Delete the output file of a deleted job once the deletion commits."""
+    if instance.output:
+        transaction.on_commit(lambda: instance.output.delete(save=False))
+
+
+class Job(models.Model):
+    """Deferred work, run outside the requests by ``manage.py run_worker``.
+
+    A worker claims a due job by switching it to running with a single
+    conditional UPDATE, so several workers never run the same job.
+    ``locked_until`` bounds a run: a job still running after it is
+    claimed again, as if its worker had died.
+    """
+
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=10,
+        choices=STATUSES,
+        default=QUEUED,
+        verbose_name=_('Status'),
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_('Attempts'))
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, verbose_name=_('Error'))
+    # Files made by a job, like exports, are kept in the default storage,
+    # which the web and worker processes must share.
+    output = models.FileField(upload_to='jobs/', blank=True, editable=False)
+    output_name = models.CharField(max_length=100, blank=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        db_index=False,
+        null=True,
+        blank=True,
+        related_name='jobs',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(object):
+        indexes = (
+            models.Index(fields=('status', 'run_at'), name='jobs_status_run_at_idx'),
+            models.Index(
+                fields=('created_by', 'created_at', 'id'),
+                name='jobs_author_created_idx',
+            ),
+        )
+
+    def __str__(self):
+        """Represent the model as a string."""
+        return '{0} {1}'.format(self.name, self.status)
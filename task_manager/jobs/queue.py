@@ -0,0 +1,106 @@
+"""Jobs application queue."""
+
+from collections import namedtuple
+from datetime import timedelta
+
+from django.utils import timezone
+
+from task_manager.jobs.models import DONE, FAILED, Job
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_TIMEOUT = 600
+# A failed job is retried after 10 s, 20 s, 40 s... up to an hour.
+BACKOFF_BASE = 10
+BACKOFF_MAX = 3600
+# Finished jobs and their outputs are deleted after this long.
+KEEP_FINISHED = timedelta(days=7)
+
+UNKNOWN_JOB_MESSAGE = 'Unknown job {0!r}.'
+
+JobType = namedtuple(
+    'JobType',
+    ('function', 'verbose_name', 'max_attempts', 'timeout'),
+)
+
+# Registered by the ``jobs`` modules of the apps.
+job_types = {}
+
+
+def register(
+    name,
+    verbose_name='',
+    max_attempts=DEFAULT_MAX_ATTEMPTS,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """Register the decorated function as the job of that name.
+
+    The function is called with the keyword arguments of ``enqueue()``.
+    It may return a ``File`` with a name, which is copied to the storage
+    as the output of the job and closed.
+    """
+    def decorator(function):
+        job_types[name] = JobType(
+            function,
+            verbose_name or name,
+            max_attempts,
+            timeout,
+        )
+
+        return function
+
+    return decorator
+
+
+def get_verbose_name(name):
+    """Return the human readable name of a job."""
+    job_type = job_types.get(name)
+
+    return job_type.verbose_name if job_type else name
+
+
+def get_timeout(name):
+    """Return the time a run of the job may take, in seconds."""
+    job_type = job_types.get(name)
+
+    return job_type.timeout if job_type else DEFAULT_TIMEOUT
+
+
+def get_backoff(attempts):
+    """Return the delay before the next attempt of a failed job."""
+    return timedelta(seconds=min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1)))
+
+
+def enqueue(name, user=None, **kwargs):
+    """Queue a job with JSON serializable keyword arguments.
+
+    The job is saved in the current transaction, so it only runs if the
+    work that queued it is committed.
+
+    Raises:
+        LookupError: no job is registered with that name.
+    """
+    if name not in job_types:
+        raise LookupError(UNKNOWN_JOB_MESSAGE.format(name))
+
+    return Job.objects.create(name=name, kwargs=kwargs, created_by=user)
+
+
+def call_job(name, kwargs):
+    """Call the function of the job and return its output.
+
+    Raises:
+        LookupError: no job is registered with that name.
+    """
+    job_type = job_types.get(name)
+    if job_type is None:
+        raise LookupError(UNKNOWN_JOB_MESSAGE.format(name))
+
+    return job_type.function(**kwargs)
+
+
+def delete_finished_jobs():
+    """Delete the jobs finished long ago, with their outputs."""
+    return Job.objects.filter(
+        status__in=(DONE, FAILED),
+        finished_at__lt=timezone.now() - KEEP_FINISHED,
+    ).delete()[0]
@@ -0,0 +1,12 @@
+"""Jobs application URL Configuration."""
+
+from django.urls import path
+
+from task_manager.jobs.views import IndexView, JobOutputView
+
+app_name = 'jobs'
+
+urlpatterns = [
+    path('', IndexView.as_view(), name='index'),
+    path('<int:pk>/output/', JobOutputView.as_view(), name='output'),
+]
@@ -0,0 +1,53 @@
+"""Jobs application views."""
+
+from django.http import FileResponse, Http404
+from django.views.generic import ListView, View
+
+from task_manager.jobs.models import DONE, QUEUED, RUNNING, Job
+from task_manager.jobs.queue import get_verbose_name
+from task_manager.mixins import UserLoginRequiredMixin
+
+JOBS_SHOWN = 50
+# The page reloads itself while jobs are waiting or running.
+REFRESH_SECONDS = 5
+
+
+class IndexView(UserLoginRequiredMixin, ListView):
+    """The latest jobs of the current user and their status."""
+
+    template_name = 'jobs/job_list.html'
+
+    def get_queryset(self):
+        return Job.objects.filter(
+            created_by=self.request.user,
+        ).defer('kwargs').order_by('-created_at', '-id')[:JOBS_SHOWN]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        for job in context['job_list']:
+            job.verbose_name = get_verbose_name(job.name)
+
+        statuses = {listed.status for listed in context['job_list']}
+        if statuses & {QUEUED, RUNNING}:
+            context['refresh_seconds'] = REFRESH_SECONDS
+
+        return context
+
+
+class JobOutputView(UserLoginRequiredMixin, View):
+    """Download the file made by a finished job of the current user."""
+
+    def get(self, request, pk):
+        job = Job.objects.filter(
+            pk=pk,
+            created_by=request.user,
+            status=DONE,
+        ).exclude(output='').only('output', 'output_name').first()
+        if job is None:
+            raise Http404
+
+        return FileResponse(
+            job.output.open('rb'),
+            as_attachment=True,
+            filename=job.output_name,
+        )
@@ -0,0 +1,172 @@
+"""Jobs application worker."""
+
+import logging
+import threading
+import traceback
+from contextlib import ExitStack, closing
+from datetime import timedelta
+
+from django.db import close_old_connections, connection, models
+from django.utils import timezone
+
+from task_manager.jobs.models import DONE, FAILED, QUEUED, RUNNING, Job
+from task_manager.jobs.queue import (
+    call_job,
+    delete_finished_jobs,
+    get_backoff,
+    get_timeout,
+    job_types,
+)
+
+logger = logging.getLogger(__name__)
+
+# Due jobs a worker tries to claim before polling again. Another
+# worker may have taken the first ones.
+CLAIM_CANDIDATES = 10
+ERROR_MAX_LENGTH = 5000
+
+FAILED_MESSAGE = 'Job {0} ({1}) failed.'
+TIMED_OUT_MESSAGE = 'The last attempt did not finish in time.'
+
+
+def get_due_jobs(now):
+    """Return the jobs to run: queued, or locked too long."""
+    queued = models.Q(status=QUEUED, run_at__lte=now)
+
+    return Job.objects.filter(
+        queued | models.Q(status=RUNNING, locked_until__lt=now),
+    )
+
+
+def claim_job():
+    """Mark the next due job as running and return it, or None."""
+    now = timezone.now()
+    candidates = get_due_jobs(now).order_by('run_at', 'id').values_list(
+        'pk',
+        'name',
+    )
+
+    for pk, name in candidates[:CLAIM_CANDIDATES]:
+        claimed = get_due_jobs(now).filter(pk=pk).update(
+            status=RUNNING,
+            attempts=models.F('attempts') + 1,
+            locked_until=now + timedelta(seconds=get_timeout(name)),
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+
+    return None
+
+
+def finish_job(job, **fields):
+    """Save the outcome of the run, unless the job was claimed again since."""
+    return Job.objects.filter(
+        pk=job.pk,
+        status=RUNNING,
+        attempts=job.attempts,
+    ).update(locked_until=None, **fields)
+
+
+def fail_job(job, job_type, error):
+    """Retry the job later, or mark it failed after its last attempt."""
+    error = error[-ERROR_MAX_LENGTH:]
+    max_attempts = job_type.max_attempts if job_type else 0
+    if job.attempts < max_attempts:
+        finish_job(
+            job,
+            status=QUEUED,
+            run_at=timezone.now() + get_backoff(job.attempts),
+            error=error,
+        )
+    else:
+        finish_job(job, status=FAILED, finished_at=timezone.now(), error=error)
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome."""
+    job_type = job_types.get(job.name)
+    # Only a job claimed again after a timeout goes over the limit.
+    if job_type is not None and job.attempts > job_type.max_attempts:
+        fail_job(job, job_type, TIMED_OUT_MESSAGE)
+        return
+
+    try:
+        output = call_job(job.name, job.kwargs)
+    except Exception:
+        logger.exception(FAILED_MESSAGE.format(job.pk, job.name))
+        fail_job(job, job_type, traceback.format_exc())
+        return
+
+    complete_job(job, output)
+
+
+def complete_job(job, output):
+    """Mark the job done, with the file it returned copied to the storage."""
+    if output is not None:
+        with output:
+            job.output.save(output.name, output, save=False)
+        job.output_name = output.name
+
+    finished = finish_job(
+        job,
+        status=DONE,
+        finished_at=timezone.now(),
+        error='',
+        output=job.output.name or '',
+        output_name=job.output_name,
+    )
+    # The output of a run that was claimed again since is not kept.
+    if not finished and job.output:
+        job.output.delete(save=False)
+
+
+class Worker(object):
+    """Run due jobs in a fixed number of threads until stopped.
+
+    The number of threads is the concurrency limit of the worker. A
+    stopped worker lets the running jobs finish.
+    """
+
+    def __init__(self, concurrency=1, poll_interval=1):
+        """Remember the limits."""
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stopping = threading.Event()
+
+    def run(self, burst=False):
+        """Run jobs, until the queue is empty if burst is True."""
+        delete_finished_jobs()
+        with ExitStack() as stack:
+            for _ in range(self.concurrency - 1):
+                thread = threading.Thread(
+                    target=self.work_in_thread,
+                    args=(burst,),
+                )
+                thread.start()
+                stack.callback(thread.join)
+
+            # The other threads finish their jobs and exit too, also when
+            # the current one fails.
+            stack.callback(self.stop)
+            self.work(burst)
+
+    def work(self, burst):
+        """Claim and run jobs in the current thread."""
+        while not self.stopping.is_set():
+            close_old_connections()
+            job = claim_job()
+            if job is not None:
+                run_job(job)
+            elif burst:
+                return
+            else:
+                self.stopping.wait(self.poll_interval)
+
+    def work_in_thread(self, burst):
+        """Run jobs in an extra thread, which closes its connection."""
+        with closing(connection):
+            self.work(burst)
+
+    def stop(self, *args):
+        """Stop claiming jobs, also as a signal handler."""
+        self.stopping.set()
@@ -2,9 +2,15 @@
 
 from django.apps import AppConfig
 
+from task_manager.caching import watch_model
+
 
 class LabelsConfig(AppConfig):
     """Labels config."""
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.labels'
+
+    def ready(self):
+        """Invalidate the cached label choices on every change."""
+        watch_model(self.get_model('Label'))
@@ -0,0 +1,6 @@
+"""Labels application cached choices."""
+
+from task_manager.caching import CachedChoices
+from task_manager.labels.models import Label
+
+label_choices = CachedChoices(Label)
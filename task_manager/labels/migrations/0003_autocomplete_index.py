@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# The autocomplete matches names with istartswith: a LIKE on SQLite, which
+# needs a NOCASE index, and UPPER(name::text) LIKE on PostgreSQL, which
+# needs an expression index with pattern operators.
+INDEXES = {
+    'sqlite': (
+        'CREATE INDEX IF NOT EXISTS labels_name_prefix_idx '
+        'ON labels_label (name COLLATE NOCASE)'
+    ),
+    'postgresql': (
+        'CREATE INDEX IF NOT EXISTS labels_name_prefix_idx '
+        'ON labels_label ((UPPER(name::text)) text_pattern_ops)'
+    ),
+}
+
+
+def create_index(apps, schema_editor):
+    """Create the prefix search index of the database backend."""
+    statement = INDEXES.get(schema_editor.connection.vendor)
+    if statement is not None:
+        schema_editor.execute(statement)
+
+
+def drop_index(apps, schema_editor):
+    """Drop the prefix search index."""
+    if schema_editor.connection.vendor in INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS labels_name_prefix_idx')
+
+
+class Migration(migrations.Migration):
+    """Index the names for the case-insensitive autocomplete."""
+
+    dependencies = [
+        ('labels', '0002_alter_label_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -15,3 +15,7 @@ class Label(models.Model):
     def __str__(self):
         """Represent the model as a string."""
         return self.name
+
+    def is_in_use(self):
+        """Return True if a task is marked with the label."""
+        return self.relationships_set.exists()
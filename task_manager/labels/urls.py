@@ -4,6 +4,7 @@ from django.urls import path
 
 from task_manager.labels.views import (
     IndexView,
+    LabelAutocompleteView,
     LabelCreationView,
     LabelDeleteView,
     LabelUpdateView,
@@ -13,6 +14,7 @@ app_name = 'labels'
 
 urlpatterns = [
     path('', IndexView.as_view(), name='index'),
+    path('autocomplete/', LabelAutocompleteView.as_view(), name='autocomplete'),
     path('create/', LabelCreationView.as_view(), name='create'),
     path('<int:pk>/update/', LabelUpdateView.as_view(), name='update'),
     path('<int:pk>/delete/', LabelDeleteView.as_view(), name='delete'),
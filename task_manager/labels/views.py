@@ -7,7 +7,12 @@ from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
-from task_manager.mixins import ProtectedErrorMixin, UserLoginRequiredMixin
+from task_manager.mixins import (
+    CachedListMixin,
+    ProtectedErrorMixin,
+    UserLoginRequiredMixin,
+)
+from task_manager.views import AutocompleteView
 
 CREATION_SUCCESS_MESSAGE = _('Label successfully created.')
 UPDATE_SUCCESS_MESSAGE = _('Label successfully changed.')
@@ -16,10 +21,11 @@ DELETE_SUCCESS_MESSAGE = _('Label successfully deleted.')
 PROTECTED_ERROR_MESSAGE = _('Unable to delete the label because it is in use.')
 
 
-class IndexView(UserLoginRequiredMixin, ListView):
+class IndexView(UserLoginRequiredMixin, CachedListMixin, ListView):
     """Labels page view."""
 
     model = Label
+    watermark_models = (Label,)
 
 
 class LabelCreationView(
@@ -76,3 +82,11 @@ class LabelDeleteView(
         'header': _('Label deletion'),
         'button': _('Yes, delete'),
     }
+
+
+class LabelAutocompleteView(AutocompleteView):
+    """Label choices for autocomplete widgets."""
+
+    model = Label
+    search_fields = ('name',)
+    keyset_ordering = ('name', 'id')
@@ -0,0 +1 @@
+"""Task manager project management."""
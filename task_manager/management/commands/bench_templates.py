@@ -0,0 +1,92 @@
+"""Measure the render time of the task list template."""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TasktFilter
+from task_manager.tasks.forms import TaskBulkForm
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+TEMPLATE_NAME = 'tasks/task_list.html'
+DEFAULT_ROWS = (1, 100, 1000)
+DEFAULT_REPEAT = 20
+
+
+def build_tasks(count):
+    """Build unsaved tasks with their related objects."""
+    status = Status(pk=1, name='In Progress')
+    author = User(pk=1, first_name='Luffy', last_name='Monkey D.')
+    executor = User(pk=2, first_name='Zorro', last_name='Roronoa')
+    created_at = timezone.now()
+
+    return [
+        Task(
+            pk=number,
+            name='Task {0}'.format(number),
+            status=status,
+            executor=executor,
+            created_by=author,
+            created_at=created_at,
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+class Command(BaseCommand):
+    """Benchmark the task list template."""
+
+    help = 'Measure the render time of {0}.'.format(TEMPLATE_NAME)
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=DEFAULT_ROWS,
+            help='Numbers of table rows to render.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of renders per row count.',
+        )
+
+    def handle(self, *args, **options):
+        """Render the template and print the timings."""
+        request = RequestFactory().get(reverse('tasks:index'))
+        request.resolver_match = resolve(request.path)
+        request.user = User(pk=1, first_name='Luffy', last_name='Monkey D.')
+
+        for rows in options['rows']:
+            context = {
+                'filter': TasktFilter(
+                    queryset=Task.objects.none(),
+                    request=request,
+                ),
+                'task_list': build_tasks(rows),
+                'bulk_form': TaskBulkForm(user=request.user),
+            }
+            timings = []
+
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                render_to_string(TEMPLATE_NAME, context, request)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(
+                '{0:>6} rows: median {1:8.2f} ms, min {2:8.2f} ms'.format(
+                    rows,
+                    statistics.median(timings),
+                    min(timings),
+                ),
+            )
@@ -0,0 +1,158 @@
+"""Measure the latency and query count of every page."""
+
+import json
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from task_manager.benchmark import PageTimer, PageUrls, get_commit
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+DEFAULT_REPEAT = 20
+DEFAULT_EXCLUDE = ('tasks:export',)
+
+# Options of seed_bench for the models that need no more rows.
+SEEDED_MODELS = (('users', User), ('statuses', Status), ('labels', Label))
+
+TASKS = 'tasks'
+P50 = 'p50_ms'
+ROW = '  {name:<28} {status:4} {p50_ms:9.2f} ms {p95_ms:9.2f} ms {queries:4} queries'
+
+NO_DATA_MESSAGE = 'There are no tasks to benchmark, run seed_bench first.'
+
+
+class Command(BaseCommand):
+    """Benchmark the project pages."""
+
+    help = 'Request every page and report the p50/p95 latency and query count.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--scales',
+            type=int,
+            nargs='+',
+            help='Task counts to benchmark at, seeding the missing tasks.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of requests per page.',
+        )
+        parser.add_argument(
+            '--exclude',
+            nargs='*',
+            default=DEFAULT_EXCLUDE,
+            help='URL names to skip.',
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Clear the cache before every request.',
+        )
+        parser.add_argument('--user', help='Username to log in with.')
+        parser.add_argument('--output', help='Write the results to a JSON file.')
+        parser.add_argument(
+            '--baseline',
+            help='JSON file of an earlier run to compare the p50 with.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the benchmark at every scale and report the results."""
+        baseline = {}
+        if options['baseline']:
+            baseline = self.read_baseline(options['baseline'])
+
+        runs = []
+        for scale in options['scales'] or (None,):
+            if scale is not None:
+                self.seed(scale)
+            runs.append(self.run(scale, options))
+            self.report(runs[-1], baseline)
+
+        if options['output']:
+            self.write_output(options['output'], runs, options)
+
+    def seed(self, scale):
+        """Create the tasks missing to reach the scale."""
+        missing = scale - Task.objects.count()
+        if missing <= 0:
+            return
+
+        # Tasks are added to the existing users, statuses and labels.
+        existing = {}
+        for option, model in SEEDED_MODELS:
+            if model.objects.exists():
+                existing[option] = 0
+
+        call_command('seed_bench', tasks=missing, stdout=self.stdout, **existing)
+
+    def run(self, scale, options):
+        """Benchmark every page and return the run results.
+
+        Raises:
+            CommandError: there are no tasks.
+        """
+        task = Task.objects.order_by('-pk').first()
+        if task is None:
+            raise CommandError(NO_DATA_MESSAGE)
+
+        user = task.created_by
+        if options['user']:
+            user = User.objects.get(username=options['user'])
+
+        timer = PageTimer(user, options['repeat'], options['cold'])
+
+        return {
+            'scale': scale,
+            TASKS: Task.objects.count(),
+            'results': [
+                timer.measure(name, url)
+                for name, url in PageUrls(task, user, options['exclude'])
+            ],
+        }
+
+    def report(self, run, baseline):
+        """Print the results of one run."""
+        self.stdout.write('{0} tasks'.format(run[TASKS]))
+
+        for page in run['results']:
+            line = ROW.format(**page)
+            previous = baseline.get((run[TASKS], page['url']))
+            if previous:
+                change = page[P50] / previous[P50] - 1
+                line = '{0} {1:+7.1%}'.format(line, change)
+            self.stdout.write(line)
+
+    def read_baseline(self, path):
+        """Map (task count, URL) of the baseline runs to their results."""
+        with open(path) as baseline_file:
+            runs = json.load(baseline_file)['runs']
+
+        return {
+            (run[TASKS], page['url']): page
+            for run in runs
+            for page in run['results']
+        }
+
+    def write_output(self, path, runs, options):
+        """Write the runs and the benchmark settings to a JSON file."""
+        with open(path, 'w') as output_file:
+            json.dump(
+                {
+                    'commit': get_commit(),
+                    'created_at': timezone.now().isoformat(),
+                    'database': connection.vendor,
+                    'repeat': options['repeat'],
+                    'cold': options['cold'],
+                    'runs': runs,
+                },
+                output_file,
+                indent=2,
+            )
@@ -0,0 +1,187 @@
+"""Load a running server with concurrent fast and slow clients."""
+
+import asyncio
+import statistics
+import time
+from contextlib import closing, suppress
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.benchmark import MILLISECONDS, SLOW_PERCENT, get_percentile
+
+DEFAULT_CLIENTS = 20
+DEFAULT_SLOW_CLIENTS = 50
+DEFAULT_DURATION = 10
+DEFAULT_SLOW_INTERVAL = 1
+DEFAULT_TIMEOUT = 10
+
+HTTP_PORT = 80
+SLOWEST_PERCENT = 99
+
+HEADER_LINE = '{0}\r\n'
+END_OF_HEADERS = b'\r\n'
+SLOW_HEADER = b'X-Slow-Client: 1\r\n'
+
+INVALID_URL_MESSAGE = 'Use an http:// URL of a running server.'
+
+# Failures of a single request, counted instead of stopping the test.
+REQUEST_ERRORS = (OSError, asyncio.TimeoutError, ValueError, IndexError)
+
+
+class LoadTest(object):
+    """Requests to one URL over plain HTTP/1.1 connections."""
+
+    def __init__(self, url, headers, timeout):
+        """Remember the server address and the request to send.
+
+        Raises:
+            CommandError: the URL is not an http:// one.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != 'http' or not parts.hostname:
+            raise CommandError(INVALID_URL_MESSAGE)
+
+        self.host = parts.hostname
+        self.port = parts.port or HTTP_PORT
+        self.timeout = timeout
+        path = '{0}?{1}'.format(parts.path or '/', parts.query).rstrip('?')
+        lines = [
+            'GET {0} HTTP/1.1'.format(path),
+            'Host: {0}'.format(parts.netloc),
+            'Connection: close',
+            *headers,
+        ]
+        head = ''.join(HEADER_LINE.format(line) for line in lines)
+        self.head = head.encode()
+
+    async def fetch(self):
+        """Send the request, read the response, return (status, ms)."""
+        start = time.perf_counter()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        with closing(writer):
+            writer.writelines((self.head, END_OF_HEADERS))
+            await writer.drain()
+            response = await reader.read()
+
+        status = int(response.split(b' ', 2)[1])
+
+        return status, (time.perf_counter() - start) * MILLISECONDS
+
+    async def fast_client(self, deadline, timings, errors):
+        """Request the URL in a loop until the deadline."""
+        while time.monotonic() < deadline:
+            try:
+                status, duration = await asyncio.wait_for(self.fetch(), self.timeout)
+            except REQUEST_ERRORS:
+                errors.append(None)
+                continue
+
+            if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                errors.append(status)
+            else:
+                timings.append(duration)
+
+    async def slow_client(self, deadline, interval):
+        """Hold a connection open by sending a header line per interval."""
+        try:
+            writer = (await asyncio.open_connection(self.host, self.port))[1]
+        except OSError:
+            return
+
+        with closing(writer):
+            with suppress(OSError):
+                await self.send_slowly(writer, deadline, interval)
+
+    async def send_slowly(self, writer, deadline, interval):
+        """Send the request head, then a header line per interval."""
+        writer.write(self.head)
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            writer.write(SLOW_HEADER)
+            await writer.drain()
+
+    async def run(self, clients, slow_clients, duration, interval):
+        """Run all the clients and return (timings, errors)."""
+        deadline = time.monotonic() + duration
+        timings = []
+        errors = []
+        await asyncio.gather(
+            *(self.slow_client(deadline, interval) for _ in range(slow_clients)),
+            *(self.fast_client(deadline, timings, errors) for _ in range(clients)),
+        )
+
+        return timings, errors
+
+
+class Command(BaseCommand):
+    """Load test a running server."""
+
+    help = 'Load a running server with fast and slow clients and report the latency.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('url', help='URL to request, e.g. http://127.0.0.1:8000/')
+        parser.add_argument(
+            '--clients',
+            type=int,
+            default=DEFAULT_CLIENTS,
+            help='Number of clients requesting the URL in a loop.',
+        )
+        parser.add_argument(
+            '--slow-clients',
+            type=int,
+            default=DEFAULT_SLOW_CLIENTS,
+            help='Number of clients sending their request one header at a time.',
+        )
+        parser.add_argument(
+            '--slow-interval',
+            type=float,
+            default=DEFAULT_SLOW_INTERVAL,
+            help='Seconds between the header lines of a slow client.',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=DEFAULT_DURATION,
+            help='Seconds to run for.',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=DEFAULT_TIMEOUT,
+            help='Seconds before a request counts as failed.',
+        )
+        parser.add_argument(
+            '--header',
+            action='append',
+            default=[],
+            help='Extra request header, e.g. "Cookie: sessionid=...".',
+        )
+
+    def handle(self, *args, **options):
+        """Run the load test and report the results."""
+        load_test = LoadTest(options['url'], options['header'], options['timeout'])
+        timings, errors = asyncio.run(load_test.run(
+            options['clients'],
+            options['slow_clients'],
+            options['duration'],
+            options['slow_interval'],
+        ))
+
+        self.stdout.write(
+            '{0} requests, {1} errors, {2:.1f} req/s'.format(
+                len(timings),
+                len(errors),
+                len(timings) / options['duration'],
+            ),
+        )
+        if timings:
+            self.stdout.write(
+                'p50 {0:.2f} ms, p95 {1:.2f} ms, p99 {2:.2f} ms'.format(
+                    statistics.median(timings),
+                    get_percentile(timings, SLOW_PERCENT),
+                    get_percentile(timings, SLOWEST_PERCENT),
+                ),
+            )
@@ -0,0 +1,227 @@
+"""Fill the database with synthetic benchmark data."""
+
+import secrets
+import time
+import uuid
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from task_manager.caching import bump_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Relationships, Task
+from task_manager.users.models import User
+
+DEFAULT_USERS = 100
+DEFAULT_STATUSES = 10
+DEFAULT_LABELS = 50
+DEFAULT_TASKS = 1000
+DEFAULT_MAX_LABELS = 5
+DEFAULT_BATCH_SIZE = 5000
+
+UNASSIGNED_SHARE = 0.2
+
+TOKEN_LENGTH = 8
+
+FIRST_NAMES = (
+    'Brook',
+    'Franky',
+    'Jinbe',
+    'Luffy',
+    'Nami',
+    'Nico',
+    'Sanji',
+    'Tony',
+    'Usopp',
+    'Zorro',
+)
+LAST_NAMES = (
+    'Chopper',
+    'Cutty',
+    'Kuroashi',
+    'Monkey D.',
+    'Nico',
+    'Roronoa',
+    'Soul',
+    'Sogeking',
+    'Tenyu',
+    'Umi',
+)
+DESCRIPTIONS = (
+    '',
+    'Reproduce the issue and attach the logs.',
+    'Agree on the scope with the team before starting.',
+    'Update the documentation and the changelog when done.',
+)
+
+NO_DATA_MESSAGE = 'There are no users, statuses or labels to build tasks from.'
+DONE_MESSAGE = 'Created {0} users, {1} statuses, {2} labels, {3} tasks in {4:.1f} s.'
+
+generator = secrets.SystemRandom()
+
+
+def get_weights(count):
+    """Return cumulative Zipf weights, so a few rows are used the most."""
+    ranks = range(1, count + 1)
+
+    return list(accumulate(1 / rank for rank in ranks))
+
+
+def get_ids(model):
+    """Return the primary keys of all rows of the model."""
+    return list(model.objects.values_list('pk', flat=True))
+
+
+class IdPicker(object):
+    """Draw the related rows of new tasks with Zipf weights."""
+
+    def __init__(self):
+        """Load the ids of the users, statuses and labels."""
+        self.user_ids = get_ids(User)
+        self.status_ids = get_ids(Status)
+        self.label_ids = get_ids(Label)
+        self.weights = {}
+
+    def pick(self, ids, count=1):
+        """Return a list of ids drawn with Zipf weights."""
+        weights = self.weights.get(len(ids))
+        if weights is None:
+            weights = get_weights(len(ids))
+            self.weights[len(ids)] = weights
+
+        return generator.choices(ids, cum_weights=weights, k=count)
+
+    def pick_executor(self):
+        """Return an executor id, or None for an unassigned task."""
+        if generator.random() < UNASSIGNED_SHARE:
+            return None
+
+        return self.pick(self.user_ids)[0]
+
+    def pick_labels(self, max_labels):
+        """Return a set of label ids, smaller sets being more common."""
+        fan_out = min(max_labels, len(self.label_ids))
+        if not fan_out:
+            return set()
+
+        count = self.pick(range(fan_out + 1))[0]
+
+        return set(self.pick(self.label_ids, count))
+
+
+class Command(BaseCommand):
+    """Generate users, statuses, labels and tasks with bulk inserts."""
+
+    help = 'Create users, statuses, labels and tasks with skewed relations.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--users', type=int, default=DEFAULT_USERS)
+        parser.add_argument('--statuses', type=int, default=DEFAULT_STATUSES)
+        parser.add_argument('--labels', type=int, default=DEFAULT_LABELS)
+        parser.add_argument('--tasks', type=int, default=DEFAULT_TASKS)
+        parser.add_argument(
+            '--max-labels',
+            type=int,
+            default=DEFAULT_MAX_LABELS,
+            help='Maximum number of labels per task.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of tasks inserted per transaction.',
+        )
+
+    def handle(self, *args, **options):
+        """Create the rows and print what was created.
+
+        Raises:
+            CommandError: there are no users or statuses for the tasks.
+        """
+        start = time.perf_counter()
+        self.token = uuid.uuid4().hex[:TOKEN_LENGTH]
+
+        self.create_users(options['users'])
+        self.create_named(Status, 'Status', options['statuses'])
+        self.create_named(Label, 'Label', options['labels'])
+
+        self.picker = IdPicker()
+        if not (self.picker.user_ids and self.picker.status_ids):
+            raise CommandError(NO_DATA_MESSAGE)
+
+        created = 0
+        while created < options['tasks']:
+            size = min(options['batch_size'], options['tasks'] - created)
+            self.create_tasks(created, size, options['max_labels'])
+            created += size
+
+        for model in (User, Status, Label, Task, Relationships):
+            bump_version(model)
+
+        self.stdout.write(
+            DONE_MESSAGE.format(
+                options['users'],
+                options['statuses'],
+                options['labels'],
+                options['tasks'],
+                time.perf_counter() - start,
+            ),
+        )
+
+    def create_users(self, count):
+        """Create users without a usable password."""
+        password = make_password(None)
+
+        User.objects.bulk_create(
+            (
+                User(
+                    username='bench-{0}-{1}'.format(self.token, number),
+                    first_name=generator.choice(FIRST_NAMES),
+                    last_name=generator.choice(LAST_NAMES),
+                    password=password,
+                )
+                for number in range(count)
+            ),
+            batch_size=DEFAULT_BATCH_SIZE,
+        )
+
+    def create_named(self, model, prefix, count):
+        """Create statuses or labels with unique names."""
+        model.objects.bulk_create(
+            model(name='{0} {1}-{2}'.format(prefix, self.token, number))
+            for number in range(count)
+        )
+
+    def create_tasks(self, offset, count, max_labels):
+        """Create one batch of tasks and their labels in a transaction."""
+        tasks = [
+            Task(
+                name='Task {0}-{1}'.format(self.token, offset + number),
+                description=generator.choice(DESCRIPTIONS),
+                status_id=self.picker.pick(self.picker.status_ids)[0],
+                executor_id=self.picker.pick_executor(),
+                created_by_id=generator.choice(self.picker.user_ids),
+            )
+            for number in range(count)
+        ]
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks)
+            Relationships.objects.bulk_create(
+                Relationships(task_id=task_id, label_id=label_id)
+                for task_id in self.get_task_ids(tasks)
+                for label_id in self.picker.pick_labels(max_labels)
+            )
+
+    def get_task_ids(self, tasks):
+        """Return the ids of created tasks, querying them if not returned."""
+        if tasks[0].pk is not None:
+            return [task.pk for task in tasks]
+
+        return Task.objects.filter(
+            name__in=[task.name for task in tasks],
+        ).values_list('pk', flat=True)
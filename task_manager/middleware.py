@@ -0,0 +1,43 @@
+"""Task manager project middleware."""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise middleware that also runs in an async middleware chain.
+
+    WhiteNoise only supports sync requests, so under ASGI Django would
+    wrap it and everything after it, views included, in sync/async
+    adapters. Here the lookup of a static file is a dict lookup made
+    on the event loop and only the file response is built in a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response, *args, **kwargs):
+        """Switch to async calls when the next handler is async."""
+        super().__init__(get_response, *args, **kwargs)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Serve a static file or pass the request on."""
+        if self.is_async:
+            return self.__acall__(request)
+
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        """Serve a static file or pass the request on, asynchronously."""
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+
+        return await self.get_response(request)
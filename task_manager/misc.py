@@ -4,6 +4,12 @@ import json
 import os
 
 from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
 
 DIR_PATH = os.path.dirname(__file__)
 
@@ -29,3 +35,61 @@ def get_response_messages(response):
     return [
         messages.message for messages in get_messages(response.wsgi_request)
     ]
+
+
+class QueryBudgetMixin(object):
+    """Test case mixin asserting that a page has a fixed query budget."""
+
+    def count_queries(self, url, method='get'):
+        """Request the page with empty caches and return its query count."""
+        # Cached pages and choices would hide the queries of a view.
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url)
+            if response.streaming:
+                b''.join(response.streaming_content)
+
+            return len(context.captured_queries)
+
+    def assert_query_budget(self, budget, url, grow):
+        """Assert the page stays within budget before and after grow()."""
+        before = self.count_queries(url)
+        grow()
+        after = self.count_queries(url)
+
+        self.assertLessEqual(
+            before,
+            budget,
+            '{0} ran {1} queries, the budget is {2}.'.format(url, before, budget),
+        )
+        self.assertEqual(
+            before,
+            after,
+            '{0} ran {1} queries, then {2} with more rows.'.format(
+                url,
+                before,
+                after,
+            ),
+        )
+
+
+class TaskFactoryMixin(object):
+    """Test case mixin creating tasks in bulk."""
+
+    def create_tasks(self, count):
+        """Create tasks of the test user with the test status and label."""
+        test_data = get_test_data()
+        author = User.objects.get(pk=test_data['users']['has_relationships']['pk'])
+        tasks = Task.objects.bulk_create(
+            Task(
+                name='Task {0}'.format(number),
+                status_id=test_data['statuses']['existing']['pk'],
+                executor=author,
+                created_by=author,
+            )
+            for number in range(count)
+        )
+
+        for created_task in tasks:
+            created_task.labels.add(test_data['labels']['existing']['pk'])
@@ -1,22 +1,58 @@
 """Task manager project mixins."""
 
+from functools import partial
+from http import HTTPStatus
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.cache import cache
 from django.db.models.deletion import ProtectedError
+from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.crypto import md5
+from django.utils.http import http_date
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.caching import get_version
+from task_manager.pagination import KeysetPaginator
+
 LOGIN_REQUIRED_MESSAGE = _('You are not logged in! Please log in.')
 
 
+@sync_to_async
+def is_authenticated(request):
+    """Load the user of the session, which the sync ORM reads."""
+    return request.user.is_authenticated
+
+
 class ProtectedErrorMixin(object):
-    """React on exception ProtectedError."""
+    """React on exception ProtectedError.
+
+    Objects that are still referenced are detected with the cheap
+    ``is_in_use()`` check before Django collects the related rows.
+    """
 
     protected_error_message = ''
     protected_error_url = ''
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['is_in_use'] = self.object.is_in_use()
+        context['protected_error_message'] = self.protected_error_message
+
+        return context
+
     def form_valid(self, form):
+        if self.object.is_in_use():
+            messages.error(self.request, self.protected_error_message)
+
+            return redirect(self.protected_error_url)
+
         try:
             response = super().form_valid(form)
         except ProtectedError:
@@ -47,6 +83,10 @@ class NoPermissionMixin(UserPassesTestMixin):
 
     permission_denied_url = ''
 
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self._permission_object = None
+
     def dispatch(self, request, *args, **kwargs):
         if not self.test_func():
             messages.error(self.request, self.permission_denied_message)
@@ -54,3 +94,134 @@ class NoPermissionMixin(UserPassesTestMixin):
             return redirect(self.permission_denied_url)
 
         return super().dispatch(request, *args, **kwargs)
+
+    def get_object(self, queryset=None):
+        """Fetch the object once for the permission check and the view."""
+        if queryset is not None:
+            return super().get_object(queryset)
+
+        if self._permission_object is None:
+            self._permission_object = super().get_object()
+
+        return self._permission_object
+
+
+class KeysetPaginationMixin(object):
+    """Paginate a list view with a cursor instead of a page number."""
+
+    cursor_kwarg = 'cursor'
+    keyset_ordering = ('created_at', 'id')
+
+    def get_keyset_fields(self, queryset):
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            ordering=self.get_keyset_fields(queryset),
+        )
+
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except ValueError:
+            raise Http404(_('Invalid cursor.'))
+
+        is_paginated = page.has_next() or page.has_previous()
+
+        return (paginator, page, page.object_list, is_paginated)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get('page_obj')
+
+        if page is not None:
+            context['next_page_query'] = self.get_cursor_query(
+                page.next_cursor(),
+            )
+            context['previous_page_query'] = self.get_cursor_query(
+                page.previous_cursor(),
+            )
+
+        return context
+
+    def get_cursor_query(self, cursor):
+        if cursor is None:
+            return None
+
+        query = self.request.GET.copy()
+        query[self.cursor_kwarg] = cursor
+
+        return query.urlencode()
+
+
+class CachedListMixin(object):
+    """Answer unchanged list pages with 304 and cache rendered ones.
+
+    A page is identified by the versions of the tables it is built from,
+    the user, the full path with the filter parameters, the language
+    and the CSRF cookie its forms are signed with. Any write to one of
+    the ``watermark_models`` bumps its version and so changes the key.
+    With the local-memory cache the writes of other processes are only
+    seen once the versions expire, after ``CACHE_VERSION_TIMEOUT``.
+    """
+
+    watermark_models = ()
+
+    def get(self, request, *args, **kwargs):
+        """Return 304, the cached page or a freshly rendered one."""
+        csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+
+        # Flash messages are shown once, and a page without the CSRF
+        # cookie sets a new one, so neither can be reused.
+        if not csrf_cookie or len(messages.get_messages(request)):
+            return super().get(request, *args, **kwargs)
+
+        versions = [get_version(model) for model in self.watermark_models]
+        key = self.get_page_key(versions, csrf_cookie)
+        last_modified = int(max(versions))
+
+        response = get_conditional_response(
+            request,
+            etag=quote_etag(key),
+            last_modified=last_modified,
+        )
+        if response is None:
+            response = self.get_page(
+                key,
+                partial(super().get, request, *args, **kwargs),
+            )
+
+        response.headers['ETag'] = quote_etag(key)
+        response.headers['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    def get_page_key(self, versions, csrf_cookie):
+        """Return the cache key of the requested page."""
+        parts = [
+            type(self).__module__,
+            type(self).__qualname__,
+            self.request.user.pk,
+            self.request.get_full_path(),
+            get_language(),
+            csrf_cookie,
+            *versions,
+        ]
+        digest = md5(repr(parts).encode(), usedforsecurity=False)
+
+        return 'page:{0}'.format(digest.hexdigest())
+
+    def get_page(self, key, render):
+        """Return the cached page or render and cache it."""
+        cached = cache.get(key)
+        if cached is not None:
+            return HttpResponse(cached)
+
+        response = render()
+        response.render()
+        if response.status_code == HTTPStatus.OK:
+            cache.set(key, response.content)
+
+        return response
@@ -0,0 +1,14 @@
+"""Monitoring application admin interface."""
+
+from django.contrib import admin
+
+from task_manager.monitoring.models import QueryFingerprint
+
+
+@admin.register(QueryFingerprint)
+class QueryFingerprintAdmin(admin.ModelAdmin):
+    """Admin interface configuretion."""
+
+    list_display = ('sql', 'view', 'count', 'total_ms', 'max_ms', 'last_seen')
+    list_filter = ('view',)
+    ordering = ('-total_ms',)
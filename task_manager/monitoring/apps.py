@@ -0,0 +1,10 @@
+"""Monitoring application configuration."""
+
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    """Monitoring config."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.monitoring'
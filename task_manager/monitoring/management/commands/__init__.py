@@ -0,0 +1 @@
+"""Monitoring application management commands."""
@@ -0,0 +1,75 @@
+"""Print the queries taking the most database time."""
+
+from types import MappingProxyType
+
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from task_manager.monitoring.models import QueryFingerprint
+from task_manager.monitoring.queries import collector
+
+DEFAULT_LIMIT = 20
+COUNT = 'count'
+ORDERINGS = MappingProxyType({
+    'total': models.F('total_ms').desc(),
+    'max': models.F('max_ms').desc(),
+    COUNT: models.F(COUNT).desc(),
+    'mean': (models.F('total_ms') / models.F(COUNT)).desc(),
+})
+SQL_WIDTH = 200
+
+
+class Command(BaseCommand):
+    """Report the collected query statistics."""
+
+    help = 'Print the queries taking the most database time, by view.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=DEFAULT_LIMIT,
+            help='Number of fingerprints to print.',
+        )
+        parser.add_argument(
+            '--order',
+            choices=ORDERINGS,
+            default='total',
+            help='Statistic to sort by.',
+        )
+        parser.add_argument('--view', help='Only print queries of this view.')
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Delete the collected statistics after printing them.',
+        )
+
+    def handle(self, *args, **options):
+        """Print the top fingerprints."""
+        # Statistics collected by this process are not in the table yet.
+        collector.flush()
+
+        fingerprints = QueryFingerprint.objects.order_by(ORDERINGS[options['order']])
+        if options['view'] is not None:
+            fingerprints = fingerprints.filter(view=options['view'])
+
+        self.stdout.write(
+            '{0:>8} {1:>11} {2:>9} {3:>9}  {4}'.format(
+                COUNT, 'total ms', 'mean ms', 'max ms', 'view',
+            ),
+        )
+        for query in fingerprints[:options['limit']]:
+            self.stdout.write(
+                '{0:>8} {1:>11.1f} {2:>9.2f} {3:>9.2f}  {4}'.format(
+                    query.count,
+                    query.total_ms,
+                    query.total_ms / query.count,
+                    query.max_ms,
+                    query.view or '-',
+                ),
+            )
+            self.stdout.write('    {0}'.format(query.sql[:SQL_WIDTH]))
+
+        if options['reset']:
+            QueryFingerprint.objects.all().delete()
@@ -0,0 +1,108 @@
+"""Monitoring application middleware."""
+
+import logging
+import time
+from collections import namedtuple
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from task_manager.monitoring.queries import collector
+
+logger = logging.getLogger(__name__)
+
+MILLISECONDS = 1000
+SELECT = 'SELECT'
+SLOW_QUERY_MESSAGE = 'Slow query in {0} ({1:.1f} ms): {2}\n{3}'
+
+# The arguments of a database execute wrapper.
+Query = namedtuple('Query', ('sql', 'params', 'many', 'context'))
+
+
+class QueryRecorder(object):
+    """Database execute wrapper feeding the query collector."""
+
+    def __init__(self, request):
+        """Remember the request the queries belong to."""
+        self.request = request
+        self.explaining = False
+
+    def __call__(self, execute, *query_args):
+        """Run the query and record it."""
+        if self.explaining:
+            return execute(*query_args)
+
+        with ExitStack() as stack:
+            # The query is recorded even if it fails.
+            stack.callback(self.record, Query(*query_args), time.perf_counter())
+            return execute(*query_args)
+
+    @property
+    def view_name(self):
+        """Return the name of the view, once the URL is resolved."""
+        return getattr(self.request.resolver_match, 'view_name', '')
+
+    def record(self, query, start):
+        """Add the query to the collector and log it if it was slow."""
+        duration_ms = (time.perf_counter() - start) * MILLISECONDS
+        collector.add(query.sql, self.view_name, duration_ms)
+
+        if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS and not query.many:
+            self.log_slow_query(query, duration_ms)
+
+    def log_slow_query(self, query, duration_ms):
+        """Log the query together with its plan."""
+        plan = ''
+        if query.sql.lstrip()[:len(SELECT)].upper() == SELECT:
+            plan = self.explain(query)
+
+        logger.warning(SLOW_QUERY_MESSAGE.format(
+            self.view_name or self.request.path,
+            duration_ms,
+            query.sql,
+            plan,
+        ))
+
+    def explain(self, query):
+        """Return the plan of the query, or an empty string."""
+        self.explaining = True
+        try:
+            rows = self.fetch_plan(query)
+        except DatabaseError:
+            rows = ()
+        self.explaining = False
+
+        return '\n'.join(
+            ' '.join(str(column) for column in row)
+            for row in rows
+        )
+
+    def fetch_plan(self, query):
+        """Run EXPLAIN on the query and return the rows of the plan."""
+        connection = query.context['connection']
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute('{0} {1}'.format(prefix, query.sql), query.params)
+            return cursor.fetchall()
+
+
+class SlowQueryMiddleware(object):
+    """Collect query fingerprints per view and log slow queries."""
+
+    def __init__(self, get_response):
+        """Remember the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Record the queries of the request."""
+        recorder = QueryRecorder(request)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        collector.flush_if_due(settings.SLOW_QUERY_FLUSH_INTERVAL)
+
+        return response
@@ -0,0 +1,31 @@
+"""Monitoring application models."""
+
+from django.db import models
+
+# An MD5 hex digest.
+FINGERPRINT_LENGTH = 32
+VIEW_LENGTH = 200
+
+
+class QueryFingerprint(models.Model):
+    """Statistics of one normalized query issued by one view."""
+
+    fingerprint = models.CharField(max_length=FINGERPRINT_LENGTH)
+    view = models.CharField(max_length=VIEW_LENGTH, blank=True)
+    sql = models.TextField()
+    count = models.PositiveBigIntegerField(default=0)
+    total_ms = models.FloatField(default=0)
+    max_ms = models.FloatField(default=0)
+    last_seen = models.DateTimeField(auto_now=True)
+
+    class Meta(object):
+        constraints = (
+            models.UniqueConstraint(
+                fields=('fingerprint', 'view'),
+                name='monitoring_unique_fingerprint_view',
+            ),
+        )
+
+    def __str__(self):
+        """Represent the model as a string."""
+        return self.sql
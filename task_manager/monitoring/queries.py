@@ -0,0 +1,108 @@
+"""Monitoring application query fingerprints."""
+
+import re
+import threading
+import time
+
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Greatest
+from django.utils.crypto import md5
+
+from task_manager.monitoring.models import QueryFingerprint
+
+NORMALIZERS = (
+    # Parameter placeholders of the supported backends.
+    (re.compile(r'[%]s|\$\d+'), '?'),
+    # String literals and numbers, but not digits inside identifiers.
+    (re.compile("'(?:[^']|'')*'"), '?'),
+    (re.compile(r'(?<![\w".])-?\d+(?:\.\d+)?\b'), '?'),
+    # Lists of values, whatever their length.
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),
+    (re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def normalize(sql):
+    """Return the SQL with its literals and value lists replaced."""
+    for pattern, replacement in NORMALIZERS:
+        sql = pattern.sub(replacement, sql)
+
+    return sql.strip()
+
+
+def get_fingerprint(normalized_sql):
+    """Return a short stable id of the normalized SQL."""
+    return md5(normalized_sql.encode(), usedforsecurity=False).hexdigest()
+
+
+class QueryCollector(object):
+    """Aggregate query statistics in the process and flush them to the DB.
+
+    Queries are counted in memory and written once per flush interval,
+    so the statistics cost a few updates per interval, not per query.
+    """
+
+    def __init__(self):
+        """Start with nothing collected."""
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.flushed_at = time.monotonic()
+
+    def add(self, sql, view, duration_ms):
+        """Account for one executed query."""
+        normalized_sql = normalize(sql)
+        key = (get_fingerprint(normalized_sql), view)
+
+        with self.lock:
+            stats = self.pending.get(key)
+            if stats is None:
+                stats = QueryFingerprint(
+                    fingerprint=key[0],
+                    view=view,
+                    sql=normalized_sql,
+                )
+                self.pending[key] = stats
+
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+
+    def flush_if_due(self, interval):
+        """Flush the statistics if the interval has passed."""
+        if time.monotonic() - self.flushed_at >= interval:
+            self.flush()
+
+    def flush(self):
+        """Add the collected statistics to the stored ones."""
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+            self.flushed_at = time.monotonic()
+
+        for stats in pending.values():
+            self.save(stats)
+
+    def save(self, stats):
+        """Add the statistics of one fingerprint to its row."""
+        rows = QueryFingerprint.objects.filter(
+            fingerprint=stats.fingerprint,
+            view=stats.view,
+        )
+        changes = {
+            'count': models.F('count') + stats.count,
+            'total_ms': models.F('total_ms') + stats.total_ms,
+            'max_ms': Greatest('max_ms', stats.max_ms),
+        }
+        if rows.update(**changes):
+            return
+
+        try:
+            with transaction.atomic():
+                stats.save(force_insert=True)
+        except IntegrityError:
+            # Another process created the row in the meantime.
+            rows.update(**changes)
+
+
+collector = QueryCollector()
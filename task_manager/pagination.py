@@ -0,0 +1,206 @@
+"""Task manager project keyset pagination."""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from functools import reduce
+from operator import methodcaller, or_
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+NEXT = 'next'
+PREVIOUS = 'previous'
+
+
+def encode_cursor(direction, row_values):
+    """Pack a direction and the ordering values of a row into a cursor."""
+    # Dates and times are the only ordering values JSON cannot hold.
+    payload = json.dumps(
+        [direction, *row_values],
+        default=methodcaller('isoformat'),
+    )
+
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor, size):
+    """Unpack a cursor into its direction and ordering values.
+
+    Raises:
+        ValueError: the cursor is malformed.
+    """
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (DecodeError, UnicodeError, json.JSONDecodeError) as error:
+        raise ValueError(cursor) from error
+
+    if not isinstance(payload, list) or len(payload) != size + 1:
+        raise ValueError(cursor)
+
+    direction, *row_values = payload
+    if direction not in {NEXT, PREVIOUS}:
+        raise ValueError(cursor)
+
+    return direction, row_values
+
+
+def get_ordering_field(queryset, name):
+    """Return the model field or the annotation the queryset is ordered by."""
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        return annotation.output_field
+
+    return queryset.query.get_meta().get_field(name)
+
+
+def get_row_values(row, ordering):
+    """Return the ordering values of a model instance or a values() row."""
+    if isinstance(row, dict):
+        return [row[field] for field in ordering]
+
+    return [getattr(row, field) for field in ordering]
+
+
+def seek(ordering, row_values, lookup):
+    """Build a condition selecting the rows after (or before) a row."""
+    conditions = []
+    for index, field in enumerate(ordering):
+        equal = dict(zip(ordering[:index], row_values[:index]))
+        equal['{0}__{1}'.format(field, lookup)] = row_values[index]
+        conditions.append(models.Q(**equal))
+
+    # The redundant bound on the leading column lets the database
+    # use the composite index as a range scan.
+    leading = {'{0}__{1}e'.format(ordering[0], lookup): row_values[0]}
+
+    return models.Q(**leading) & reduce(or_, conditions)
+
+
+class KeysetPage(object):
+    """A page of a keyset paginated list."""
+
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        """Keep the page rows and the cursors pointing around them."""
+        self.object_list = object_list
+        self.ordering = ordering
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        """Iterate over the page rows."""
+        return iter(self.object_list)
+
+    def __len__(self):
+        """Return the number of rows on the page."""
+        return len(self.object_list)
+
+    def has_next(self):
+        """Return True if there are rows after this page."""
+        return self._has_next
+
+    def has_previous(self):
+        """Return True if there are rows before this page."""
+        return self._has_previous
+
+    def next_cursor(self):
+        """Return the cursor of the following page."""
+        if not self._has_next:
+            return None
+
+        return encode_cursor(
+            NEXT,
+            get_row_values(self.object_list[-1], self.ordering),
+        )
+
+    def previous_cursor(self):
+        """Return the cursor of the preceding page."""
+        if not self._has_previous:
+            return None
+
+        return encode_cursor(
+            PREVIOUS,
+            get_row_values(self.object_list[0], self.ordering),
+        )
+
+
+class KeysetPaginator(object):
+    """Paginate a queryset by seeking past the last seen row.
+
+    Every page is fetched with a single ``WHERE ... ORDER BY ... LIMIT``
+    query, so a deep page costs the same as the first one as long as
+    the ordering is covered by an index. The ordering fields must be
+    ascending, not nullable and unique taken together.
+    """
+
+    def __init__(self, queryset, per_page, ordering=('created_at', 'id')):
+        """Remember the queryset, the page size and the ordering."""
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+
+    def page(self, cursor=None):
+        """Return the page the cursor points to, raise ValueError if invalid."""
+        queryset, direction, has_previous = self._seek(cursor)
+
+        return self._build_page(list(queryset), direction, has_previous)
+
+    async def apage(self, cursor=None):
+        """Return the page the cursor points to, read with the async ORM."""
+        queryset, direction, has_previous = self._seek(cursor)
+        rows = [row async for row in queryset]
+
+        return self._build_page(rows, direction, has_previous)
+
+    def _seek(self, cursor):
+        if not cursor:
+            return self._slice(self.queryset, NEXT), NEXT, False
+
+        direction, row_values = decode_cursor(cursor, len(self.ordering))
+        row_values = self._convert(row_values)
+        lookup = 'gt' if direction == NEXT else 'lt'
+        queryset = self.queryset.filter(seek(self.ordering, row_values, lookup))
+
+        return self._slice(queryset, direction), direction, True
+
+    def _convert(self, row_values):
+        converted = []
+        for name, row_value in zip(self.ordering, row_values):
+            # The ordering fields are not nullable and hold scalars.
+            if row_value is None or isinstance(row_value, (dict, list)):
+                raise ValueError(row_value)
+
+            field = get_ordering_field(self.queryset, name)
+            try:
+                converted.append(field.to_python(row_value))
+            except (TypeError, ValidationError) as error:
+                raise ValueError(row_value) from error
+
+        return converted
+
+    def _slice(self, queryset, direction):
+        ordering = self.ordering
+        if direction == PREVIOUS:
+            ordering = ['-{0}'.format(field) for field in ordering]
+
+        return queryset.order_by(*ordering)[:self.per_page + 1]
+
+    def _build_page(self, rows, direction, has_previous):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction == PREVIOUS:
+            rows.reverse()
+            return KeysetPage(
+                rows,
+                self.ordering,
+                has_next=True,
+                has_previous=has_more,
+            )
+
+        return KeysetPage(
+            rows,
+            self.ordering,
+            has_next=has_more,
+            has_previous=has_previous,
+        )
@@ -0,0 +1,170 @@
+"""Task manager project request profiling."""
+
+import cProfile
+import json
+import logging
+import pstats
+import secrets
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from django.template.base import Template
+
+logger = logging.getLogger(__name__)
+sampler = secrets.SystemRandom()
+
+PROFILE_PARAM = 'profile'
+PROFILE_SORT_KEYS = frozenset(('cumulative', 'tottime', 'calls'))
+PROFILE_LINES = 60
+PROFILE_METHODS = frozenset(('GET', 'HEAD'))
+SERVER_TIMING = (
+    'db;dur={db:.1f};desc="{queries} queries", tpl;dur={tpl:.1f}, total;dur={total:.1f}'
+)
+MILLISECONDS = 1000
+
+# The template timer of the request being profiled, if any.
+template_timer = ContextVar('template_timer', default=None)
+render_template = Template.render
+
+
+class Timer(object):
+    """Context manager adding up the time spent in its outermost blocks."""
+
+    def __init__(self):
+        """Start with nothing timed."""
+        self.count = 0
+        self.duration = 0
+        self.depth = 0
+        self.start = 0
+
+    def __enter__(self):
+        """Start timing unless an outer block already does."""
+        if not self.depth:
+            self.start = time.perf_counter()
+        self.depth += 1
+
+    def __exit__(self, *exc_info):
+        """Account for the block once the outermost one ends."""
+        self.depth -= 1
+        if not self.depth:
+            self.duration += time.perf_counter() - self.start
+            self.count += 1
+
+
+class QueryTimer(Timer):
+    """Database execute wrapper adding up query time and count."""
+
+    def __call__(self, execute, *args):
+        """Run the query and account for it."""
+        with self:
+            return execute(*args)
+
+
+def timed_render(template, context):
+    """Render a template, timing it when a request is being profiled.
+
+    Included templates are rendered inside their parent, so only the
+    outermost render counts.
+    """
+    timer = template_timer.get()
+    if timer is None:
+        return render_template(template, context)
+
+    with timer:
+        return render_template(template, context)
+
+
+def get_stats_response(profiler, sort_key):
+    """Return the profiler statistics as a plain text response."""
+    if sort_key not in PROFILE_SORT_KEYS:
+        sort_key = 'cumulative'
+
+    response = HttpResponse(content_type='text/plain')
+    stats = pstats.Stats(profiler, stream=response)
+    stats.sort_stats(sort_key).print_stats(PROFILE_LINES)
+
+    return response
+
+
+class ProfilingMiddleware(object):
+    """Report where the time of each request goes.
+
+    Every response gets a Server-Timing header with the database, the
+    template and the total time, and a sample of the requests is logged
+    as JSON. A staff user can add ?profile to a GET request to receive
+    the cProfile statistics of the view instead of the page.
+    """
+
+    def __init__(self, get_response):
+        """Remember the next handler and time the template rendering.
+
+        Templates render inside the views too, for example the cached
+        list pages, so the rendering itself is timed rather than the
+        template responses.
+        """
+        self.get_response = get_response
+        Template.render = timed_render
+
+    def __call__(self, request):
+        """Time the request, its queries and its templates."""
+        query_timer = QueryTimer()
+        render_timer = Timer()
+        start = time.perf_counter()
+        response = self.get_timed_response(request, query_timer, render_timer)
+        timings = {
+            'db': query_timer.duration * MILLISECONDS,
+            'tpl': render_timer.duration * MILLISECONDS,
+            'total': (time.perf_counter() - start) * MILLISECONDS,
+        }
+        response.headers['Server-Timing'] = SERVER_TIMING.format(
+            queries=query_timer.count,
+            **timings,
+        )
+
+        if sampler.random() < settings.PROFILING_SAMPLE_RATE:
+            self.log(request, response, query_timer.count, timings)
+
+        return response
+
+    def get_timed_response(self, request, query_timer, render_timer):
+        """Return the response, timing the queries and the templates."""
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_timer))
+            stack.callback(template_timer.reset, template_timer.set(render_timer))
+
+            return self.get_response(request)
+
+    def log(self, request, response, queries, timings):
+        """Log the request timings as JSON."""
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'view': getattr(request.resolver_match, 'view_name', None),
+            'status': response.status_code,
+            'queries': queries,
+            'db_ms': round(timings['db'], 2),
+            'template_ms': round(timings['tpl'], 2),
+            'total_ms': round(timings['total'], 2),
+        }))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Profile the view for a staff user who asked for it."""
+        if PROFILE_PARAM not in request.GET:
+            return None
+        # Answering here skips the CSRF check, so unsafe methods are
+        # never profiled.
+        if request.method not in PROFILE_METHODS or not request.user.is_staff:
+            return None
+
+        profiler = cProfile.Profile()
+        response = profiler.runcall(view_func, request, *view_args, **view_kwargs)
+        render = getattr(response, 'render', None)
+        if render is not None:
+            profiler.runcall(render)
+
+        return get_stats_response(profiler, request.GET[PROFILE_PARAM])
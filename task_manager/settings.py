@@ -2,14 +2,26 @@
 
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 
 import dj_database_url
 import rollbar
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Take environment variables from .env.
 load_dotenv()
 
+TRUE_VALUES = frozenset(('true', 'yes', 'on', '1'))
+
+UNKNOWN_CACHE_MESSAGE = 'Unknown CACHE_URL scheme {0!r}, use one of: {1}.'
+
+
+def get_bool_env(name, default):
+    """Read a flag from the environment: "true", "yes", "on" or "1"."""
+    return os.getenv(name, str(default)).lower() in TRUE_VALUES
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -21,7 +33,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.getenv('SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv('DEBUG', 'True')
+DEBUG = get_bool_env('DEBUG', default=True)
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '*').split(',')
 
@@ -43,11 +55,14 @@ INSTALLED_APPS = [
     'task_manager.statuses',
     'task_manager.labels',
     'task_manager.tasks',
+    'task_manager.monitoring',
+    'task_manager.jobs',
+    'task_manager.api',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'task_manager.middleware.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -58,13 +73,40 @@ MIDDLEWARE = [
     'rollbar.contrib.django.middleware.RollbarNotifierMiddlewareOnly404',
 ]
 
+# Profiling
+# Server-Timing headers with the database, template and total time of
+# every request, a sampled JSON log of the requests and ?profile for
+# staff users. The middleware goes first to time the whole request.
+
+PROFILING = get_bool_env('PROFILING', default=False)
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE') or '0.01')
+
+if PROFILING:
+    MIDDLEWARE.insert(0, 'task_manager.profiling.ProfilingMiddleware')
+
+# Slow query log
+# Query statistics grouped by normalized SQL and view, flushed to the
+# database every SLOW_QUERY_FLUSH_INTERVAL seconds, and a warning with
+# the plan of every query slower than SLOW_QUERY_THRESHOLD_MS.
+
+SLOW_QUERY_LOG = get_bool_env('SLOW_QUERY_LOG', default=False)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS') or '200')
+SLOW_QUERY_FLUSH_INTERVAL = float(os.getenv('SLOW_QUERY_FLUSH_INTERVAL') or '60')
+
+if SLOW_QUERY_LOG:
+    MIDDLEWARE.insert(0, 'task_manager.monitoring.middleware.SlowQueryMiddleware')
+
 ROOT_URLCONF = 'task_manager.urls'
 
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -72,6 +114,11 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Compiled templates are kept in memory for the life of the
+            # process in production and reloaded on change in development.
+            'loaders': TEMPLATE_LOADERS if DEBUG else [
+                ('django.template.loaders.cached.Loader', TEMPLATE_LOADERS),
+            ],
         },
     },
 ]
@@ -82,7 +129,7 @@ WSGI_APPLICATION = 'task_manager.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
 
-CONN_MAX_AGE = 600
+CONN_MAX_AGE = int(os.getenv('CONN_MAX_AGE') or '600')
 
 DATABASES = {
     'default': {
@@ -95,6 +142,99 @@ if os.getenv('DATABASE_URL'):
     DATABASES['default'] = dj_database_url.config(conn_max_age=CONN_MAX_AGE)
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# CACHE_URL examples: locmem://, file:///var/tmp/task_manager,
+# redis://localhost:6379/0 (requires the redis package).
+# The local-memory cache is private to each process, use a shared
+# backend when running several workers.
+
+CACHE_URL = urlparse(os.getenv('CACHE_URL') or 'locmem://')
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'rediss': 'django.core.cache.backends.redis.RedisCache',
+}
+
+CACHE_LOCATIONS = {
+    'locmem': CACHE_URL.netloc,
+    'file': CACHE_URL.path,
+    'redis': CACHE_URL.geturl(),
+    'rediss': CACHE_URL.geturl(),
+}
+
+if CACHE_URL.scheme not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(UNKNOWN_CACHE_MESSAGE.format(
+        CACHE_URL.scheme,
+        ', '.join(CACHE_BACKENDS),
+    ))
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_URL.scheme],
+        'LOCATION': CACHE_LOCATIONS[CACHE_URL.scheme],
+        'TIMEOUT': int(os.getenv('CACHE_TIMEOUT') or '300'),
+        'KEY_PREFIX': 'task_manager',
+    },
+    # Rendered layout fragments depend on the deployed templates and
+    # static files, so they live in the process and go away on restart.
+    'templates': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'templates',
+        'TIMEOUT': None,
+    },
+}
+
+# Every cached list and page is keyed by the versions of its tables. A
+# shared cache keeps them until the next write. The local-memory cache
+# does not see the writes of the other processes, so there they expire
+# and a process catches up with the others after that many seconds.
+
+CACHE_VERSION_TIMEOUT = (
+    int(os.getenv('CACHE_VERSION_TIMEOUT') or '10')
+    if CACHE_URL.scheme == 'locmem' else None
+)
+
+
+# Sessions and messages
+# https://docs.djangoproject.com/en/4.2/topics/http/sessions/
+# Sessions are read from the cache and only written through to the
+# database, unless the cache is private to the process.
+
+SESSION_BACKEND = 'db' if CACHE_URL.scheme == 'locmem' else 'cached_db'
+
+if os.getenv('SESSION_BACKEND'):
+    SESSION_BACKEND = os.getenv('SESSION_BACKEND')
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.{0}'.format(SESSION_BACKEND)
+
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+
+# Live task updates
+# "local" only reaches the streams of the worker that saved the task,
+# "database" polls the events table and works with several workers.
+
+TASK_EVENTS_BACKEND = os.getenv('TASK_EVENTS_BACKEND') or 'database'
+
+
+# Email
+# Sent by the background jobs. The console backend prints the emails
+# until an SMTP server is configured.
+
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND') or (
+    'django.core.mail.backends.console.EmailBackend'
+)
+EMAIL_HOST = os.getenv('EMAIL_HOST') or 'localhost'
+EMAIL_PORT = int(os.getenv('EMAIL_PORT') or '25')
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = get_bool_env('EMAIL_USE_TLS', default=False)
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL') or 'webmaster@localhost'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -140,6 +280,14 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 
+# Uploaded and generated files
+# https://docs.djangoproject.com/en/4.2/topics/files/
+# Background jobs save their outputs, like exports, here. The web and
+# worker processes must share this directory.
+
+MEDIA_ROOT = os.getenv('MEDIA_ROOT') or BASE_DIR / 'media'
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
@@ -151,6 +299,26 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'users.User'
 
 
+# Logging
+# https://docs.djangoproject.com/en/4.2/topics/logging/
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'task_manager': {
+            'handlers': ['console'],
+            'level': os.getenv('LOG_LEVEL') or 'INFO',
+        },
+    },
+}
+
+
 # Rollbar
 ROLLBAR = {
     'access_token': os.getenv('ROLLBAR_ACCESS_TOKEN'),
@@ -0,0 +1,6 @@
+"""Statuses application cached choices."""
+
+from task_manager.caching import CachedChoices
+from task_manager.statuses.models import Status
+
+status_choices = CachedChoices(Status)
@@ -13,3 +13,7 @@ class Status(models.Model):
     def __str__(self):
         """Represent the model as a string."""
         return self.name
+
+    def is_in_use(self):
+        """Return True if a task has the status."""
+        return self.task_set.exists()
@@ -4,6 +4,7 @@ from django.urls import path
 
 from task_manager.statuses.views import (
     IndexView,
+    StatusAutocompleteView,
     StatusCreationView,
     StatusDeleteView,
     StatusUpdateView,
@@ -13,6 +14,7 @@ app_name = 'statuses'
 
 urlpatterns = [
     path('', IndexView.as_view(), name='index'),
+    path('autocomplete/', StatusAutocompleteView.as_view(), name='autocomplete'),
     path('create/', StatusCreationView.as_view(), name='create'),
     path('<int:pk>/update/', StatusUpdateView.as_view(), name='update'),
     path('<int:pk>/delete/', StatusDeleteView.as_view(), name='delete'),
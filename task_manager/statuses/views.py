@@ -5,9 +5,14 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
-from task_manager.mixins import ProtectedErrorMixin, UserLoginRequiredMixin
+from task_manager.mixins import (
+    CachedListMixin,
+    ProtectedErrorMixin,
+    UserLoginRequiredMixin,
+)
 from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
+from task_manager.views import AutocompleteView
 
 CREATION_SUCCESS_MESSAGE = _('Status successfully created.')
 UPDATE_SUCCESS_MESSAGE = _('Status successfully changed.')
@@ -18,10 +23,11 @@ PROTECTED_ERROR_MESSAGE = _(
 )
 
 
-class IndexView(UserLoginRequiredMixin, ListView):
+class IndexView(UserLoginRequiredMixin, CachedListMixin, ListView):
     """Statuses page view."""
 
     model = Status
+    watermark_models = (Status,)
 
 
 class StatusCreationView(
@@ -78,3 +84,11 @@ class StatusDeleteView(
         'header': _('Status deletion'),
         'button': _('Yes, delete'),
     }
+
+
+class StatusAutocompleteView(AutocompleteView):
+    """Status choices for autocomplete widgets."""
+
+    model = Status
+    search_fields = ('name',)
+    keyset_ordering = ('name', 'id')
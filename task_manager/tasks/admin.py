@@ -2,7 +2,7 @@
 
 from django.contrib import admin
 
-from task_manager.tasks.models import Task
+from task_manager.tasks.models import RELATED_FIELDS, Task
 
 
 @admin.register(Task)
@@ -17,3 +17,8 @@ class TaskAdmin(admin.ModelAdmin):
         'created_by',
         'created_at',
     )
+    list_select_related = RELATED_FIELDS
+
+    def get_queryset(self, request):
+        """Return the eager-loaded queryset for the changelist."""
+        return super().get_queryset(request).for_list('description')
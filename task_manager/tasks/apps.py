@@ -1,6 +1,13 @@
 """Tasks application configuration."""
 
+from importlib import import_module
+
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+from task_manager.caching import watch_model
+from task_manager.tasks import triggers
+from task_manager.tasks.search import restore_triggers
 
 
 class TasksConfig(AppConfig):
@@ -8,3 +15,12 @@ class TasksConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self):
+        """Track changes of tasks and their labels."""
+        watch_model(self.get_model('Task'))
+        watch_model(self.get_model('Relationships'))
+        # The events module imports the models, so it loads once they do.
+        import_module('{0}.events'.format(self.name)).watch_tasks()
+        post_migrate.connect(restore_triggers, sender=self)
+        post_migrate.connect(triggers.restore_triggers, sender=self)
@@ -0,0 +1,83 @@
+"""Tasks application counters of tasks per status, executor and label."""
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Count, Value
+from django.db.models.functions import Coalesce
+
+from task_manager.tasks.models import (
+    EXECUTOR_DIMENSION,
+    LABEL_DIMENSION,
+    STATUS_DIMENSION,
+    UNASSIGNED,
+    Relationships,
+    Task,
+    TaskCounter,
+)
+
+# Writes waiting for the lock are counted after the rebuild, not lost.
+POSTGRESQL_LOCK = 'LOCK TABLE tasks_task, tasks_relationships IN SHARE MODE'
+
+# Tasks without an executor are counted under the UNASSIGNED id.
+EXECUTOR_ID = Coalesce('executor_id', Value(UNASSIGNED))
+
+
+def get_groups(using):
+    """Return (dimension, values_list() of the counted ids) pairs."""
+    tasks = Task.objects.using(using).order_by()
+    relationships = Relationships.objects.using(using).order_by()
+
+    return (
+        (STATUS_DIMENSION, tasks.values_list('status_id')),
+        (EXECUTOR_DIMENSION, tasks.values_list(EXECUTOR_ID)),
+        (LABEL_DIMENSION, relationships.values_list('label_id')),
+    )
+
+
+def count_tasks(using=DEFAULT_DB_ALIAS):
+    """Return {(dimension, object id): count} computed from the tasks."""
+    return {
+        (dimension, object_id): count
+        for dimension, queryset in get_groups(using)
+        for object_id, count in queryset.annotate(Count('pk'))
+    }
+
+
+def get_counts(using=DEFAULT_DB_ALIAS):
+    """Return {(dimension, object id): count} of the non-zero counters."""
+    counters = TaskCounter.objects.using(using).exclude(count=0)
+
+    return {
+        (dimension, object_id): count
+        for dimension, object_id, count in counters.values_list(
+            'dimension',
+            'object_id',
+            'count',
+        )
+    }
+
+
+def rebuild(using=DEFAULT_DB_ALIAS):
+    """Recompute every counter from the tasks."""
+    with transaction.atomic(using=using):
+        if connections[using].vendor == 'postgresql':
+            with connections[using].cursor() as cursor:
+                cursor.execute(POSTGRESQL_LOCK)
+
+        TaskCounter.objects.using(using).all().delete()
+        TaskCounter.objects.using(using).bulk_create(
+            TaskCounter(dimension=dimension, object_id=object_id, count=count)
+            for (dimension, object_id), count in count_tasks(using).items()
+        )
+
+
+def check(using=DEFAULT_DB_ALIAS):
+    """Return (dimension, object id, expected, stored) of wrong counters."""
+    with transaction.atomic(using=using):
+        expected = count_tasks(using)
+        stored = get_counts(using)
+
+    return sorted(
+        (*key, expected.get(key, 0), stored.get(key, 0))
+        for key in expected.keys() | stored.keys()
+        if expected.get(key, 0) != stored.get(key, 0)
+    )
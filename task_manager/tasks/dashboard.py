@@ -0,0 +1,56 @@
+"""Tasks application dashboard of the task counters."""
+
+from task_manager.labels.choices import label_choices
+from task_manager.statuses.choices import status_choices
+from task_manager.tasks.counters import get_counts
+from task_manager.tasks.models import (
+    EXECUTOR_DIMENSION,
+    LABEL_DIMENSION,
+    STATUS_DIMENSION,
+    User,
+)
+
+NAME = 'name'
+COUNT = 'count'
+
+
+def get_names(counts):
+    """Return the functions naming the objects of every dimension."""
+    executor_ids = [
+        object_id
+        for dimension, object_id in counts
+        if dimension == EXECUTOR_DIMENSION
+    ]
+    executors = User.objects.only('first_name', 'last_name').in_bulk(executor_ids)
+
+    return {
+        STATUS_DIMENSION: status_choices.get_name,
+        EXECUTOR_DIMENSION: executors.get,
+        LABEL_DIMENSION: label_choices.get_name,
+    }
+
+
+def get_rank(row):
+    """Return the sort key of a dashboard row, largest count first."""
+    return (-row[COUNT], str(row[NAME]))
+
+
+def get_rows(counts, dimension, get_name):
+    """Return the named counters of one dimension, largest first."""
+    rows = [
+        {'pk': object_id, NAME: get_name(object_id), COUNT: count}
+        for (row_dimension, object_id), count in counts.items()
+        if row_dimension == dimension
+    ]
+
+    return sorted(rows, key=get_rank)
+
+
+def get_dashboard():
+    """Return the counters per dimension with names, largest first."""
+    counts = get_counts()
+
+    return {
+        dimension: get_rows(counts, dimension, get_name)
+        for dimension, get_name in get_names(counts).items()
+    }
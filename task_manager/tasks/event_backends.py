@@ -0,0 +1,168 @@
+"""Tasks application event backends, feeding the open streams."""
+
+import asyncio
+import threading
+from contextlib import ExitStack
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+
+from task_manager.tasks.models import TaskEvent
+
+QUEUE_SIZE = 100
+POLL_INTERVAL = 1
+POLL_BATCH = 500
+
+UNKNOWN_BACKEND_MESSAGE = 'Unknown TASK_EVENTS_BACKEND {0!r}, use one of: {1}.'
+
+# Queued instead of the events a stream was too slow to receive.
+CATCH_UP = None
+
+
+def put_events(queue, events):
+    """Queue the events, or a catch up once the stream fell behind."""
+    if queue.full():
+        while not queue.empty():
+            queue.get_nowait()
+        events = CATCH_UP
+
+    queue.put_nowait(events)
+
+
+class EventHub(object):
+    """Fan the events out to the streams open in this process.
+
+    Events are published from the threads running the sync views while
+    the streams wait in an event loop, so the queues are fed through
+    their loop.
+    """
+
+    def __init__(self):
+        """Start without streams."""
+        self.queues = {}
+        self.lock = threading.Lock()
+
+    def subscribe(self):
+        """Return a queue receiving the events in the running loop."""
+        queue = asyncio.Queue(QUEUE_SIZE)
+        with self.lock:
+            self.queues[queue] = asyncio.get_running_loop()
+
+        return queue
+
+    def unsubscribe(self, queue):
+        """Stop sending events to the queue."""
+        with self.lock:
+            self.queues.pop(queue, None)
+
+    def has_subscribers(self, loop):
+        """Return True if streams of the loop are open."""
+        with self.lock:
+            return loop in self.queues.values()
+
+    def broadcast(self, events):
+        """Send the events to every open stream."""
+        with self.lock:
+            queues = list(self.queues.items())
+
+        for queue, loop in queues:
+            try:
+                loop.call_soon_threadsafe(put_events, queue, events)
+            except RuntimeError:
+                # The loop of the stream is closed.
+                self.unsubscribe(queue)
+
+
+hub = EventHub()
+
+
+async def get_events(last_id, limit):
+    """Return up to limit events after the id, oldest first."""
+    queryset = TaskEvent.objects.filter(pk__gt=last_id).order_by('pk')
+
+    return [event async for event in queryset[:limit]]
+
+
+async def aget_last_event_id():
+    """Return the id of the latest event from an async stream."""
+    event_ids = TaskEvent.objects.order_by('-pk').values_list('pk', flat=True)
+
+    return await event_ids.afirst() or 0
+
+
+class LocalBackend(object):
+    """Broadcast the events to the streams of the publishing process.
+
+    Enough for a single worker: the events reach the streams at once
+    and nothing polls the database.
+    """
+
+    def published(self, events):
+        """Broadcast the saved events."""
+        hub.broadcast(events)
+
+    def listen(self):
+        """Get ready to feed the streams of the running loop."""
+
+
+class DatabaseBackend(object):
+    """Poll the events table, so the streams get the events of all workers.
+
+    One poller per event loop reads the new events while streams are
+    open and broadcasts them in id order.
+    """
+
+    def __init__(self):
+        """Start without pollers."""
+        self.pollers = {}
+
+    def published(self, events):
+        """Leave the events to the pollers, which keep them in order."""
+
+    def listen(self):
+        """Start the poller of the running loop if it is not running."""
+        loop = asyncio.get_running_loop()
+        if loop not in self.pollers:
+            self.pollers[loop] = loop.create_task(self.poll(loop))
+
+    async def poll(self, loop):
+        """Broadcast the new events while streams of the loop are open."""
+        with ExitStack() as stack:
+            stack.callback(self.pollers.pop, loop, None)
+            last_id = await aget_last_event_id()
+            while hub.has_subscribers(loop):
+                events = await self.read_events(last_id)
+                if events:
+                    last_id = events[-1].pk
+                    hub.broadcast(events)
+
+    async def read_events(self, last_id):
+        """Wait for the poll interval and return the new events."""
+        await asyncio.sleep(POLL_INTERVAL)
+        try:
+            return await get_events(last_id, POLL_BATCH)
+        except DatabaseError:
+            return []
+
+
+BACKENDS = MappingProxyType({
+    'local': LocalBackend(),
+    'database': DatabaseBackend(),
+})
+
+
+def get_backend():
+    """Return the backend named by the TASK_EVENTS_BACKEND setting.
+
+    Raises:
+        ImproperlyConfigured: the setting names no backend.
+    """
+    name = settings.TASK_EVENTS_BACKEND
+    if name not in BACKENDS:
+        raise ImproperlyConfigured(
+            UNKNOWN_BACKEND_MESSAGE.format(name, ', '.join(BACKENDS)),
+        )
+
+    return BACKENDS[name]
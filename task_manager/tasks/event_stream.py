@@ -0,0 +1,122 @@
+"""Tasks application Server-Sent Events stream."""
+
+import asyncio
+import json
+from contextlib import ExitStack
+
+from task_manager.tasks.event_backends import (
+    CATCH_UP,
+    aget_last_event_id,
+    get_backend,
+    get_events,
+    hub,
+)
+from task_manager.tasks.models import TaskEvent
+
+# A client further behind reloads the page instead of replaying.
+REPLAY_LIMIT = 200
+HEARTBEAT_INTERVAL = 15
+# Streams end after a while and the browser reconnects with the last
+# event id. Django does not notice a client that went away during a
+# streaming response, so this also bounds how long such a stream runs.
+STREAM_DURATION = 60
+RETRY_MS = 2000
+
+HEARTBEAT = ': ping\n\n'
+RESET = 'event: reset\ndata: \n\n'
+EVENT = 'id: {0}\nevent: task\ndata: {1}\n\n'
+
+
+def get_last_event_id():
+    """Return the id of the latest event, 0 if there is none."""
+    event_ids = TaskEvent.objects.order_by('-pk').values_list('pk', flat=True)
+
+    return event_ids.first() or 0
+
+
+def format_events(events, last_id):
+    """Return the events after the id as Server-Sent Events and the new id.
+
+    Without such events a heartbeat comment is returned, which keeps
+    proxies from closing an idle stream.
+    """
+    chunks = []
+    for event in events:
+        if event.pk > last_id:
+            last_id = event.pk
+            chunks.append(EVENT.format(
+                event.pk,
+                json.dumps({'id': event.task_id, 'action': event.action}),
+            ))
+
+    return ''.join(chunks) or HEARTBEAT, last_id
+
+
+async def read_missed_events(last_id):
+    """Return the events after the id, or None if they are no longer all kept."""
+    events = await get_events(last_id, REPLAY_LIMIT + 1)
+    if len(events) > REPLAY_LIMIT:
+        return None
+    if events and events[0].pk > last_id + 1:
+        return None
+
+    return events
+
+
+async def wait_events(queue, last_id, timeout):
+    """Return the next broadcast events, [] on timeout, None to reset."""
+    try:
+        events = await asyncio.wait_for(queue.get(), timeout)
+    except asyncio.TimeoutError:
+        return []
+
+    if events is CATCH_UP:
+        return await read_missed_events(last_id)
+
+    return events
+
+
+async def get_first_events(last_id):
+    """Return the id the stream starts after and the events to replay."""
+    if last_id is None:
+        return await aget_last_event_id(), []
+
+    return last_id, await read_missed_events(last_id)
+
+
+async def stream_chunks(queue, last_id):
+    """Yield the events of the queue until the stream duration is over.
+
+    Yields:
+        The events after the id, or heartbeats, then a reset event if
+        the client fell too far behind.
+    """
+    deadline = asyncio.get_running_loop().time() + STREAM_DURATION
+    last_id, events = await get_first_events(last_id)
+    while events is not None:
+        chunk, last_id = format_events(events, last_id)
+        yield chunk
+        timeout = deadline - asyncio.get_running_loop().time()
+        if timeout <= 0:
+            return
+        events = await wait_events(queue, last_id, min(HEARTBEAT_INTERVAL, timeout))
+
+    yield RESET
+
+
+async def stream_events(last_id):
+    """Yield the events after the id, then the new ones as they come.
+
+    Without an id the stream starts from now. A client whose events
+    are no longer all kept gets a ``reset`` event and should reload.
+
+    Yields:
+        The chunks of the Server-Sent Events response.
+    """
+    queue = hub.subscribe()
+    with ExitStack() as stack:
+        stack.callback(hub.unsubscribe, queue)
+        get_backend().listen()
+        yield 'retry: {0}\n\n'.format(RETRY_MS)
+        async for chunk in stream_chunks(queue, last_id):
+            yield chunk
@@ -0,0 +1,64 @@
+"""Tasks application events, streamed to the tasks page."""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from task_manager.tasks.event_backends import get_backend
+from task_manager.tasks.models import (
+    CREATED,
+    DELETED,
+    UPDATED,
+    Relationships,
+    Task,
+    TaskEvent,
+)
+
+# The table keeps the latest events only. Older ones are never replayed.
+KEPT_EVENTS = 10000
+
+LABEL_ACTIONS = frozenset(('post_add', 'post_remove', 'post_clear'))
+
+
+def publish(action, task_ids):
+    """Record the events of the tasks once the transaction commits."""
+    task_ids = list(task_ids)
+    if task_ids:
+        transaction.on_commit(lambda: save_events(action, task_ids))
+
+
+def save_events(action, task_ids):
+    """Write the events, drop the oldest ones and notify the streams."""
+    events = TaskEvent.objects.bulk_create(
+        TaskEvent(task_id=task_id, action=action) for task_id in task_ids
+    )
+    oldest_kept = events[-1].pk - KEPT_EVENTS
+    TaskEvent.objects.filter(pk__lte=oldest_kept).delete()
+    get_backend().published(events)
+
+
+def task_saved(instance, created, **kwargs):
+    """Publish the creation or the change of a task."""
+    publish(CREATED if created else UPDATED, [instance.pk])
+
+
+def task_deleted(instance, **kwargs):
+    """Publish the deletion of a task."""
+    publish(DELETED, [instance.pk])
+
+
+def labels_changed(instance, action, reverse, pk_set, **kwargs):
+    """Publish a change of the tasks whose labels were added or removed."""
+    if action in LABEL_ACTIONS:
+        publish(UPDATED, (pk_set or ()) if reverse else [instance.pk])
+
+
+def watch_tasks():
+    """Publish the events of the tasks saved and deleted through the ORM.
+
+    ``update()`` and ``bulk_create()`` send no signals, their callers
+    publish the events themselves.
+    """
+    uid = 'task_events'
+    post_save.connect(task_saved, sender=Task, dispatch_uid=uid)
+    post_delete.connect(task_deleted, sender=Task, dispatch_uid=uid)
+    m2m_changed.connect(labels_changed, sender=Relationships, dispatch_uid=uid)
@@ -0,0 +1,145 @@
+"""Tasks application export."""
+
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+from types import MappingProxyType
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from task_manager.tasks.models import Relationships
+
+CHUNK_SIZE = 2000
+CREATED_AT = 'created_at'
+# Spreadsheets run a cell starting with one of these as a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@')
+FORMULA_ESCAPE = "'"
+
+EXPORT_COLUMNS = (
+    'id',
+    'name',
+    'description',
+    'status',
+    'executor',
+    'author',
+    'labels',
+    CREATED_AT,
+)
+EXPORT_FIELDS = (
+    'id',
+    'name',
+    'description',
+    'status__name',
+    'executor__first_name',
+    'executor__last_name',
+    'created_by__first_name',
+    'created_by__last_name',
+    CREATED_AT,
+)
+
+
+def get_full_name(first_name, last_name):
+    """Join the name parts like the full name of a user."""
+    if first_name is None:
+        return ''
+
+    return '{0} {1}'.format(first_name, last_name).strip()
+
+
+def get_labels(task_ids):
+    """Return the label names of each task, queried for the whole batch."""
+    labels = defaultdict(list)
+    relationships = Relationships.objects.filter(
+        task_id__in=task_ids,
+    ).order_by('label__name').values_list('task_id', 'label__name')
+
+    for task_id, label_name in relationships:
+        labels[task_id].append(label_name)
+
+    return labels
+
+
+def export_rows(queryset):
+    """Yield one dict per task without loading the queryset in memory.
+
+    The tasks are read from a server-side cursor where the database
+    supports one, and the labels are fetched once per chunk of tasks.
+
+    Yields:
+        The exported columns of a task.
+    """
+    rows = queryset.order_by(CREATED_AT, 'id').values_list(
+        *EXPORT_FIELDS,
+    ).iterator(chunk_size=CHUNK_SIZE)
+
+    while True:
+        chunk = list(islice(rows, CHUNK_SIZE))
+        if not chunk:
+            return
+
+        labels = get_labels([row[0] for row in chunk])
+        yield from (
+            dict(zip(EXPORT_COLUMNS, (
+                row[0],
+                row[1],
+                row[2],
+                row[3],
+                get_full_name(row[4], row[5]),
+                get_full_name(row[6], row[7]),
+                labels[row[0]],
+                row[8],
+            )))
+            for row in chunk
+        )
+
+
+def escape_formula(cell):
+    """Prefix a text cell that a spreadsheet would run as a formula."""
+    if isinstance(cell, str) and cell.startswith(FORMULA_PREFIXES):
+        return '{0}{1}'.format(FORMULA_ESCAPE, cell)
+
+    return cell
+
+
+class Echo(object):
+    """File-like object that returns what is written to it."""
+
+    def write(self, line):
+        """Return the line instead of buffering it."""
+        return line
+
+
+def stream_csv(queryset):
+    """Yield the tasks as CSV lines.
+
+    Yields:
+        The header line, then one line per task.
+    """
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in export_rows(queryset):
+        row['labels'] = ', '.join(row['labels'])
+        row[CREATED_AT] = row[CREATED_AT].isoformat()
+        yield writer.writerow(escape_formula(cell) for cell in row.values())
+
+
+def stream_json(queryset):
+    """Yield the tasks as a JSON array, one object at a time.
+
+    Yields:
+        The parts of the JSON array.
+    """
+    separator = '['
+    for row in export_rows(queryset):
+        yield separator + json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False)
+        separator = ',\n'
+
+    yield '[]' if separator == '[' else ']'
+
+
+EXPORTERS = MappingProxyType({
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'json': (stream_json, 'application/json'),
+})
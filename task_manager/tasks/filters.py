@@ -2,17 +2,47 @@
 
 import django_filters
 from django import forms
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
-from task_manager.tasks.models import Label, Task
+from task_manager.fields import CachedModelChoiceField
+from task_manager.labels.choices import label_choices
+from task_manager.statuses.choices import status_choices
+from task_manager.tasks.models import Label, Relationships, Status, Task, User
+from task_manager.tasks.search import search
+from task_manager.widgets import AutocompleteSelect
+
+
+class CachedModelChoiceFilter(django_filters.ModelChoiceFilter):
+    """Model choice filter validated against cached choices."""
+
+    field_class = CachedModelChoiceField
 
 
 class TasktFilter(django_filters.FilterSet):
     """Tasks filte."""
 
-    labels = django_filters.ModelChoiceFilter(
+    search = django_filters.CharFilter(
+        label=_('Search'),
+        method='filter_by_text',
+    )
+    status = CachedModelChoiceFilter(
+        label=_('Status'),
+        queryset=Status.objects.all(),
+        cached_choices=status_choices,
+        widget=AutocompleteSelect('statuses:autocomplete'),
+    )
+    executor = django_filters.ModelChoiceFilter(
+        label=_('Executor'),
+        queryset=User.objects.all(),
+        widget=AutocompleteSelect('users:autocomplete'),
+    )
+    labels = CachedModelChoiceFilter(
         label=_('Label'),
         queryset=Label.objects.all(),
+        cached_choices=label_choices,
+        method='filter_by_label',
+        widget=AutocompleteSelect('labels:autocomplete'),
     )
     self_tasks = django_filters.BooleanFilter(
         label=_('Only your own tasks'),
@@ -20,6 +50,22 @@ class TasktFilter(django_filters.FilterSet):
         widget=forms.CheckboxInput,
     )
 
+    def filter_by_text(self, queryset, query_name, query_value):
+        return search(queryset, query_value) if query_value else queryset
+
+    def filter_by_label(self, queryset, query_name, query_value):
+        if not query_value:
+            return queryset
+
+        # A semi-join never repeats a task, so no DISTINCT (and no extra
+        # sort) is needed on top of it.
+        relationships = Relationships.objects.filter(
+            task=OuterRef('pk'),
+            label=query_value,
+        )
+
+        return queryset.filter(Exists(relationships))
+
     def filter_by_current_user(self, queryset, query_name, query_value):
         author = getattr(self.request, 'user', None)
 
@@ -27,4 +73,4 @@ class TasktFilter(django_filters.FilterSet):
 
     class Meta(object):
         model = Task
-        fields = ('status', 'executor', 'labels', 'self_tasks')
+        fields = ('search', 'status', 'executor', 'labels', 'self_tasks')
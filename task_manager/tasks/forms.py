@@ -1,13 +1,187 @@
 """Tasks application forms."""
 
-from django.forms import ModelForm
+from django import forms
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
 
-from task_manager.tasks.models import Task
+from task_manager.caching import bump_version
+from task_manager.fields import CachedModelChoiceField, CachedModelMultipleChoiceField
+from task_manager.labels.choices import label_choices
+from task_manager.statuses.choices import status_choices
+from task_manager.tasks import events
+from task_manager.tasks.jobs import notify_executor
+from task_manager.tasks.models import UPDATED, Label, Relationships, Status, Task, User
+from task_manager.tasks.readers import get_format
+from task_manager.widgets import AutocompleteSelect, AutocompleteSelectMultiple
 
+ACTION_STATUS = 'status'
+ACTION_EXECUTOR = 'executor'
+ACTION_LABELS = 'labels'
+ACTION_DELETE = 'delete'
 
-class TaskForm(ModelForm):
+BULK_ACTIONS = (
+    (ACTION_STATUS, _('Change status')),
+    (ACTION_EXECUTOR, _('Reassign')),
+    (ACTION_LABELS, _('Add labels')),
+    (ACTION_DELETE, _('Delete')),
+)
+
+BULK_PERMISSION_DENIED_MESSAGE = _('Only the author of the task can delete it.')
+
+IMPORT_FORMAT_MESSAGE = _('Upload a CSV or JSON file.')
+
+
+class TaskForm(forms.ModelForm):
     """Task form."""
 
+    status = CachedModelChoiceField(
+        queryset=Status.objects.all(),
+        cached_choices=status_choices,
+        label=_('Status'),
+        widget=AutocompleteSelect('statuses:autocomplete'),
+    )
+    labels = CachedModelMultipleChoiceField(
+        queryset=Label.objects.all(),
+        cached_choices=label_choices,
+        required=False,
+        label=_('Labels'),
+        widget=AutocompleteSelectMultiple('labels:autocomplete'),
+    )
+
     class Meta(object):
         model = Task
         fields = ('name', 'description', 'status', 'executor', 'labels')
+        widgets = {
+            'executor': AutocompleteSelect('users:autocomplete'),
+        }
+
+    def save(self, commit=True):
+        """Save the task and queue a notification for a new executor."""
+        task = super().save(commit)
+        reassigned = Task.executor.field.name in self.changed_data
+        if commit and task.executor_id and reassigned:
+            notify_executor([task.pk], task.executor_id)
+
+        return task
+
+
+class TaskBulkForm(forms.Form):
+    """Apply one action to many tasks at once."""
+
+    tasks = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.only('id'),
+        widget=forms.MultipleHiddenInput,
+    )
+    action = forms.ChoiceField(choices=BULK_ACTIONS, label=_('Action'))
+    status = CachedModelChoiceField(
+        queryset=Status.objects.all(),
+        cached_choices=status_choices,
+        required=False,
+        label=_('Status'),
+        widget=AutocompleteSelect('statuses:autocomplete'),
+    )
+    executor = forms.ModelChoiceField(
+        queryset=User.objects.all(),
+        required=False,
+        label=_('Executor'),
+        widget=AutocompleteSelect('users:autocomplete'),
+    )
+    labels = CachedModelMultipleChoiceField(
+        queryset=Label.objects.all(),
+        cached_choices=label_choices,
+        required=False,
+        label=_('Labels'),
+        widget=AutocompleteSelectMultiple('labels:autocomplete'),
+    )
+
+    def __init__(self, *args, user, **kwargs):
+        """Remember the user the action is applied by."""
+        super().__init__(*args, **kwargs)
+        self.user = user
+
+    def clean(self):
+        """Check the action argument and the authorship of deleted tasks.
+
+        Raises:
+            ValidationError: a task to delete was created by another user.
+        """
+        cleaned_data = super().clean()
+        action = cleaned_data.get('action')
+        tasks = cleaned_data.get('tasks')
+
+        needs_argument = action in {ACTION_STATUS, ACTION_LABELS}
+        if needs_argument and not cleaned_data.get(action):
+            self.add_error(action, self.fields[action].error_messages['required'])
+
+        if action == ACTION_DELETE and tasks is not None:
+            if tasks.exclude(created_by=self.user).exists():
+                raise forms.ValidationError(BULK_PERMISSION_DENIED_MESSAGE)
+
+        return cleaned_data
+
+    def save(self):
+        """Apply the action to the selected tasks in one transaction."""
+        action = self.cleaned_data['action']
+        tasks = self.cleaned_data['tasks']
+
+        with transaction.atomic():
+            if action == ACTION_DELETE:
+                tasks.delete()
+            elif action == ACTION_LABELS:
+                Relationships.objects.bulk_create(
+                    (
+                        Relationships(task_id=task.pk, label_id=label.pk)
+                        for task in tasks
+                        for label in self.cleaned_data['labels']
+                    ),
+                    ignore_conflicts=True,
+                )
+                # bulk_create() and update() send no signals.
+                transaction.on_commit(lambda: bump_version(Relationships))
+                events.publish(UPDATED, (task.pk for task in tasks))
+            else:
+                # update() drops the tasks read by the form validation.
+                task_pks = [task.pk for task in tasks]
+                tasks.update(**{action: self.cleaned_data[action]})
+                transaction.on_commit(lambda: bump_version(Task))
+                events.publish(UPDATED, task_pks)
+                if action == ACTION_EXECUTOR and self.cleaned_data[action]:
+                    notify_executor(task_pks, self.cleaned_data[action].pk)
+
+
+class TaskMoveForm(forms.Form):
+    """Move a task to another status from the board."""
+
+    status = CachedModelChoiceField(
+        queryset=Status.objects.all(),
+        cached_choices=status_choices,
+    )
+
+    def save(self, task_pk):
+        """Change the status with a single UPDATE, return the row count."""
+        updated = Task.objects.filter(pk=task_pk).update(
+            status=self.cleaned_data['status'],
+        )
+        if updated:
+            transaction.on_commit(lambda: bump_version(Task))
+            events.publish(UPDATED, [task_pk])
+
+        return updated
+
+
+class TaskImportForm(forms.Form):
+    """Task import file form."""
+
+    upload = forms.FileField(label=_('File'))
+
+    def clean_upload(self):
+        """Check that the file format is known.
+
+        Raises:
+            ValidationError: the file extension is not a known format.
+        """
+        upload = self.cleaned_data['upload']
+        if get_format(upload.name) is None:
+            raise forms.ValidationError(IMPORT_FORMAT_MESSAGE)
+
+        return upload
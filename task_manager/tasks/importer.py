@@ -0,0 +1,296 @@
+"""Tasks application import."""
+
+import io
+from contextlib import ExitStack
+from itertools import islice
+
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.caching import bump_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import events
+from task_manager.tasks.models import CREATED, Relationships, Task
+from task_manager.tasks.readers import READ_ERRORS, READERS
+from task_manager.users.models import User
+
+BATCH_SIZE = 500
+NAME = 'name'
+NAME_MAX_LENGTH = Task.name.field.max_length
+RELATED_NAME_MAX_LENGTH = min(
+    Status.name.field.max_length,
+    Label.name.field.max_length,
+)
+
+INVALID_RECORD_MESSAGE = _('The record is not an object.')
+INVALID_FIELD_MESSAGE = _('The field "{field}" is not a string.')
+INVALID_LABELS_MESSAGE = _('The labels are not a list of names.')
+NAME_REQUIRED_MESSAGE = _('The task name is required.')
+NAME_TOO_LONG_MESSAGE = _('The task name is too long.')
+NAME_TAKEN_MESSAGE = _('A task named "{name}" already exists.')
+RELATED_NAME_TOO_LONG_MESSAGE = _('The name "{name}" is too long.')
+STATUS_REQUIRED_MESSAGE = _('The task status is required.')
+UNKNOWN_USER_MESSAGE = _('Unknown user "{username}".')
+UNREADABLE_FILE_MESSAGE = _(
+    'Unable to read the file: {error}. Tasks imported before: {count}.',
+)
+
+
+class UnreadableFileError(ValueError):
+    """The import file cannot be read any further."""
+
+
+def get_text(record, field):
+    """Return a text field of the record, empty if it is missing.
+
+    Raises:
+        ValueError: the field holds something else than a string.
+    """
+    text = record.get(field)
+    if text is None:
+        return ''
+    if not isinstance(text, str):
+        raise ValueError(INVALID_FIELD_MESSAGE.format(field=field))
+
+    return text
+
+
+def clean_related_name(name):
+    """Return the stripped status or label name.
+
+    Raises:
+        ValueError: the name is too long.
+    """
+    name = name.strip()
+    if len(name) > RELATED_NAME_MAX_LENGTH:
+        raise ValueError(RELATED_NAME_TOO_LONG_MESSAGE.format(name=name))
+
+    return name
+
+
+class NameIds(object):
+    """Ids of the statuses or labels by name, creating the missing ones.
+
+    A status or label is committed as soon as it is created, so the ids
+    stay valid when the transaction of a batch rolls back.
+    """
+
+    def __init__(self, model):
+        """Load the ids of the existing rows."""
+        self.model = model
+        self.ids = dict(model.objects.values_list(NAME, 'pk'))
+
+    def __getitem__(self, name):
+        """Return the id of the name, creating the row if it is missing."""
+        if name not in self.ids:
+            instance, _created = self.model.objects.get_or_create(name=name)
+            self.ids[name] = instance.pk
+
+        return self.ids[name]
+
+
+class RecordCleaner(object):
+    """Validate import records and turn them into unsaved tasks.
+
+    CSV records hold strings only. JSON records must be objects of
+    strings, with the labels as a list of names or a comma-separated
+    string. Task names are checked against the existing tasks and the
+    records cleaned before. Missing statuses and labels are created
+    once the rest of the record is valid.
+    """
+
+    def __init__(self, author):
+        """Load the names and remember the default author."""
+        self.author = author
+        self.users = dict(User.objects.values_list('username', 'pk'))
+        self.statuses = NameIds(Status)
+        self.labels = NameIds(Label)
+        self.names = set()
+
+    def clean_batch(self, batch, errors):
+        """Return (task, label ids) of the valid records.
+
+        The errors of the other records are added to errors.
+        """
+        taken = self.get_taken_names(batch)
+        cleaned = []
+
+        for number, record in batch:
+            try:
+                cleaned.append(self.clean(record, taken))
+            except ValueError as error:
+                errors.append((number, str(error)))
+
+        return cleaned
+
+    def get_taken_names(self, batch):
+        """Return the names of the batch that existing tasks already have."""
+        names = [
+            record.get(NAME)
+            for _number, record in batch
+            if isinstance(record, dict)
+        ]
+
+        return set(Task.objects.filter(name__in=names).values_list(NAME, flat=True))
+
+    def clean(self, record, taken):
+        """Return an unsaved task and its label ids.
+
+        Raises:
+            ValueError: the record is not a valid task.
+        """
+        if not isinstance(record, dict):
+            raise ValueError(INVALID_RECORD_MESSAGE)
+
+        name = self.clean_name(get_text(record, NAME), taken)
+        status = clean_related_name(get_text(record, 'status'))
+        if not status:
+            raise ValueError(STATUS_REQUIRED_MESSAGE)
+        label_names = self.clean_labels(record.get('labels'))
+        task = Task(
+            name=name,
+            description=get_text(record, 'description'),
+            executor_id=self.get_user(get_text(record, 'executor')),
+            created_by_id=(
+                self.get_user(get_text(record, 'author')) or self.author.pk
+            ),
+        )
+
+        task.status_id = self.statuses[status]
+        self.names.add(name)
+
+        return task, {self.labels[label_name] for label_name in label_names}
+
+    def clean_name(self, name, taken):
+        """Return the stripped task name.
+
+        Raises:
+            ValueError: the name is empty, too long or taken.
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError(NAME_REQUIRED_MESSAGE)
+        if len(name) > NAME_MAX_LENGTH:
+            raise ValueError(NAME_TOO_LONG_MESSAGE)
+        if name in taken or name in self.names:
+            raise ValueError(NAME_TAKEN_MESSAGE.format(name=name))
+
+        return name
+
+    def clean_labels(self, labels):
+        """Return the label names of a record.
+
+        Raises:
+            ValueError: the labels are neither a list of strings nor a string.
+        """
+        if labels is None:
+            return []
+        if isinstance(labels, str):
+            labels = labels.split(',')
+
+        valid = isinstance(labels, list) and all(
+            isinstance(label_name, str) for label_name in labels
+        )
+        if not valid:
+            raise ValueError(INVALID_LABELS_MESSAGE)
+
+        names = (clean_related_name(label_name) for label_name in labels)
+
+        return [label_name for label_name in names if label_name]
+
+    def get_user(self, username):
+        """Return the id of the user with the username, if any.
+
+        Raises:
+            ValueError: there is no such user.
+        """
+        username = username.strip()
+        if not username:
+            return None
+        if username not in self.users:
+            raise ValueError(UNKNOWN_USER_MESSAGE.format(username=username))
+
+        return self.users[username]
+
+
+class TaskImporter(object):
+    """Create tasks, statuses and labels from a stream of records.
+
+    The records of a batch are cleaned first, creating the missing
+    statuses and labels. The tasks are then inserted with bulk_create,
+    one transaction per batch. Invalid records are reported without
+    stopping the import.
+    """
+
+    def __init__(self, author, batch_size=BATCH_SIZE):
+        """Remember the default author and the batch size."""
+        self.batch_size = batch_size
+        self.created = 0
+        self.errors = []
+        self.cleaner = RecordCleaner(author)
+
+    def run(self, records):
+        """Import the (number, record) pairs and return self.
+
+        The batches imported before an unreadable part of the records stay.
+        """
+        records = iter(records)
+        batch = self.read_batch(records)
+
+        while batch:
+            self.import_batch(batch)
+            batch = self.read_batch(records)
+
+        return self
+
+    def read_batch(self, records):
+        """Return the next batch of records.
+
+        Raises:
+            UnreadableFileError: the records cannot be read any further.
+        """
+        try:
+            return list(islice(records, self.batch_size))
+        except READ_ERRORS as error:
+            raise UnreadableFileError(UNREADABLE_FILE_MESSAGE.format(
+                error=error,
+                count=self.created,
+            )) from error
+
+    def import_batch(self, batch):
+        """Validate and insert one batch of records."""
+        cleaned = self.cleaner.clean_batch(batch, self.errors)
+
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create([task for task, _label_ids in cleaned])
+            Relationships.objects.bulk_create(
+                Relationships(task_id=task.pk, label_id=label_id)
+                for task, label_ids in cleaned
+                for label_id in label_ids
+            )
+
+            transaction.on_commit(self.bump_versions)
+            events.publish(CREATED, (task.pk for task in tasks))
+
+        self.created += len(tasks)
+
+    def bump_versions(self):
+        """Expire the cached pages of the imported tasks.
+
+        bulk_create() sends no signals.
+        """
+        bump_version(Task)
+        bump_version(Relationships)
+
+
+def import_file(binary_file, file_format, author, batch_size=BATCH_SIZE):
+    """Import tasks from a binary file object and return the importer."""
+    importer = TaskImporter(author, batch_size=batch_size)
+
+    with ExitStack() as stack:
+        stream = io.TextIOWrapper(binary_file, encoding='utf-8-sig', newline='')
+        # Detached, the wrapper leaves the file open for its owner.
+        stack.callback(stream.detach)
+
+        return importer.run(READERS[file_format](stream))
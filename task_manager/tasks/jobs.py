@@ -0,0 +1,81 @@
+"""Tasks application background jobs."""
+
+import tempfile
+from types import SimpleNamespace
+
+from django.core.files import File
+from django.core.mail import send_mail
+from django.http import QueryDict
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.jobs.queue import enqueue, register
+from task_manager.tasks import counters
+from task_manager.tasks.export import EXPORTERS
+from task_manager.tasks.filters import TasktFilter
+from task_manager.tasks.models import Task, User
+
+EXPORT_JOB = 'tasks.export'
+REBUILD_COUNTERS_JOB = 'tasks.rebuild_counters'
+NOTIFY_ASSIGNMENT_JOB = 'tasks.notify_assignment'
+
+INVALID_FILTER_MESSAGE = 'Invalid filter: {0}'
+ASSIGNMENT_SUBJECT = _('Task "{name}" is assigned to you')
+ASSIGNMENT_MESSAGE = _('{author} assigned the task "{name}" to you.')
+
+
+@register(EXPORT_JOB, verbose_name=_('Tasks export'), max_attempts=3)
+def export_tasks(export_format, query, user_id):
+    """Return the tasks matched by the tasks page filter as a file.
+
+    Raises:
+        ValueError: the query is not a valid filter of the tasks page.
+    """
+    stream = EXPORTERS[export_format][0]
+    # The filter only reads the user of the request.
+    request = SimpleNamespace(user=User.objects.get(pk=user_id))
+    filterset = TasktFilter(
+        QueryDict(query),
+        queryset=Task.objects.all(),
+        request=request,
+    )
+    if not filterset.is_valid():
+        raise ValueError(INVALID_FILTER_MESSAGE.format(filterset.errors.as_json()))
+
+    # The rows are written as they are read, so memory stays flat.
+    output = tempfile.TemporaryFile()
+    for chunk in stream(filterset.qs):
+        output.write(chunk.encode())
+    output.seek(0)
+
+    return File(output, name='tasks.{0}'.format(export_format))
+
+
+@register(REBUILD_COUNTERS_JOB, verbose_name=_('Task counters rebuild'))
+def rebuild_counters(database='default'):
+    """Recompute the task counters."""
+    counters.rebuild(database)
+
+
+@register(NOTIFY_ASSIGNMENT_JOB, verbose_name=_('Assignment notification'))
+def notify_assignment(task_id, executor_id):
+    """Email the executor of the task, unless it changed since."""
+    task = Task.objects.select_related('executor', 'created_by').filter(
+        pk=task_id,
+        executor_id=executor_id,
+    ).first()
+    if task is None or not task.executor.email:
+        return
+
+    names = {'name': task.name, 'author': task.created_by}
+    send_mail(
+        ASSIGNMENT_SUBJECT.format(**names),
+        ASSIGNMENT_MESSAGE.format(**names),
+        None,
+        [task.executor.email],
+    )
+
+
+def notify_executor(task_pks, executor_pk):
+    """Queue the emails telling the executor about the assigned tasks."""
+    for task_pk in task_pks:
+        enqueue(NOTIFY_ASSIGNMENT_JOB, task_id=task_pk, executor_id=executor_pk)
@@ -0,0 +1 @@
+"""Tasks application management commands."""
@@ -0,0 +1,123 @@
+"""Explain the task list query for every filter combination."""
+
+import re
+from itertools import combinations
+from types import MappingProxyType, SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TasktFilter
+from task_manager.tasks.views import TASKS_PER_PAGE, IndexView
+from task_manager.users.models import User
+
+FILTERS = ('status', 'executor', 'labels', 'self_tasks')
+
+# A plain "SCAN table" in SQLite reads the whole table, while
+# "SCAN table USING INDEX" walks an index in order and is fine.
+SEQUENTIAL_SCANS = MappingProxyType({
+    'sqlite': re.compile(r'\bSCAN (\w+)\s*$', re.MULTILINE),
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+})
+
+NO_DATA_MESSAGE = 'There are no users, statuses or labels to filter by.'
+UNSUPPORTED_MESSAGE = 'Unsupported database: {0}.'
+SCANNED_MESSAGE = '{0} filter combinations scan a table.'
+
+
+def get_combinations():
+    """Return every non-empty combination of the task filters.
+
+    Yields:
+        The names of the filters of a combination.
+    """
+    for size in range(1, len(FILTERS) + 1):
+        yield from combinations(FILTERS, size)
+
+
+class Command(BaseCommand):
+    """Explain filtered task list queries."""
+
+    help = 'Run EXPLAIN for every TasktFilter combination and report scans.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--fail-on-scan',
+            action='store_true',
+            help='Exit with an error if any plan has a sequential scan.',
+        )
+
+    def handle(self, *args, **options):
+        """Explain the queries.
+
+        Raises:
+            CommandError: the database is not supported, or a plan scans a
+                table with --fail-on-scan.
+        """
+        pattern = SEQUENTIAL_SCANS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(UNSUPPORTED_MESSAGE.format(connection.vendor))
+
+        sample_data = self.get_sample_data()
+        scanned = 0
+
+        for combination in get_combinations():
+            plan = self.explain(combination, sample_data)
+            if options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+            scanned += self.report(combination, set(pattern.findall(plan)))
+
+        if scanned and options['fail_on_scan']:
+            raise CommandError(SCANNED_MESSAGE.format(scanned))
+
+    def get_sample_data(self):
+        """Return a value of every filter, taken from the first rows.
+
+        Raises:
+            CommandError: a table to filter by is empty.
+        """
+        sample_data = {
+            'status': Status.objects.values_list('pk', flat=True).first(),
+            'executor': User.objects.first(),
+            'labels': Label.objects.values_list('pk', flat=True).first(),
+            'self_tasks': True,
+        }
+        if None in sample_data.values():
+            raise CommandError(NO_DATA_MESSAGE)
+
+        return sample_data
+
+    def explain(self, combination, sample_data):
+        """Return the plan of the first page of the filtered task list.
+
+        Raises:
+            CommandError: the filter rejects the sample data.
+        """
+        filterset = TasktFilter(
+            {name: sample_data[name] for name in combination},
+            queryset=IndexView.queryset,
+            request=SimpleNamespace(user=sample_data['executor']),
+        )
+        if not filterset.is_valid():
+            raise CommandError(filterset.errors.as_text())
+
+        queryset = filterset.qs.order_by(*IndexView.keyset_ordering)
+
+        return queryset[:TASKS_PER_PAGE + 1].explain()
+
+    def report(self, combination, tables):
+        """Print whether the plan scans tables and return True if it does."""
+        name = ' + '.join(combination)
+        if not tables:
+            self.stdout.write(self.style.SUCCESS('{0}: OK'.format(name)))
+            return False
+
+        self.stdout.write(self.style.WARNING('{0}: sequential scan on {1}'.format(
+            name,
+            ', '.join(sorted(tables)),
+        )))
+        return True
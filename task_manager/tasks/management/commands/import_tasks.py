@@ -0,0 +1,84 @@
+"""Import tasks from a CSV or JSON file."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.tasks.importer import BATCH_SIZE, UnreadableFileError, import_file
+from task_manager.tasks.readers import FORMATS, get_format
+from task_manager.users.models import User
+
+
+class Command(BaseCommand):
+    """Import tasks, statuses and labels."""
+
+    help = 'Import tasks, statuses and labels from a CSV or JSON file.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            'path',
+            help='File with name, description, status, executor, author, labels.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='File format, guessed from the extension by default.',
+        )
+        parser.add_argument(
+            '--author',
+            required=True,
+            help='Username of the author of tasks without an author.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Number of tasks inserted per transaction.',
+        )
+
+    def handle(self, *args, **options):
+        """Import the file and print the errors.
+
+        Raises:
+            CommandError: the format is unknown.
+        """
+        file_format = options['format'] or get_format(options['path'])
+        if file_format is None:
+            raise CommandError('Unable to guess the format, use --format.')
+
+        importer = self.import_file(
+            options['path'],
+            file_format,
+            self.get_author(options['author']),
+            options['batch_size'],
+        )
+
+        for number, message in importer.errors:
+            self.stderr.write('Record {0}: {1}'.format(number, message))
+
+        self.stdout.write('Imported {0} tasks, {1} records skipped.'.format(
+            importer.created,
+            len(importer.errors),
+        ))
+
+    def import_file(self, path, file_format, author, batch_size):
+        """Import the file and return the importer.
+
+        Raises:
+            CommandError: the file cannot be read to the end.
+        """
+        with open(path, 'rb') as binary_file:
+            try:
+                return import_file(binary_file, file_format, author, batch_size)
+            except UnreadableFileError as error:
+                raise CommandError(str(error))
+
+    def get_author(self, username):
+        """Return the user with the username.
+
+        Raises:
+            CommandError: there is no such user.
+        """
+        try:
+            return User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError('Unknown user "{0}".'.format(username))
@@ -0,0 +1,54 @@
+"""Check or rebuild the task counters."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.jobs.queue import enqueue
+from task_manager.tasks import counters
+from task_manager.tasks.jobs import REBUILD_COUNTERS_JOB
+
+CHECK = 'check'
+REBUILD = 'rebuild'
+
+COUNTER_MESSAGE = '{0} {1}: expected {2}, stored {3}'
+MISMATCH_MESSAGE = '{0} counters do not match, run "task_counters rebuild".'
+
+
+class Command(BaseCommand):
+    """Compare the task counters with the tasks or recompute them."""
+
+    help = 'Check or rebuild the counters of tasks per status, executor and label.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('action', choices=(CHECK, REBUILD))
+        parser.add_argument('--database', default='default')
+        parser.add_argument(
+            '--defer',
+            action='store_true',
+            help='Queue the rebuild for "run_worker" instead of running it.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the action and print the result.
+
+        Raises:
+            CommandError: the counters do not match the tasks.
+        """
+        if options['action'] == REBUILD and options['defer']:
+            enqueue(REBUILD_COUNTERS_JOB, database=options['database'])
+            self.stdout.write('Counters rebuild queued.')
+            return
+
+        if options['action'] == REBUILD:
+            counters.rebuild(options['database'])
+            self.stdout.write('Counters rebuilt.')
+            return
+
+        mismatches = counters.check(options['database'])
+        for mismatch in mismatches:
+            self.stdout.write(COUNTER_MESSAGE.format(*mismatch))
+
+        if mismatches:
+            raise CommandError(MISMATCH_MESSAGE.format(len(mismatches)))
+
+        self.stdout.write('Counters match the tasks.')
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:41
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+import django.db.models.deletion
+
+
+def remove_duplicates(apps, schema_editor):
+    Relationships = apps.get_model('tasks', 'Relationships')
+    duplicates = (
+        Relationships.objects.values('task', 'label')
+        .annotate(first_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+    )
+
+    for duplicate in duplicates.iterator():
+        Relationships.objects.filter(
+            task=duplicate['task'],
+            label=duplicate['label'],
+        ).exclude(id=duplicate['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='relationships',
+            constraint=models.UniqueConstraint(fields=('task', 'label'), name='tasks_unique_task_label'),
+        ),
+        migrations.AlterField(
+            model_name='relationships',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tasks.task'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+from django.db import migrations
+
+# A frozen copy of the search index of task_manager.tasks.search.
+# SQLite: an external content FTS5 table over tasks_task, kept up to
+# date by triggers, with the name weighing ten times the description.
+SQLITE_INSTALL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_task_fts USING fts5(
+        name, description, content='tasks_task', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert
+    AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete
+    AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update
+    AFTER UPDATE OF name, description ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    "INSERT INTO tasks_task_fts (tasks_task_fts) VALUES ('rebuild')",
+    """
+    INSERT INTO tasks_task_fts (tasks_task_fts, rank)
+    VALUES ('rank', 'bm25(10.0, 1.0)')
+    """,
+)
+SQLITE_UNINSTALL = (
+    'DROP TRIGGER IF EXISTS tasks_task_fts_insert',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_delete',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_update',
+    'DROP TABLE IF EXISTS tasks_task_fts',
+)
+
+# PostgreSQL: a GIN index over the weighted document expression.
+POSTGRESQL_INSTALL = (
+    """
+    CREATE INDEX IF NOT EXISTS tasks_task_search_idx ON tasks_task USING gin ((
+        setweight(to_tsvector('simple'::regconfig, name), 'A') ||
+        setweight(to_tsvector('simple'::regconfig, description), 'D')
+    ))
+    """,
+)
+POSTGRESQL_UNINSTALL = ('DROP INDEX IF EXISTS tasks_task_search_idx',)
+
+INSTALL = {'sqlite': SQLITE_INSTALL, 'postgresql': POSTGRESQL_INSTALL}
+UNINSTALL = {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRESQL_UNINSTALL}
+
+
+def install(apps, schema_editor):
+    """Create the search index of the database backend."""
+    for statement in INSTALL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+
+def uninstall(apps, schema_editor):
+    """Drop the search index of the database backend."""
+    for statement in UNINSTALL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+    """Index the task names and descriptions for the full-text search."""
+
+    dependencies = [
+        ('tasks', '0007_unique_relationships'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,213 @@
+from django.db import migrations, models
+from django.db.models import Count, Value
+from django.db.models.functions import Coalesce
+
+# A frozen copy of the triggers of task_manager.tasks.counters: they keep
+# the counters in the same transaction as every write to the tasks and
+# their labels. Tasks without an executor are counted under the id 0.
+UPSERT = (
+    'INSERT INTO tasks_taskcounter (dimension, object_id, count) '
+    "VALUES ('{0}', {1}, {2}) "
+    'ON CONFLICT (dimension, object_id) '
+    'DO UPDATE SET count = tasks_taskcounter.count + excluded.count'
+)
+UNASSIGNED = 0
+OLD_EXECUTOR = 'coalesce(old.executor_id, {0})'.format(UNASSIGNED)
+NEW_EXECUTOR = 'coalesce(new.executor_id, {0})'.format(UNASSIGNED)
+SQLITE_INSTALL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_task_insert
+    AFTER INSERT ON tasks_task BEGIN
+        {0};
+        {1};
+    END
+    """.format(
+        UPSERT.format('status', 'new.status_id', 1),
+        UPSERT.format('executor', NEW_EXECUTOR, 1),
+    ),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_task_delete
+    AFTER DELETE ON tasks_task BEGIN
+        {0};
+        {1};
+    END
+    """.format(
+        UPSERT.format('status', 'old.status_id', -1),
+        UPSERT.format('executor', OLD_EXECUTOR, -1),
+    ),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_task_status
+    AFTER UPDATE OF status_id ON tasks_task
+    WHEN old.status_id IS NOT new.status_id BEGIN
+        {0};
+        {1};
+    END
+    """.format(
+        UPSERT.format('status', 'old.status_id', -1),
+        UPSERT.format('status', 'new.status_id', 1),
+    ),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_task_executor
+    AFTER UPDATE OF executor_id ON tasks_task
+    WHEN old.executor_id IS NOT new.executor_id BEGIN
+        {0};
+        {1};
+    END
+    """.format(
+        UPSERT.format('executor', OLD_EXECUTOR, -1),
+        UPSERT.format('executor', NEW_EXECUTOR, 1),
+    ),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_label_insert
+    AFTER INSERT ON tasks_relationships BEGIN
+        {0};
+    END
+    """.format(UPSERT.format('label', 'new.label_id', 1)),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_label_delete
+    AFTER DELETE ON tasks_relationships BEGIN
+        {0};
+    END
+    """.format(UPSERT.format('label', 'old.label_id', -1)),
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_counter_label_update
+    AFTER UPDATE OF label_id ON tasks_relationships
+    WHEN old.label_id IS NOT new.label_id BEGIN
+        {0};
+        {1};
+    END
+    """.format(
+        UPSERT.format('label', 'old.label_id', -1),
+        UPSERT.format('label', 'new.label_id', 1),
+    ),
+)
+SQLITE_UNINSTALL = tuple(
+    'DROP TRIGGER IF EXISTS {0}'.format(name)
+    for name in (
+        'tasks_counter_task_insert',
+        'tasks_counter_task_delete',
+        'tasks_counter_task_status',
+        'tasks_counter_task_executor',
+        'tasks_counter_label_insert',
+        'tasks_counter_label_delete',
+        'tasks_counter_label_update',
+    )
+)
+POSTGRESQL_TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION {0}() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            {1};
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            {2};
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+POSTGRESQL_INSTALL = (
+    POSTGRESQL_TRIGGER_FUNCTION.format(
+        'tasks_counter_task',
+        '{0}; {1}'.format(
+            UPSERT.format('status', 'old.status_id', -1),
+            UPSERT.format('executor', OLD_EXECUTOR, -1),
+        ),
+        '{0}; {1}'.format(
+            UPSERT.format('status', 'new.status_id', 1),
+            UPSERT.format('executor', NEW_EXECUTOR, 1),
+        ),
+    ),
+    POSTGRESQL_TRIGGER_FUNCTION.format(
+        'tasks_counter_label',
+        UPSERT.format('label', 'old.label_id', -1),
+        UPSERT.format('label', 'new.label_id', 1),
+    ),
+    """
+    CREATE TRIGGER tasks_counter_task
+    AFTER INSERT OR DELETE OR UPDATE OF status_id, executor_id ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION tasks_counter_task()
+    """,
+    """
+    CREATE TRIGGER tasks_counter_label
+    AFTER INSERT OR DELETE OR UPDATE OF label_id ON tasks_relationships
+    FOR EACH ROW EXECUTE FUNCTION tasks_counter_label()
+    """,
+)
+POSTGRESQL_UNINSTALL = (
+    'DROP TRIGGER IF EXISTS tasks_counter_task ON tasks_task',
+    'DROP TRIGGER IF EXISTS tasks_counter_label ON tasks_relationships',
+    'DROP FUNCTION IF EXISTS tasks_counter_task()',
+    'DROP FUNCTION IF EXISTS tasks_counter_label()',
+)
+
+INSTALL = {'sqlite': SQLITE_INSTALL, 'postgresql': POSTGRESQL_INSTALL}
+UNINSTALL = {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRESQL_UNINSTALL}
+
+
+def fill_counters(apps, schema_editor):
+    """Count the existing tasks with the historical models."""
+    using = schema_editor.connection.alias
+    task_model = apps.get_model('tasks', 'Task')
+    relationships_model = apps.get_model('tasks', 'Relationships')
+    counter_model = apps.get_model('tasks', 'TaskCounter')
+
+    tasks = task_model.objects.using(using).order_by()
+    groups = (
+        ('status', tasks.values_list('status_id')),
+        (
+            'executor',
+            tasks.values_list(Coalesce('executor_id', Value(UNASSIGNED))),
+        ),
+        (
+            'label',
+            relationships_model.objects.using(using).order_by().values_list(
+                'label_id',
+            ),
+        ),
+    )
+    counter_model.objects.using(using).bulk_create(
+        counter_model(dimension=dimension, object_id=object_id, count=count)
+        for dimension, queryset in groups
+        for object_id, count in queryset.annotate(Count('pk'))
+    )
+
+
+def install(apps, schema_editor):
+    """Create the counter triggers and fill the counters."""
+    for statement in INSTALL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+    fill_counters(apps, schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    """Drop the counter triggers."""
+    for statement in UNINSTALL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    """Count the tasks per status, executor and label."""
+
+    dependencies = [
+        ('tasks', '0008_task_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'Status'), ('executor', 'Executor'), ('label', 'Label')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='taskcounter',
+            constraint=models.UniqueConstraint(fields=('dimension', 'object_id'), name='tasks_unique_counter'),
+        ),
+        migrations.RunPython(install, uninstall),
+    ]
@@ -1,12 +1,74 @@
 """Tasks application models."""
 
 from django.db import models
+from django.db.models.functions import RowNumber
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
 from task_manager.users.models import User
 
+RELATED_FIELDS = ('status', 'executor', 'created_by')
+LIST_FIELDS = (
+    'name',
+    'created_at',
+    'status__name',
+    'executor__first_name',
+    'executor__last_name',
+    'created_by__first_name',
+    'created_by__last_name',
+)
+
+# Dimensions of the task counters.
+STATUS_DIMENSION = 'status'
+EXECUTOR_DIMENSION = 'executor'
+LABEL_DIMENSION = 'label'
+DIMENSIONS = (
+    (STATUS_DIMENSION, _('Status')),
+    (EXECUTOR_DIMENSION, _('Executor')),
+    (LABEL_DIMENSION, _('Label')),
+)
+# Tasks without an executor are counted under this id.
+UNASSIGNED = 0
+
+# Actions of the task events.
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+ACTIONS = (
+    (CREATED, _('Created')),
+    (UPDATED, _('Updated')),
+    (DELETED, _('Deleted')),
+)
+
+
+class TaskQuerySet(models.QuerySet):
+    """Task queryset."""
+
+    def for_list(self, *fields):
+        """Load only the columns rendered in the tasks table."""
+        return self.select_related(*RELATED_FIELDS).only(*LIST_FIELDS, *fields)
+
+    def first_per_status(self, count):
+        """Keep the first tasks of every status, found in one windowed query.
+
+        The window only reads the (status, created_at, id) index; the
+        other columns are fetched for the kept tasks alone.
+        """
+        ranked = self.model.objects.annotate(
+            position=models.Window(
+                RowNumber(),
+                partition_by=models.F('status_id'),
+                order_by=(models.F('created_at').asc(), models.F('id').asc()),
+            ),
+        ).filter(position__lte=count)
+
+        return self.filter(pk__in=ranked.values('pk'))
+
+    def for_detail(self):
+        """Load the task together with its related objects and labels."""
+        return self.select_related(*RELATED_FIELDS).prefetch_related('labels')
+
 
 class Task(models.Model):
     """Task model."""
@@ -16,11 +78,13 @@ class Task(models.Model):
     status = models.ForeignKey(
         Status,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=_('Status'),
     )
     executor = models.ForeignKey(
         User,
         on_delete=models.PROTECT,
+        db_index=False,
         null=True,
         blank=True,
         related_name='executor',
@@ -35,10 +99,40 @@ class Task(models.Model):
     created_by = models.ForeignKey(
         User,
         on_delete=models.PROTECT,
+        db_index=False,
         related_name='created_by',
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TaskQuerySet.as_manager()
+
+    class Meta(object):
+        # Every index ends with the list ordering, so a filtered page is
+        # read in order straight from the index. The leading columns also
+        # serve the foreign keys, which is why those have no own index.
+        indexes = (
+            models.Index(
+                fields=('created_at', 'id'),
+                name='tasks_created_at_id_idx',
+            ),
+            models.Index(
+                fields=('status', 'created_at', 'id'),
+                name='tasks_status_created_idx',
+            ),
+            models.Index(
+                fields=('executor', 'created_at', 'id'),
+                name='tasks_executor_created_idx',
+            ),
+            models.Index(
+                fields=('executor', 'status', 'created_at', 'id'),
+                name='tasks_executor_status_idx',
+            ),
+            models.Index(
+                fields=('created_by', 'created_at', 'id'),
+                name='tasks_author_created_idx',
+            ),
+        )
+
     def __str__(self):
         """Represent the model as a string."""
         return self.name
@@ -47,5 +141,56 @@ class Task(models.Model):
 class Relationships(models.Model):
     """Intermediary model."""
 
-    task = models.ForeignKey(Task, on_delete=models.CASCADE)
-    label = models.ForeignKey(Label, on_delete=models.PROTECT)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_index=False)
+    label = models.ForeignKey(Label, on_delete=models.PROTECT, db_index=False)
+
+    class Meta(object):
+        constraints = (
+            models.UniqueConstraint(
+                fields=('task', 'label'),
+                name='tasks_unique_task_label',
+            ),
+        )
+        indexes = (
+            models.Index(fields=('label', 'task'), name='tasks_label_task_idx'),
+        )
+
+
+class TaskCounter(models.Model):
+    """Number of tasks per status, executor or label.
+
+    The rows are maintained by database triggers on the tasks and their
+    labels, see ``task_manager.tasks.counters``.
+    """
+
+    dimension = models.CharField(max_length=10, choices=DIMENSIONS)
+    object_id = models.BigIntegerField()
+    count = models.BigIntegerField(default=0)
+
+    class Meta(object):
+        constraints = (
+            models.UniqueConstraint(
+                fields=('dimension', 'object_id'),
+                name='tasks_unique_counter',
+            ),
+        )
+
+    def __str__(self):
+        """Represent the model as a string."""
+        return '{0} {1}: {2}'.format(self.dimension, self.object_id, self.count)
+
+
+class TaskEvent(models.Model):
+    """A created, changed or deleted task, streamed to the tasks page.
+
+    The id orders the events and is the id of the Server-Sent Event,
+    so a reconnecting client resumes after the last event it received.
+    """
+
+    # Deleted tasks keep their events, so the id is not a foreign key.
+    task_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTIONS)
+
+    def __str__(self):
+        """Represent the model as a string."""
+        return '{0} {1} {2}'.format(self.pk, self.action, self.task_id)
@@ -0,0 +1,108 @@
+"""Tasks application import file readers."""
+
+import csv
+import json
+import os
+import re
+from types import MappingProxyType
+
+READ_SIZE = 65536
+JSON_SEPARATORS = re.compile(r'[\s,]*')
+
+FORMATS = ('csv', 'json')
+
+# Errors of a file that is not UTF-8 text, CSV or JSON.
+READ_ERRORS = (UnicodeDecodeError, csv.Error, json.JSONDecodeError)
+
+
+def get_format(filename):
+    """Guess the file format from the file extension."""
+    extension = os.path.splitext(filename)[1].lstrip('.').lower()
+
+    return extension if extension in FORMATS else None
+
+
+def read_csv(stream):
+    """Return (line number, record) pairs of a CSV text stream."""
+    reader = csv.DictReader(stream)
+
+    return ((reader.line_num, record) for record in reader)
+
+
+class JSONRecords(object):
+    """Iterator over the records of a JSON array or JSON lines.
+
+    The stream is decoded record by record, so only one read buffer and
+    one record are held in memory at a time. Arrays inside the top one
+    are records like any other value, not more records.
+    """
+
+    def __init__(self, stream):
+        """Start at the beginning of the text stream."""
+        self.stream = stream
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.array = None
+
+    def __iter__(self):
+        """Return the iterator itself."""
+        return self
+
+    def __next__(self):
+        """Return the next record, reading the stream as needed."""
+        while True:
+            self.skip_separators()
+            try:
+                record, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as error:
+                self.read(error)
+            else:
+                self.position = end
+                return record
+
+    def skip_separators(self):
+        """Move to the next record.
+
+        Raises:
+            StopIteration: the top array ends.
+        """
+        self.position = JSON_SEPARATORS.match(self.buffer, self.position).end()
+        next_char = self.buffer[self.position:self.position + 1]
+        if not next_char:
+            return
+
+        if self.array is None:
+            self.array = next_char == '['
+            if self.array:
+                self.position += 1
+                self.skip_separators()
+        elif self.array and next_char == ']':
+            raise StopIteration
+
+    def read(self, error):
+        """Append the next chunk of the stream to the buffer.
+
+        Raises:
+            StopIteration: the stream ended after the last record.
+            error: the stream ended in the middle of a record.
+        """
+        chunk = self.stream.read(READ_SIZE)
+        if chunk:
+            self.buffer = self.buffer[self.position:] + chunk
+            self.position = 0
+        elif self.position < len(self.buffer):
+            raise error
+        else:
+            raise StopIteration
+
+
+def read_json(stream):
+    """Return (item number, record) pairs of a JSON array or JSON lines."""
+    return enumerate(JSONRecords(stream), start=1)
+
+
+READERS = MappingProxyType({
+    'csv': read_csv,
+    'json': read_json,
+})
@@ -0,0 +1,154 @@
+"""Tasks application full-text search."""
+
+import re
+from string import Template
+from types import MappingProxyType
+
+from django.db import connections
+from django.db.models import BooleanField, Expression, FloatField, IntegerField, Value
+
+SEARCH_RANK = 'search_rank'
+TERM_PATTERN = re.compile(r'\w+')
+
+# The name weighs more than the description in the ranking.
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# SQLite: an external content FTS5 table over tasks_task, kept up to
+# date by triggers, so bulk inserts and imports are indexed as well.
+# Migration 0008 creates them; the triggers are repeated here to restore
+# them after a migration remakes the table.
+SQLITE_TABLE = 'tasks_task_fts'
+INDEX_NEW = ' '.join((
+    'INSERT INTO tasks_task_fts (rowid, name, description)',
+    'VALUES (new.id, new.name, new.description);',
+))
+UNINDEX_OLD = ' '.join((
+    'INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)',
+    "VALUES ('delete', old.id, old.name, old.description);",
+))
+SQLITE_TRIGGERS = (
+    ' '.join((
+        'CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert',
+        'AFTER INSERT ON tasks_task',
+        'BEGIN {0} END'.format(INDEX_NEW),
+    )),
+    ' '.join((
+        'CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete',
+        'AFTER DELETE ON tasks_task',
+        'BEGIN {0} END'.format(UNINDEX_OLD),
+    )),
+    ' '.join((
+        'CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update',
+        'AFTER UPDATE OF name, description ON tasks_task',
+        'BEGIN {0} {1} END'.format(UNINDEX_OLD, INDEX_NEW),
+    )),
+)
+# The tasks match through their ids in the FTS5 table. The rank is read
+# by id from the same match; bm25() is lower for better matches, so the
+# ascending order is the best first one the keyset pagination needs.
+SQLITE_MATCHES = Template(
+    'SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH $query',
+)
+SQLITE_RANK = Template(' '.join((
+    '(SELECT rank FROM tasks_task_fts WHERE tasks_task_fts MATCH $query',
+    'AND rowid = "tasks_task"."id")',
+)))
+
+# PostgreSQL: a GIN index over the weighted document expression, created
+# by migration 0008 and maintained by the database itself. The queries
+# repeat the expression so that the planner uses the index.
+POSTGRESQL_DOCUMENT = ' || '.join((
+    "setweight(to_tsvector('simple'::regconfig, tasks_task.name), 'A')",
+    "setweight(to_tsvector('simple'::regconfig, tasks_task.description), 'D')",
+))
+POSTGRESQL_QUERY = "plainto_tsquery('simple'::regconfig, $query)"
+POSTGRESQL_FILTER = Template('({0}) @@ {1}'.format(
+    POSTGRESQL_DOCUMENT,
+    POSTGRESQL_QUERY,
+))
+POSTGRESQL_RANK = Template("-ts_rank('{{{0}, 0, 0, 1}}', {1}, {2})".format(
+    DESCRIPTION_WEIGHT / NAME_WEIGHT,
+    POSTGRESQL_DOCUMENT,
+    POSTGRESQL_QUERY,
+))
+
+
+def get_match_query(text, vendor):
+    """Return the search text as a query of the backend, or None."""
+    terms = TERM_PATTERN.findall(text)
+    if not terms:
+        return None
+    if vendor == 'sqlite':
+        # Quoted terms are plain words for FTS5, not query syntax.
+        return ' '.join('"{0}"'.format(term) for term in terms)
+
+    return ' '.join(terms)
+
+
+def restore_triggers(using, **kwargs):
+    """Recreate the SQLite triggers dropped when a migration remade the table."""
+    database = connections[using]
+    if database.vendor != 'sqlite':
+        return
+    if SQLITE_TABLE not in database.introspection.table_names():
+        return
+
+    with database.cursor() as cursor:
+        for statement in SQLITE_TRIGGERS:
+            cursor.execute(statement)
+
+
+class SearchSQL(Expression):
+    """SQL of the search index, the match query passed as a parameter."""
+
+    def __init__(self, template, match_query, output_field):
+        """Keep the SQL template and the match query it is run with."""
+        super().__init__(output_field=output_field)
+        self.template = template
+        self.match_query = match_query
+
+    def as_sql(self, compiler, connection):
+        """Return the SQL with the placeholder of the match query."""
+        placeholder, query_params = compiler.compile(Value(self.match_query))
+
+        return self.template.substitute(query=placeholder), query_params
+
+
+def search_sqlite(queryset, match_query):
+    """Filter on the ids the FTS5 table matches."""
+    matches = SearchSQL(SQLITE_MATCHES, match_query, IntegerField())
+    rank = SearchSQL(SQLITE_RANK, match_query, FloatField())
+
+    return queryset.filter(pk__in=matches).annotate(**{SEARCH_RANK: rank})
+
+
+def search_postgresql(queryset, match_query):
+    """Filter on the indexed document expression."""
+    rank = SearchSQL(POSTGRESQL_RANK, match_query, FloatField())
+
+    return queryset.filter(
+        SearchSQL(POSTGRESQL_FILTER, match_query, BooleanField()),
+    ).annotate(**{SEARCH_RANK: rank})
+
+
+SEARCHES = MappingProxyType({
+    'sqlite': search_sqlite,
+    'postgresql': search_postgresql,
+})
+
+
+def search(queryset, text):
+    """Filter the tasks matching the text and annotate their rank.
+
+    The rank is ascending, the best match first. Backends without a
+    search index fall back to a substring match on the name.
+    """
+    vendor = connections[queryset.db].vendor
+    match_query = get_match_query(text, vendor)
+    if match_query is None:
+        return queryset
+    if vendor not in SEARCHES:
+        return queryset.filter(name__icontains=text)
+
+    return SEARCHES[vendor](queryset, match_query)
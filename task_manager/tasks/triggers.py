@@ -0,0 +1,136 @@
+"""Tasks application SQLite triggers of the task counters.
+
+Triggers keep the counters in the same transaction as every write, bulk
+inserts, updates and deletes included. Migration 0009 creates them; the
+SQLite ones are repeated here to restore them after a migration remakes
+a table.
+
+The module does not import the models, so the app config connects it
+before they are loaded; the dimensions are the TaskCounter ones.
+"""
+
+from django.db import connections
+
+COUNTER_TABLE = 'tasks_taskcounter'
+TASK_TABLE = 'tasks_task'
+RELATIONSHIPS_TABLE = 'tasks_relationships'
+
+UPSERT = ' '.join((
+    'INSERT INTO tasks_taskcounter (dimension, object_id, count)',
+    "VALUES ('{dimension}', {object_id}, {change})",
+    'ON CONFLICT (dimension, object_id)',
+    'DO UPDATE SET count = tasks_taskcounter.count + excluded.count;',
+))
+TRIGGER = ' '.join((
+    'CREATE TRIGGER IF NOT EXISTS {name}',
+    'AFTER {event} ON {table} {condition}',
+    'BEGIN {statements} END',
+))
+CHANGED = 'WHEN old.{0} IS NOT new.{0}'
+
+INSERT = 'INSERT'
+DELETE = 'DELETE'
+UPDATE = 'UPDATE OF {0}'
+
+STATUS_ID = 'status_id'
+EXECUTOR_ID = 'executor_id'
+LABEL_ID = 'label_id'
+
+STATUS = 'status'
+EXECUTOR = 'executor'
+LABEL = 'label'
+UNASSIGNED = 0
+
+OLD_STATUS = 'old.status_id'
+NEW_STATUS = 'new.status_id'
+# Tasks without an executor are counted under the UNASSIGNED id.
+OLD_EXECUTOR = 'coalesce(old.executor_id, {0})'.format(UNASSIGNED)
+NEW_EXECUTOR = 'coalesce(new.executor_id, {0})'.format(UNASSIGNED)
+OLD_LABEL = 'old.label_id'
+NEW_LABEL = 'new.label_id'
+
+
+def get_trigger_sql(name, event, table, column, changes):
+    """Return the statement creating a trigger that applies the changes.
+
+    The changes are (dimension, object id, change) and the trigger only
+    runs on updates changing the column, if any.
+    """
+    upserts = (
+        UPSERT.format(dimension=dimension, object_id=object_id, change=change)
+        for dimension, object_id, change in changes
+    )
+
+    return TRIGGER.format(
+        name=name,
+        event=event,
+        table=table,
+        condition=CHANGED.format(column) if column else '',
+        statements=' '.join(upserts),
+    )
+
+
+SQLITE_TRIGGERS = (
+    get_trigger_sql(
+        'tasks_counter_task_insert',
+        INSERT,
+        TASK_TABLE,
+        None,
+        [(STATUS, NEW_STATUS, 1), (EXECUTOR, NEW_EXECUTOR, 1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_task_delete',
+        DELETE,
+        TASK_TABLE,
+        None,
+        [(STATUS, OLD_STATUS, -1), (EXECUTOR, OLD_EXECUTOR, -1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_task_status',
+        UPDATE.format(STATUS_ID),
+        TASK_TABLE,
+        STATUS_ID,
+        [(STATUS, OLD_STATUS, -1), (STATUS, NEW_STATUS, 1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_task_executor',
+        UPDATE.format(EXECUTOR_ID),
+        TASK_TABLE,
+        EXECUTOR_ID,
+        [(EXECUTOR, OLD_EXECUTOR, -1), (EXECUTOR, NEW_EXECUTOR, 1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_label_insert',
+        INSERT,
+        RELATIONSHIPS_TABLE,
+        None,
+        [(LABEL, NEW_LABEL, 1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_label_delete',
+        DELETE,
+        RELATIONSHIPS_TABLE,
+        None,
+        [(LABEL, OLD_LABEL, -1)],
+    ),
+    get_trigger_sql(
+        'tasks_counter_label_update',
+        UPDATE.format(LABEL_ID),
+        RELATIONSHIPS_TABLE,
+        LABEL_ID,
+        [(LABEL, OLD_LABEL, -1), (LABEL, NEW_LABEL, 1)],
+    ),
+)
+
+
+def restore_triggers(using, **kwargs):
+    """Recreate the triggers dropped when a migration remade a table."""
+    database = connections[using]
+    if database.vendor != 'sqlite':
+        return
+    if COUNTER_TABLE not in database.introspection.table_names():
+        return
+
+    with database.cursor() as cursor:
+        for statement in SQLITE_TRIGGERS:
+            cursor.execute(statement)
@@ -2,20 +2,35 @@
 
 from django.urls import path
 
-from task_manager.tasks.views import (
-    IndexView,
-    TaskCreationView,
-    TaskDeleteView,
-    TaskDetailView,
-    TaskUpdateView,
-)
+from task_manager.tasks import views
 
 app_name = 'tasks'
 
 urlpatterns = [
-    path('', IndexView.as_view(), name='index'),
-    path('create/', TaskCreationView.as_view(), name='create'),
-    path('<int:pk>/', TaskDetailView.as_view(), name='detail'),
-    path('<int:pk>/update/', TaskUpdateView.as_view(), name='update'),
-    path('<int:pk>/delete/', TaskDeleteView.as_view(), name='delete'),
+    path('', views.IndexView.as_view(), name='index'),
+    path('create/', views.TaskCreationView.as_view(), name='create'),
+    path('bulk/', views.TaskBulkView.as_view(), name='bulk'),
+    path('board/', views.TaskBoardView.as_view(), name='board'),
+    path(
+        'board/<int:status_pk>/',
+        views.TaskBoardColumnView.as_view(),
+        name='board_column',
+    ),
+    path('events/', views.TaskEventsView.as_view(), name='events'),
+    path('import/', views.TaskImportView.as_view(), name='import'),
+    path(
+        'export/<str:export_format>/',
+        views.TaskExportView.as_view(),
+        name='export',
+    ),
+    path(
+        'export/<str:export_format>/job/',
+        views.TaskExportJobView.as_view(),
+        name='export_job',
+    ),
+    path('<int:pk>/', views.TaskDetailView.as_view(), name='detail'),
+    path('<int:pk>/update/', views.TaskUpdateView.as_view(), name='update'),
+    path('<int:pk>/delete/', views.TaskDeleteView.as_view(), name='delete'),
+    path('<int:pk>/move/', views.TaskMoveView.as_view(), name='move'),
+    path('<int:pk>/row/', views.TaskRowView.as_view(), name='row'),
 ]
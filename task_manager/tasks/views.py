@@ -1,41 +1,287 @@
 """Tasks application views."""
 
+from collections import defaultdict
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
+from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import (
     CreateView,
     DeleteView,
     DetailView,
+    FormView,
     ListView,
+    TemplateView,
     UpdateView,
+    View,
 )
 from django_filters.views import FilterView
 
-from task_manager.mixins import NoPermissionMixin, UserLoginRequiredMixin
+from task_manager.jobs.queue import enqueue
+from task_manager.mixins import (
+    CachedListMixin,
+    KeysetPaginationMixin,
+    NoPermissionMixin,
+    UserLoginRequiredMixin,
+    is_authenticated,
+)
+from task_manager.pagination import KeysetPage
+from task_manager.statuses.choices import status_choices
+from task_manager.tasks.event_stream import get_last_event_id, stream_events
+from task_manager.tasks.export import EXPORTERS
 from task_manager.tasks.filters import TasktFilter
-from task_manager.tasks.forms import TaskForm
-from task_manager.tasks.models import Task
+from task_manager.tasks.forms import (
+    ACTION_DELETE,
+    TaskBulkForm,
+    TaskForm,
+    TaskImportForm,
+    TaskMoveForm,
+)
+from task_manager.tasks.importer import UnreadableFileError, import_file
+from task_manager.tasks.jobs import EXPORT_JOB
+from task_manager.tasks.models import Label, Relationships, Status, Task, User
+from task_manager.tasks.readers import get_format
+from task_manager.tasks.search import SEARCH_RANK
 
 CREATION_SUCCESS_MESSAGE = _('Task successfully created.')
 UPDATE_SUCCESS_MESSAGE = _('Task successfully changed.')
 DELETE_SUCCESS_MESSAGE = _('Task successfully deleted.')
 
+BULK_UPDATE_SUCCESS_MESSAGE = _('Tasks successfully changed.')
+BULK_DELETE_SUCCESS_MESSAGE = _('Tasks successfully deleted.')
+
+EXPORT_QUEUED_MESSAGE = _(
+    'The export is queued. Download it here once it is done.',
+)
+
+IMPORT_SUCCESS_MESSAGE = _('Tasks imported: {count}.')
+IMPORT_ERROR_MESSAGE = _('Record {number}: {error}')
+IMPORT_SKIPPED_MESSAGE = _('Records skipped: {count}.')
+
 PERMISSION_DENIED_MESSAGE = _('Only the author of the task can delete it.')
 
+TASKS_PER_PAGE = 50
+BOARD_PAGE_SIZE = 20
+IMPORT_ERRORS_SHOWN = 10
+
 
-class IndexView(UserLoginRequiredMixin, FilterView, ListView):
+class IndexView(
+    UserLoginRequiredMixin,
+    CachedListMixin,
+    KeysetPaginationMixin,
+    FilterView,
+    ListView,
+):
     """Tasks page view."""
 
-    model = Task
+    queryset = Task.objects.for_list()
     filterset_class = TasktFilter
     template_name = 'tasks/task_list.html'
+    paginate_by = TASKS_PER_PAGE
+    watermark_models = (Task, Relationships, Status, Label, User)
+
+    def get_keyset_fields(self, queryset):
+        # Search results are listed best match first.
+        if SEARCH_RANK in queryset.query.annotations:
+            return (SEARCH_RANK, 'id')
+
+        return super().get_keyset_fields(queryset)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['bulk_form'] = TaskBulkForm(user=self.request.user)
+        # The stream resumes from the page, so no change is missed.
+        context['last_event_id'] = get_last_event_id()
+
+        return context
+
+
+class TaskRowView(UserLoginRequiredMixin, View):
+    """Render a row of the tasks table, or 204 if the filter excludes it."""
+
+    def get(self, request, pk):
+        filterset = TasktFilter(
+            request.GET,
+            queryset=Task.objects.for_list().filter(pk=pk),
+            request=request,
+        )
+        task = filterset.qs.first() if filterset.is_valid() else None
+        if task is None:
+            return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+        return render(request, 'tasks/task_row.html', {'task': task})
+
+
+class TaskEventsView(View):
+    """Stream the created, changed and deleted tasks as Server-Sent Events.
+
+    The browser sends the id of the last event it got when it
+    reconnects, or the page passes the id it was rendered at.
+    """
+
+    async def get(self, request):
+        if not await is_authenticated(request):
+            return HttpResponse(status=HTTPStatus.UNAUTHORIZED)
+
+        # A sync server would hold a worker for the whole stream. The
+        # browser does not reconnect after a 204.
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+        last_id = request.headers.get('Last-Event-ID') or request.GET.get(
+            'last_event_id',
+        )
+        try:
+            last_id = None if last_id is None else int(last_id)
+        except ValueError:
+            return HttpResponseBadRequest()
+
+        response = StreamingHttpResponse(
+            stream_events(last_id),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Keeps nginx from buffering the stream.
+        response['X-Accel-Buffering'] = 'no'
+
+        return response
+
+
+class TaskBoardView(UserLoginRequiredMixin, CachedListMixin, TemplateView):
+    """Tasks board page view, one column per status."""
+
+    template_name = 'tasks/task_board.html'
+    watermark_models = (Task, Status, User)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['columns'] = [
+            self.paginate_column(column) for column in self.get_columns()
+        ]
+
+        return context
+
+    def get_columns(self):
+        # One more task than shown tells whether a column has more.
+        tasks = Task.objects.for_list().first_per_status(BOARD_PAGE_SIZE + 1)
+        status_tasks = defaultdict(list)
+        for task in tasks.order_by('created_at', 'id'):
+            status_tasks[task.status_id].append(task)
+
+        return [
+            {'pk': pk, 'name': name, 'tasks': status_tasks[pk]}
+            for pk, name in status_choices.get()
+        ]
+
+    def paginate_column(self, column):
+        page = KeysetPage(
+            column['tasks'][:BOARD_PAGE_SIZE],
+            KeysetPaginationMixin.keyset_ordering,
+            has_next=len(column['tasks']) > BOARD_PAGE_SIZE,
+            has_previous=False,
+        )
+        column['tasks'] = page.object_list
+        if page.has_next():
+            column['next_page_query'] = urlencode({
+                KeysetPaginationMixin.cursor_kwarg: page.next_cursor(),
+            })
+
+        return column
+
+
+class TaskBoardColumnView(UserLoginRequiredMixin, KeysetPaginationMixin, ListView):
+    """Next cards of a board column."""
+
+    template_name = 'tasks/board_cards.html'
+    paginate_by = BOARD_PAGE_SIZE
+
+    def get_queryset(self):
+        return Task.objects.for_list().filter(status_id=self.kwargs['status_pk'])
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['status_pk'] = self.kwargs['status_pk']
+
+        return context
+
+
+class TaskMoveView(UserLoginRequiredMixin, View):
+    """Change the status of a task dropped on another board column."""
+
+    http_method_names = ['post']
+
+    def post(self, request, pk):
+        form = TaskMoveForm(request.POST)
+        if not form.is_valid():
+            return HttpResponseBadRequest()
+        if not form.save(pk):
+            raise Http404
+
+        return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+
+class TaskExportView(UserLoginRequiredMixin, View):
+    """Stream the tasks matched by the tasks page filter."""
+
+    def get(self, request, export_format):
+        if export_format not in EXPORTERS:
+            raise Http404
+
+        stream, content_type = EXPORTERS[export_format]
+        filterset = TasktFilter(
+            request.GET,
+            queryset=Task.objects.all(),
+            request=request,
+        )
+        queryset = filterset.qs if filterset.is_valid() else Task.objects.none()
+
+        response = StreamingHttpResponse(
+            stream(queryset),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = 'attachment; filename="tasks.{0}"'.format(
+            export_format,
+        )
+
+        return response
+
+
+class TaskExportJobView(UserLoginRequiredMixin, View):
+    """Queue the export of the filtered tasks as a background job."""
+
+    http_method_names = ['post']
+
+    def post(self, request, export_format):
+        if export_format not in EXPORTERS:
+            raise Http404
+
+        enqueue(
+            EXPORT_JOB,
+            user=request.user,
+            export_format=export_format,
+            query=request.GET.urlencode(),
+            user_id=request.user.pk,
+        )
+        messages.success(request, EXPORT_QUEUED_MESSAGE)
+
+        return redirect('jobs:index')
 
 
 class TaskDetailView(UserLoginRequiredMixin, DetailView):
     """Tasks detail view."""
 
-    model = Task
+    queryset = Task.objects.for_detail()
 
 
 class TaskCreationView(UserLoginRequiredMixin, SuccessMessageMixin, CreateView):
@@ -93,4 +339,76 @@ class TaskDeleteView(
     def test_func(self):
         task = self.get_object()
 
-        return self.request.user == task.created_by
+        return self.request.user.pk == task.created_by_id
+
+
+class TaskBulkView(UserLoginRequiredMixin, FormView):
+    """Apply an action to the tasks selected on the tasks page."""
+
+    form_class = TaskBulkForm
+    http_method_names = ['post']
+    success_url = reverse_lazy('tasks:index')
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['user'] = self.request.user
+
+        return kwargs
+
+    def form_valid(self, form):
+        form.save()
+
+        if form.cleaned_data['action'] == ACTION_DELETE:
+            messages.success(self.request, BULK_DELETE_SUCCESS_MESSAGE)
+        else:
+            messages.success(self.request, BULK_UPDATE_SUCCESS_MESSAGE)
+
+        return super().form_valid(form)
+
+    def form_invalid(self, form):
+        for errors in form.errors.values():
+            for error in errors:
+                messages.error(self.request, error)
+
+        return redirect(self.success_url)
+
+
+class TaskImportView(UserLoginRequiredMixin, FormView):
+    """Task import page view."""
+
+    form_class = TaskImportForm
+    template_name = 'layouts/form.html'
+    success_url = reverse_lazy('tasks:index')
+    extra_context = {
+        'header': _('Import tasks'),
+        'button': _('Import'),
+    }
+
+    def form_valid(self, form):
+        upload = form.cleaned_data['upload']
+        try:
+            importer = import_file(
+                upload,
+                get_format(upload.name),
+                self.request.user,
+            )
+        except UnreadableFileError as error:
+            form.add_error('upload', str(error))
+            return self.form_invalid(form)
+
+        messages.success(
+            self.request,
+            IMPORT_SUCCESS_MESSAGE.format(count=importer.created),
+        )
+        for number, reason in importer.errors[:IMPORT_ERRORS_SHOWN]:
+            messages.warning(
+                self.request,
+                IMPORT_ERROR_MESSAGE.format(number=number, error=reason),
+            )
+        if importer.errors:
+            messages.warning(
+                self.request,
+                IMPORT_SKIPPED_MESSAGE.format(count=len(importer.errors)),
+            )
+
+        return super().form_valid(form)
@@ -0,0 +1,260 @@
+"""Project JSON API tests."""
+
+import json
+from http import HTTPStatus
+
+from django.test import TestCase
+from django.urls import reverse_lazy
+from parameterized import parameterized_class
+
+from task_manager.api.views import PAGE_SIZE
+from task_manager.misc import get_test_data
+from task_manager.pagination import NEXT, encode_cursor
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+test_data = get_test_data()
+
+user = test_data['users']['has_relationships']
+other_user = test_data['users']['existing']
+status = test_data['statuses']['existing']
+used_status = test_data['statuses']['has_relationships']
+label = test_data['labels']['has_relationships']
+task = test_data['tasks']['existing']
+
+
+@parameterized_class(
+    ('resource', 'model'),
+    [
+        ('tasks', Task),
+        ('statuses', Status),
+        ('users', User),
+    ],
+)
+class ApiListTest(TestCase):
+    """API lists tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_list(self):
+        response = self.client.get(reverse_lazy('api:{0}:list'.format(self.resource)))
+        rows = response.json()['results']
+
+        self.assertEqual(
+            {row['id'] for row in rows},
+            set(self.model.objects.values_list('pk', flat=True)),
+        )
+        self.assertIsNone(response.json()['next'])
+
+    def test_sparse_fields(self):
+        response = self.client.get(
+            reverse_lazy('api:{0}:list'.format(self.resource)),
+            {'fields': 'id'},
+        )
+
+        row = response.json()['results'][0]
+
+        self.assertEqual(set(row), {'id'})
+
+    def test_unknown_field(self):
+        response = self.client.get(
+            reverse_lazy('api:{0}:list'.format(self.resource)),
+            {'fields': 'password'},
+        )
+
+        errors = response.json()['errors']['__all__']
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('password', errors[0]['message'])
+
+
+class ApiTaskTest(TestCase):
+    """API tasks tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_login_required(self):
+        self.client.logout()
+
+        response = self.client.get(reverse_lazy('api:tasks:list'))
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_include(self):
+        response = self.client.get(
+            reverse_lazy('api:tasks:detail', args=[task['pk']]),
+            {'fields': 'name', 'include': 'status,author,labels'},
+        )
+
+        self.assertEqual(response.json(), {
+            'id': task['pk'],
+            'name': task['name'],
+            'status': {'id': used_status['pk'], 'name': used_status['name']},
+            'author': {
+                'id': user['pk'],
+                'first_name': 'Zorro',
+                'last_name': 'Roronoa',
+            },
+            'labels': [{'id': label['pk'], 'name': label['name']}],
+        })
+
+    def test_filters(self):
+        url = reverse_lazy('api:tasks:list')
+
+        response = self.client.get(url, {'status': status['pk']})
+
+        self.assertEqual(response.json()['results'], [])
+
+        response = self.client.get(url, {'labels': label['pk'], 'fields': 'id'})
+        rows = response.json()['results']
+
+        self.assertEqual(rows, [{'id': task['pk']}])
+
+        response = self.client.get(url, {'status': 0})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('status', response.json()['errors'])
+
+    def test_cursor(self):
+        Task.objects.bulk_create(
+            Task(
+                name='Task {0}'.format(number),
+                status_id=status['pk'],
+                created_by_id=user['pk'],
+            )
+            for number in range(PAGE_SIZE)
+        )
+        url = reverse_lazy('api:tasks:list')
+
+        first_page = self.client.get(url, {'fields': 'id'}).json()
+        second_page = self.client.get(first_page['next']).json()
+        ids = [row['id'] for row in first_page['results'] + second_page['results']]
+
+        self.assertEqual(
+            ids,
+            list(
+                Task.objects.order_by('created_at', 'id').values_list('pk', flat=True),
+            ),
+        )
+        self.assertIsNone(second_page['next'])
+        self.assertIsNotNone(second_page['previous'])
+
+        response = self.client.get(url, {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        response = self.client.get(
+            url,
+            {'cursor': encode_cursor(NEXT, ['notadate', 1])},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+
+class ApiWriteTest(TestCase):
+    """API writes tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_create(self):
+        response = self.client.post(
+            reverse_lazy('api:tasks:list'),
+            json.dumps({**test_data['tasks']['new'], 'labels': [label['pk']]}),
+            content_type='application/json',
+        )
+        created = Task.objects.get(pk=response.json()['id'])
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(created.created_by_id, user['pk'])
+        self.assertEqual(
+            list(created.labels.values_list('pk', flat=True)),
+            [label['pk']],
+        )
+
+    def test_create_invalid(self):
+        url = reverse_lazy('api:tasks:list')
+
+        response = self.client.post(
+            url,
+            json.dumps([]),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        response = self.client.post(
+            url,
+            json.dumps({}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('name', response.json()['errors'])
+
+    def test_update(self):
+        response = self.client.patch(
+            reverse_lazy('api:tasks:detail', args=[task['pk']]),
+            json.dumps({'description': ''}),
+            content_type='application/json',
+        )
+        updated = Task.objects.get(pk=task['pk'])
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(updated.description, '')
+        self.assertEqual(updated.name, task['name'])
+        self.assertEqual(
+            list(updated.labels.values_list('pk', flat=True)),
+            [label['pk']],
+        )
+
+    def test_delete(self):
+        url = reverse_lazy('api:tasks:detail', args=[task['pk']])
+        self.client.login(
+            username=other_user['username'],
+            password=other_user['password'],
+        )
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        self.client.login(username=user['username'], password=user['password'])
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertFalse(Task.objects.filter(pk=task['pk']).exists())
+
+    def test_delete_used_status(self):
+        response = self.client.delete(
+            reverse_lazy('api:statuses:detail', args=[used_status['pk']]),
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.CONFLICT)
+        self.assertTrue(Status.objects.filter(pk=used_status['pk']).exists())
+
+    def test_create_user_anonymously(self):
+        self.client.logout()
+
+        response = self.client.post(
+            reverse_lazy('api:users:list'),
+            json.dumps(test_data['users']['new']),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertNotIn('password', response.json())
+        self.assertTrue(
+            User.objects.filter(
+                username=test_data['users']['new']['username'],
+            ).exists(),
+        )
@@ -0,0 +1,60 @@
+"""Project ASGI support tests."""
+
+from http import HTTPStatus
+
+from django.conf import settings
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.checks import check_async_middleware
+from task_manager.misc import get_test_data
+
+test_data = get_test_data()
+
+user = test_data['users']['existing']
+
+
+class AsyncRequestTest(TestCase):
+    """Requests served by the async handler."""
+
+    fixtures = ['data.json']
+    client_class = AsyncClient
+
+    async def test_api_list(self):
+        response = await self.client.get(
+            reverse_lazy('api:users:list'),
+            {'fields': 'username'},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn(
+            {'id': user['pk'], 'username': user['username']},
+            response.json()['results'],
+        )
+
+    async def test_api_login_required(self):
+        response = await self.client.get(reverse_lazy('api:tasks:list'))
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    async def test_static_file(self):
+        response = await self.client.get('{0}js/board.js'.format(settings.STATIC_URL))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response['Content-Type'], 'text/javascript; charset="utf-8"')
+
+
+class AsyncMiddlewareCheckTest(TestCase):
+    """Async middleware system check tests."""
+
+    def test_default_middleware(self):
+        self.assertEqual(check_async_middleware(None), [])
+
+    @override_settings(
+        MIDDLEWARE=['task_manager.profiling.ProfilingMiddleware', *settings.MIDDLEWARE],
+    )
+    def test_sync_middleware(self):
+        warnings = check_async_middleware(None)
+
+        self.assertEqual([warning.id for warning in warnings], ['task_manager.W001'])
+        self.assertIn('ProfilingMiddleware', warnings[0].msg)
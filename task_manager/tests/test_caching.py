@@ -0,0 +1,240 @@
+"""Project caching tests."""
+
+import time
+from http import HTTPStatus
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from parameterized import parameterized_class
+
+from task_manager.caching import get_version
+from task_manager.labels.choices import label_choices
+from task_manager.labels.models import Label
+from task_manager.misc import get_test_data
+from task_manager.statuses.choices import status_choices
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TasktFilter
+from task_manager.tasks.forms import TaskForm
+
+test_data = get_test_data()
+
+user = test_data['users']['existing']
+status = test_data['statuses']['existing']
+label = test_data['labels']['existing']
+new_status = test_data['statuses']['new']
+
+
+LOCAL_VERSION_TIMEOUT = 10
+
+
+def expire_versions():
+    """Move the clock past the lifetime of the local table versions."""
+    return patch('time.time', return_value=time.time() + LOCAL_VERSION_TIMEOUT + 1)
+
+
+@skipIf(
+    settings.CACHE_VERSION_TIMEOUT is None,
+    'A shared cache keeps the versions until the next write.',
+)
+class VersionExpiryTest(TestCase):
+    """Table versions expire after the configured timeout."""
+
+    def test_versions_expire(self):
+        cache.clear()
+        version = get_version(Status)
+        expired_at = time.time() + settings.CACHE_VERSION_TIMEOUT + 1
+
+        self.assertEqual(get_version(Status), version)
+        with patch('time.time', return_value=expired_at):
+            self.assertNotEqual(get_version(Status), version)
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class CachedChoicesTest(TestCase):
+    """Cached choices tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        cache.clear()
+
+    def test_choices(self):
+        self.assertEqual(
+            status_choices.get(),
+            list(Status.objects.order_by('name').values_list('pk', 'name')),
+        )
+        self.assertEqual(
+            label_choices.get(),
+            list(Label.objects.order_by('name').values_list('pk', 'name')),
+        )
+
+    def test_choices_invalidation(self):
+        status_choices.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created_status = Status.objects.create(name=new_status['name'])
+
+        self.assertIn(
+            (created_status.pk, created_status.name),
+            status_choices.get(),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created_status.delete()
+
+        self.assertIsNone(status_choices.get_name(created_status.pk))
+
+    @override_settings(CACHE_VERSION_TIMEOUT=LOCAL_VERSION_TIMEOUT)
+    def test_row_added_by_another_process(self):
+        status_choices.get()
+        # bulk_create() sends no signals, like a write of another process.
+        created_status = Status.objects.bulk_create(
+            [Status(name=new_status['name'])],
+        )[0]
+        form = TaskForm({'name': 'Cached', 'status': created_status.pk})
+        filterset = TasktFilter({'status': created_status.pk})
+
+        self.assertTrue(form.is_valid())
+        self.assertTrue(filterset.form.is_valid())
+        self.assertNotIn(
+            (created_status.pk, created_status.name),
+            status_choices.get(),
+        )
+
+        with expire_versions():
+            self.assertIn(
+                (created_status.pk, created_status.name),
+                status_choices.get(),
+            )
+
+    def test_form_choices_without_queries(self):
+        status_choices.get()
+        label_choices.get()
+        form = TaskForm({
+            'name': 'Cached',
+            'status': status['pk'],
+            'labels': [label['pk']],
+        })
+
+        with self.assertNumQueries(0):
+            form.fields['status'].clean(status['pk'])
+            form.fields['labels'].clean([label['pk']])
+            str(form['status'])
+            str(form['labels'])
+
+    def test_filter_choices_without_queries(self):
+        status_choices.get()
+        label_choices.get()
+        filterset = TasktFilter({'status': status['pk'], 'labels': label['pk']})
+
+        with self.assertNumQueries(0):
+            self.assertTrue(filterset.form.is_valid())
+            str(filterset.form['status'])
+            str(filterset.form['labels'])
+
+    def test_invalid_choice(self):
+        form = TaskForm({'name': 'Cached', 'status': 0, 'labels': [0]})
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('status', form.errors)
+        self.assertIn('labels', form.errors)
+
+
+@parameterized_class(
+    ('engine', 'session_queries'),
+    [
+        ('django.contrib.sessions.backends.db', 1),
+        ('django.contrib.sessions.backends.cached_db', 0),
+        ('django.contrib.sessions.backends.signed_cookies', 0),
+    ],
+)
+class SessionQueriesTest(TestCase):
+    """Session backend database round-trips tests."""
+
+    fixtures = ['data.json']
+
+    def test_session_queries(self):
+        with override_settings(SESSION_ENGINE=self.engine):
+            self.client.login(
+                username=user['username'],
+                password=user['password'],
+            )
+
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(reverse_lazy('statuses:index'))
+                session_queries = [
+                    query for query in context.captured_queries
+                    if 'django_session' in query['sql']
+                ]
+
+        self.assertEqual(len(session_queries), self.session_queries)
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class CachedListTest(TestCase):
+    """Cached list pages tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        cache.clear()
+        self.client.login(username=user['username'], password=user['password'])
+        self.url = reverse_lazy('statuses:index')
+        self.client.get(self.url)
+
+    def test_not_modified(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('private', response['Cache-Control'])
+
+        response = self.client.get(
+            self.url,
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+    def test_cached_page_without_list_query(self):
+        response = self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as context:
+            cached_response = self.client.get(self.url)
+            list_queries = [
+                query for query in context.captured_queries
+                if 'statuses_status' in query['sql']
+            ]
+
+        self.assertEqual(cached_response.content, response.content)
+        self.assertFalse(list_queries)
+
+    def test_invalidation(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse_lazy('statuses:create'), new_status)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, new_status['name'])
+
+    @override_settings(CACHE_VERSION_TIMEOUT=LOCAL_VERSION_TIMEOUT)
+    def test_write_by_another_process(self):
+        cache.clear()
+        etag = self.client.get(self.url)['ETag']
+        # update() sends no signals, like a write of another process.
+        statuses = Status.objects.filter(pk=status['pk'])
+        statuses.update(name=new_status['name'])
+
+        with expire_versions():
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, new_status['name'])
@@ -0,0 +1,335 @@
+"""Project management commands tests."""
+
+import json
+import os
+import tempfile
+from http import HTTPStatus
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError
+from django.test import LiveServerTestCase, TestCase
+
+from task_manager.labels.models import Label
+from task_manager.misc import get_test_data
+from task_manager.statuses.models import Status
+from task_manager.tasks import events
+from task_manager.tasks.importer import TaskImporter
+from task_manager.tasks.management.commands.explain_filters import get_combinations
+from task_manager.tasks.models import (
+    EXECUTOR_DIMENSION,
+    STATUS_DIMENSION,
+    UNASSIGNED,
+    Relationships,
+    Task,
+    TaskCounter,
+)
+from task_manager.users.models import User
+
+test_data = get_test_data()
+
+user = test_data['users']['existing']
+status = test_data['statuses']['existing']
+label = test_data['labels']['existing']
+task = test_data['tasks']['existing']
+
+IMPORT_RECORDS = (
+    {'name': 'Imported 1', 'status': status['name'], 'labels': label['name']},
+    {'name': 'Imported 2', 'status': 'Imported status', 'labels': 'a, b'},
+    {'name': task['name'], 'status': status['name']},
+    {'name': 'Imported 3', 'status': status['name'], 'executor': 'nobody'},
+    {'name': 'Imported 4'},
+    {'name': 'Imported 5', 'status': status['name'], 'author': user['username']},
+)
+# Import files are read in chunks of this many characters.
+SMALL_READ_SIZE = 16
+# Characters cut off the end of a JSON file to make it unreadable.
+TRUNCATED_CHARS = 20
+SEED_TASKS = 30
+
+
+class ExplainFiltersTest(TestCase):
+    """Explain filters command tests."""
+
+    fixtures = ['data.json']
+
+    def test_explain_filters(self):
+        output = StringIO()
+
+        call_command('explain_filters', '--fail-on-scan', stdout=output)
+
+        self.assertEqual(
+            output.getvalue().count(': OK'),
+            len(list(get_combinations())),
+        )
+
+
+class BenchTemplatesTest(TestCase):
+    """Bench templates command tests."""
+
+    fixtures = ['data.json']
+
+    def test_bench_templates(self):
+        output = StringIO()
+
+        call_command(
+            'bench_templates',
+            '--rows', '1', '10',
+            '--repeat', '1',
+            stdout=output,
+        )
+
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+
+class ImportTasksTest(TestCase):
+    """Import tasks command tests."""
+
+    fixtures = ['data.json']
+
+    def import_file(self, suffix, body):
+        if isinstance(body, str):
+            body = body.encode()
+
+        with tempfile.NamedTemporaryFile(
+            'wb',
+            suffix=suffix,
+            delete=False,
+        ) as import_file:
+            import_file.write(body)
+            path = import_file.name
+        self.addCleanup(os.remove, path)
+
+        output = StringIO()
+        errors = StringIO()
+        call_command(
+            'import_tasks',
+            path,
+            '--author', test_data['users']['has_relationships']['username'],
+            '--batch-size', '2',
+            stdout=output,
+            stderr=errors,
+        )
+
+        return output.getvalue(), errors.getvalue()
+
+    def assert_imported(self, output, errors):
+        self.assertIn('Imported 3 tasks, 3 records skipped.', output)
+        self.assertEqual(
+            [line.split(':')[0] for line in errors.splitlines()],
+            ['Record 3', 'Record 4', 'Record 5'],
+        )
+        self.assertEqual(
+            set(Task.objects.get(name='Imported 2').labels.values_list(
+                'name',
+                flat=True,
+            )),
+            {'a', 'b'},
+        )
+        self.assertTrue(Status.objects.filter(name='Imported status').exists())
+        self.assertTrue(
+            Label.objects.get(pk=label['pk']).relationships_set.filter(
+                task__name='Imported 1',
+            ).exists(),
+        )
+        self.assertEqual(
+            Task.objects.get(name='Imported 5').created_by_id,
+            user['pk'],
+        )
+
+    def test_import_json(self):
+        # A small read size makes records span several reads.
+        with patch('task_manager.tasks.readers.READ_SIZE', SMALL_READ_SIZE):
+            self.assert_imported(*self.import_file(
+                '.json',
+                json.dumps(IMPORT_RECORDS, indent=2),
+            ))
+
+    def test_import_json_lines(self):
+        self.assert_imported(*self.import_file(
+            '.json',
+            '\n'.join(json.dumps(record) for record in IMPORT_RECORDS),
+        ))
+
+    def test_import_csv(self):
+        lines = ['name,status,executor,author,labels']
+        for record in IMPORT_RECORDS:
+            lines.append('"{0}","{1}","{2}","{3}","{4}"'.format(*(
+                record.get(column, '')
+                for column in ('name', 'status', 'executor', 'author', 'labels')
+            )))
+
+        output, errors = self.import_file('.csv', '\n'.join(lines))
+
+        self.assertIn('Imported 3 tasks, 3 records skipped.', output)
+        self.assertEqual(
+            [line.split(':')[0] for line in errors.splitlines()],
+            ['Record 4', 'Record 5', 'Record 6'],
+        )
+
+    def test_invalid_json_records(self):
+        records = [
+            [IMPORT_RECORDS[0]],
+            {'name': 'Imported 1', 'status': status['name'], 'labels': {'x': 1}},
+            {'name': 'Imported 1', 'status': status['name'], 'labels': ['x', 1]},
+            {'name': ['Imported 1'], 'status': status['name']},
+            IMPORT_RECORDS[0],
+        ]
+
+        output, errors = self.import_file('.json', json.dumps(records))
+
+        self.assertIn('Imported 1 tasks, 4 records skipped.', output)
+        self.assertEqual(
+            [line.split(':')[0] for line in errors.splitlines()],
+            ['Record 1', 'Record 2', 'Record 3', 'Record 4'],
+        )
+        self.assertFalse(Label.objects.filter(name__contains='x').exists())
+
+    def test_unreadable_file(self):
+        files = (
+            ('.csv', 'name,status\nЗадача,Новый\n'.encode('cp1251')),
+            ('.json', json.dumps(IMPORT_RECORDS)[:-TRUNCATED_CHARS]),
+        )
+        for suffix, body in files:
+            with self.assertRaises(CommandError):
+                self.import_file(suffix, body)
+
+
+class TaskImporterTest(TestCase):
+    """Task importer tests."""
+
+    fixtures = ['data.json']
+
+    def test_rolled_back_batch(self):
+        importer = TaskImporter(User.objects.get(pk=user['pk']))
+        record = {'status': 'Imported status', 'labels': 'Imported label'}
+
+        with patch.object(events, 'publish', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                importer.run([(1, {'name': 'Imported 1', **record})])
+        importer.run([(1, {'name': 'Imported 2', **record})])
+
+        imported_task = Task.objects.get(name='Imported 2')
+
+        self.assertFalse(Task.objects.filter(name='Imported 1').exists())
+        self.assertEqual(imported_task.status.name, 'Imported status')
+        self.assertEqual(
+            list(imported_task.labels.values_list('name', flat=True)),
+            ['Imported label'],
+        )
+
+
+class SeedBenchTest(TestCase):
+    """Seed bench command tests."""
+
+    def test_seed_bench(self):
+        call_command(
+            'seed_bench',
+            '--users', '3',
+            '--statuses', '2',
+            '--labels', '4',
+            '--tasks', str(SEED_TASKS),
+            '--max-labels', '2',
+            '--batch-size', '7',
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Status.objects.count(), 2)
+        self.assertEqual(Label.objects.count(), 4)
+        self.assertEqual(Task.objects.count(), SEED_TASKS)
+        self.assertLessEqual(Relationships.objects.count(), SEED_TASKS * 2)
+
+
+class TaskCountersTest(TestCase):
+    """Task counters command tests."""
+
+    fixtures = ['data.json']
+
+    def test_counters_follow_writes(self):
+        call_command('seed_bench', '--tasks', str(SEED_TASKS), stdout=StringIO())
+        Task.objects.filter(pk__gt=SEED_TASKS // 2).update(executor=None)
+        Task.objects.filter(pk__lt=10).delete()
+        Relationships.objects.filter(task_id__gt=SEED_TASKS - 10).delete()
+        output = StringIO()
+
+        call_command('task_counters', 'check', stdout=output)
+
+        self.assertIn('Counters match the tasks.', output.getvalue())
+        self.assertEqual(
+            TaskCounter.objects.get(
+                dimension=EXECUTOR_DIMENSION,
+                object_id=UNASSIGNED,
+            ).count,
+            Task.objects.filter(executor=None).count(),
+        )
+
+    def test_check_and_rebuild(self):
+        TaskCounter.objects.filter(dimension=STATUS_DIMENSION).update(count=5)
+        output = StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command('task_counters', 'check', stdout=output)
+
+        self.assertIn('expected 1, stored 5', output.getvalue())
+
+        call_command('task_counters', 'rebuild', stdout=StringIO())
+        call_command('task_counters', 'check', stdout=output)
+
+        self.assertIn('Counters match the tasks.', output.getvalue())
+
+
+class BenchViewsTest(TestCase):
+    """Bench views command tests."""
+
+    fixtures = ['data.json']
+
+    def test_bench_views(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bench.json')
+            call_command(
+                'bench_views',
+                '--scales', '5',
+                '--repeat', '2',
+                '--output', path,
+                stdout=StringIO(),
+            )
+            with open(path) as bench_file:
+                runs = json.load(bench_file)['runs']
+
+        pages = {page['name']: page for page in runs[0]['results']}
+
+        self.assertEqual(runs[0]['tasks'], 5)
+        self.assertEqual(pages['tasks:index']['status'], HTTPStatus.OK)
+        self.assertEqual(pages['tasks:detail']['status'], HTTPStatus.OK)
+        self.assertIn('tasks:index?labels', pages)
+        self.assertIn('api:tasks:list?labels', pages)
+        self.assertEqual(pages['api:tasks:detail']['status'], HTTPStatus.OK)
+        self.assertNotIn('tasks:bulk', pages)
+
+
+class LoadTestTest(LiveServerTestCase):
+    """Load test command tests."""
+
+    fixtures = ['data.json']
+
+    def test_load_test(self):
+        stdout = StringIO()
+        call_command(
+            'load_test',
+            '{0}/api/users/'.format(self.live_server_url),
+            '--clients', '2',
+            '--slow-clients', '1',
+            '--slow-interval', '0.1',
+            '--duration', '0.5',
+            stdout=stdout,
+        )
+
+        self.assertRegex(stdout.getvalue(), r'^[1-9]\d* requests, 0 errors')
+        self.assertIn('p95', stdout.getvalue())
+
+    def test_invalid_url(self):
+        with self.assertRaises(CommandError):
+            call_command('load_test', 'https://example.com/', stdout=StringIO())
@@ -1,6 +1,8 @@
 """Project constraints tests."""
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from parameterized import parameterized_class
 
@@ -108,25 +110,28 @@ class LoginRequiredTest(TestCase):
 
 
 @parameterized_class(
-    ('url', 'id', 'message', 'redirect_url'),
+    ('url', 'id', 'message', 'redirect_url', 'table'),
     [
         (
             'users:delete',
             another_user['pk'],
             USERS_PROTECTED_ERROR_MESSAGE,
             'users:index',
+            'tasks_task',
         ),
         (
             'statuses:delete',
             status['pk'],
             STATUSES_PROTECTED_ERROR_MESSAGE,
             'statuses:index',
+            'tasks_task',
         ),
         (
             'labels:delete',
             label['pk'],
             LABELS_PROTECTED_ERROR_MESSAGE,
             'labels:index',
+            'tasks_relationships',
         ),
     ],
 )
@@ -148,3 +153,31 @@ class ProtectedErrorTest(TestCase):
 
         self.assertIn(self.message, response_messages)
         self.assertRedirects(response, reverse_lazy(self.redirect_url))
+
+    def test_in_use_warning(self):
+        self.client.login(
+            username=another_user['username'],
+            password=another_user['password'],
+        )
+
+        response = self.client.get(reverse_lazy(self.url, args=[self.id]))
+
+        self.assertContains(response, self.message)
+
+    def test_referencing_rows_not_collected(self):
+        self.client.login(
+            username=another_user['username'],
+            password=another_user['password'],
+        )
+
+        table_from = 'FROM "{0}"'.format(self.table)
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(reverse_lazy(self.url, args=[self.id]))
+            table_queries = [
+                query['sql'] for query in context.captured_queries
+                if table_from in query['sql']
+            ]
+
+        for sql in table_queries:
+            self.assertIn('LIMIT 1', sql)
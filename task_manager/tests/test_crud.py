@@ -1,6 +1,9 @@
 """Project CRUD tests."""
 
+from http import HTTPStatus
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from django.urls import reverse_lazy
 from parameterized import parameterized_class
@@ -26,13 +29,19 @@ from task_manager.statuses.views import (
 from task_manager.statuses.views import (
     UPDATE_SUCCESS_MESSAGE as STATUS_UPDATE_SUCCESS_MESSAGE,
 )
-from task_manager.tasks.models import Task
+from task_manager.tasks.forms import BULK_PERMISSION_DENIED_MESSAGE
+from task_manager.tasks.models import Relationships, Task
+from task_manager.tasks.views import (
+    BULK_DELETE_SUCCESS_MESSAGE,
+    BULK_UPDATE_SUCCESS_MESSAGE,
+)
 from task_manager.tasks.views import (
     CREATION_SUCCESS_MESSAGE as TASK_CREATION_SUCCESS_MESSAGE,
 )
 from task_manager.tasks.views import (
     DELETE_SUCCESS_MESSAGE as TASK_DELETE_SUCCESS_MESSAGE,
 )
+from task_manager.tasks.views import IMPORT_SUCCESS_MESSAGE
 from task_manager.tasks.views import (
     UPDATE_SUCCESS_MESSAGE as TASK_UPDATE_SUCCESS_MESSAGE,
 )
@@ -55,9 +64,11 @@ task_owner = test_data['users']['has_relationships']
 
 status = test_data['statuses']['existing']
 new_status = test_data['statuses']['new']
+other_status = test_data['statuses']['has_relationships']
 
 label = test_data['labels']['existing']
 new_label = test_data['labels']['new']
+other_label = test_data['labels']['has_relationships']
 
 task = test_data['tasks']['existing']
 new_task = test_data['tasks']['new']
@@ -206,6 +217,44 @@ class UpdateTest(TestCase):
         self.assertRedirects(response, reverse_lazy(self.redirect_url))
 
 
+class TaskLabelsTest(TestCase):
+    """Create and update tasks with labels."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(
+            username=user['username'],
+            password=user['password'],
+        )
+
+    def get_label_pks(self, name):
+        return set(
+            Task.objects.get(name=name).labels.values_list('pk', flat=True),
+        )
+
+    def test_create(self):
+        response = self.client.post(
+            reverse_lazy('tasks:create'),
+            {**new_task, 'labels': [label['pk'], other_label['pk']]},
+        )
+
+        self.assertRedirects(response, reverse_lazy('tasks:index'))
+        self.assertEqual(
+            self.get_label_pks(new_task['name']),
+            {label['pk'], other_label['pk']},
+        )
+
+    def test_update(self):
+        response = self.client.post(
+            reverse_lazy('tasks:update', args=[task['pk']]),
+            {**new_task, 'labels': [other_label['pk']]},
+        )
+
+        self.assertRedirects(response, reverse_lazy('tasks:index'))
+        self.assertEqual(self.get_label_pks(new_task['name']), {other_label['pk']})
+
+
 class DeleteUserTest(TestCase):
     """Delete user tests."""
 
@@ -282,3 +331,153 @@ class DeleteTest(TestCase):
 
         with self.assertRaises(ObjectDoesNotExist):
             self.model.objects.get(pk=self.id)
+
+
+class BulkTest(TestCase):
+    """Bulk task actions tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(
+            username=task_owner['username'],
+            password=task_owner['password'],
+        )
+        self.tasks = Task.objects.bulk_create(
+            Task(
+                name='Bulk task {0}'.format(number),
+                status_id=status['pk'],
+                created_by_id=task_owner['pk'],
+            )
+            for number in range(3)
+        )
+        self.pks = [bulk_task.pk for bulk_task in self.tasks]
+
+    def post(self, **form_data):
+        return self.client.post(
+            reverse_lazy('tasks:bulk'),
+            {'tasks': self.pks, **form_data},
+        )
+
+    def test_change_status(self):
+        response = self.post(action='status', status=other_status['pk'])
+
+        self.assertIn(BULK_UPDATE_SUCCESS_MESSAGE, get_response_messages(response))
+        self.assertRedirects(response, reverse_lazy('tasks:index'))
+        self.assertEqual(
+            Task.objects.filter(pk__in=self.pks, status_id=other_status['pk']).count(),
+            len(self.pks),
+        )
+
+    def test_reassign(self):
+        self.post(action='executor', executor=user['pk'])
+
+        self.assertEqual(
+            Task.objects.filter(pk__in=self.pks, executor_id=user['pk']).count(),
+            len(self.pks),
+        )
+
+    def test_add_labels(self):
+        self.post(action='labels', labels=[label['pk']])
+        self.post(action='labels', labels=[label['pk']])
+
+        self.assertEqual(
+            Relationships.objects.filter(task_id__in=self.pks).count(),
+            len(self.pks),
+        )
+
+    def test_delete(self):
+        response = self.post(action='delete')
+
+        self.assertIn(BULK_DELETE_SUCCESS_MESSAGE, get_response_messages(response))
+        self.assertFalse(Task.objects.filter(pk__in=self.pks).exists())
+
+    def test_delete_not_own_task(self):
+        foreign_task = Task.objects.create(
+            name=new_task['name'],
+            status_id=status['pk'],
+            created_by_id=user['pk'],
+        )
+        self.pks.append(foreign_task.pk)
+
+        response = self.post(action='delete')
+
+        self.assertIn(
+            BULK_PERMISSION_DENIED_MESSAGE,
+            get_response_messages(response),
+        )
+        remaining = Task.objects.filter(pk__in=self.pks)
+
+        self.assertEqual(remaining.count(), len(self.pks))
+
+
+class ImportTest(TestCase):
+    """Task import page tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(
+            username=task_owner['username'],
+            password=task_owner['password'],
+        )
+
+    def test_import(self):
+        upload = SimpleUploadedFile(
+            'tasks.csv',
+            'name,status,labels\n{0},{1},{2}\n'.format(
+                new_task['name'],
+                status['name'],
+                label['name'],
+            ).encode(),
+        )
+
+        response = self.client.post(reverse_lazy('tasks:import'), {'upload': upload})
+
+        self.assertIn(
+            IMPORT_SUCCESS_MESSAGE.format(count=1),
+            get_response_messages(response),
+        )
+        self.assertRedirects(response, reverse_lazy('tasks:index'))
+
+        imported_task = Task.objects.get(name=new_task['name'])
+
+        self.assertEqual(imported_task.created_by_id, task_owner['pk'])
+        self.assertEqual(list(imported_task.labels.all()), [
+            Label.objects.get(pk=label['pk']),
+        ])
+
+    def test_unreadable_file(self):
+        uploads = (
+            SimpleUploadedFile(
+                'tasks.csv',
+                'name,status\n{0},{1}\n'.format(
+                    'Задача',
+                    status['name'],
+                ).encode('cp1251'),
+            ),
+            SimpleUploadedFile(
+                'tasks.json',
+                '[{{"name": "{0}", "status": "{1}"'.format(
+                    new_task['name'],
+                    status['name'],
+                ).encode(),
+            ),
+        )
+        for upload in uploads:
+            response = self.client.post(
+                reverse_lazy('tasks:import'),
+                {'upload': upload},
+            )
+
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertIn('upload', response.context['form'].errors)
+            self.assertFalse(Task.objects.filter(name=new_task['name']).exists())
+
+    def test_unknown_format(self):
+        upload = SimpleUploadedFile('tasks.xml', b'<tasks/>')
+
+        response = self.client.post(reverse_lazy('tasks:import'), {'upload': upload})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(Task.objects.filter(name=new_task['name']).exists())
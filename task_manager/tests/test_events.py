@@ -0,0 +1,256 @@
+"""Project live task updates tests."""
+
+import asyncio
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.misc import get_test_data
+from task_manager.tasks import event_backends, event_stream, events
+from task_manager.tasks.models import CREATED, DELETED, UPDATED, Task, TaskEvent
+from task_manager.users.models import User
+
+test_data = get_test_data()
+
+user = test_data['users']['has_relationships']
+status = test_data['statuses']['existing']
+other_status = test_data['statuses']['has_relationships']
+task = test_data['tasks']['existing']
+
+# Short enough for the backend tests not to wait.
+FAST_INTERVAL = 0.01
+
+
+def get_task_events(stream_text):
+    """Return the (id, data) pairs of the task events of a stream."""
+    found = []
+    for message in stream_text.split('\n\n'):
+        fields = dict(
+            line.split(': ', 1) for line in message.split('\n') if ': ' in line
+        )
+        if fields.get('event') == 'task':
+            event_id = int(fields['id'])
+            found.append((event_id, json.loads(fields['data'])))
+
+    return found
+
+
+class TaskEventPublishTest(TestCase):
+    """Task events recorded for every write."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def get_events(self):
+        return list(TaskEvent.objects.order_by('pk').values_list('action', 'task_id'))
+
+    def test_crud(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse_lazy('tasks:create'), test_data['tasks']['new'])
+        created = Task.objects.get(name=test_data['tasks']['new']['name'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse_lazy('tasks:update', args=[created.pk]),
+                {'name': 'Changed', 'status': status['pk']},
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse_lazy('tasks:delete', args=[created.pk]))
+
+        self.assertEqual(self.get_events(), [
+            (CREATED, created.pk),
+            (UPDATED, created.pk),
+            (DELETED, created.pk),
+        ])
+
+    def test_bulk_and_move(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse_lazy('tasks:bulk'),
+                {'tasks': [task['pk']], 'action': 'status', 'status': status['pk']},
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse_lazy('tasks:move', args=[task['pk']]),
+                {'status': other_status['pk']},
+            )
+
+        self.assertEqual(self.get_events(), [
+            (UPDATED, task['pk']),
+            (UPDATED, task['pk']),
+        ])
+
+    def test_published_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.filter(pk=task['pk']).get().save()
+            self.assertEqual(self.get_events(), [])
+
+        self.assertEqual(self.get_events(), [(UPDATED, task['pk'])])
+
+    def test_old_events_dropped(self):
+        with patch('task_manager.tasks.events.KEPT_EVENTS', 2):
+            for _ in range(3):
+                events.save_events(UPDATED, [task['pk']])
+
+        self.assertEqual(TaskEvent.objects.count(), 2)
+
+    @override_settings(TASK_EVENTS_BACKEND='unknown')
+    def test_unknown_backend(self):
+        with self.assertRaises(ImproperlyConfigured):
+            event_backends.get_backend()
+
+
+class TaskRowTest(TestCase):
+    """Tasks table row tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_row(self):
+        url = reverse_lazy('tasks:row', args=[task['pk']])
+
+        response = self.client.get(url, {'status': other_status['pk']})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, 'data-task="{0}"'.format(task['pk']))
+
+        response = self.client.get(url, {'status': status['pk']})
+
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+
+    def test_sync_server(self):
+        response = self.client.get(reverse_lazy('tasks:events'))
+
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+
+
+@patch('task_manager.tasks.event_stream.STREAM_DURATION', 0)
+class TaskEventStreamTest(TestCase):
+    """Task events stream tests."""
+
+    fixtures = ['data.json']
+    client_class = AsyncClient
+
+    def setUp(self):
+        self.client.force_login(User.objects.get(pk=user['pk']))
+        self.events = TaskEvent.objects.bulk_create(
+            TaskEvent(task_id=task['pk'], action=action)
+            for action in (CREATED, UPDATED, DELETED)
+        )
+
+    async def read(self, response):
+        return ''.join([chunk.decode() async for chunk in response.streaming_content])
+
+    async def test_login_required(self):
+        response = await AsyncClient().get(reverse_lazy('tasks:events'))
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    async def test_resume(self):
+        url = reverse_lazy('tasks:events')
+
+        first_id = self.events[0].pk
+
+        response = await self.client.get(url, {'last_event_id': first_id})
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(
+            get_task_events(await self.read(response)),
+            [
+                (event.pk, {'id': task['pk'], 'action': event.action})
+                for event in self.events[1:]
+            ],
+        )
+
+        # The browser sends the last event id when it reconnects.
+        response = await self.client.get(
+            url,
+            {'last_event_id': first_id},
+            headers={'Last-Event-ID': str(self.events[1].pk)},
+        )
+
+        self.assertEqual(
+            [pk for pk, _ in get_task_events(await self.read(response))],
+            [self.events[2].pk],
+        )
+
+    async def test_reset(self):
+        await TaskEvent.objects.filter(pk=self.events[0].pk).adelete()
+
+        response = await self.client.get(
+            reverse_lazy('tasks:events'),
+            {'last_event_id': self.events[0].pk - 1},
+        )
+        stream_text = await self.read(response)
+
+        self.assertIn('event: reset', stream_text)
+        self.assertEqual(get_task_events(stream_text), [])
+
+    async def test_invalid_id(self):
+        response = await self.client.get(
+            reverse_lazy('tasks:events'),
+            {'last_event_id': 'x'},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+
+@patch('task_manager.tasks.event_stream.HEARTBEAT_INTERVAL', FAST_INTERVAL)
+@patch('task_manager.tasks.event_backends.POLL_INTERVAL', FAST_INTERVAL)
+class TaskEventBackendTest(TestCase):
+    """Events reaching open streams."""
+
+    fixtures = ['data.json']
+
+    async def read_new_event(self, publish):
+        stream = event_stream.stream_events(None)
+        chunks = []
+        # The retry delay and a heartbeat come before any event.
+        async for chunk in stream:
+            chunks.append(chunk)
+            if len(chunks) == 2:
+                await publish()
+            elif 'event: task' in chunk:
+                break
+        await stream.aclose()
+
+        return get_task_events(''.join(chunks))
+
+    async def publish_local(self):
+        event_backends.get_backend().published([self.event])
+
+    async def publish_saved(self):
+        # Saved by another worker, which the backend does not see.
+        self.event = await TaskEvent.objects.acreate(
+            task_id=task['pk'],
+            action=CREATED,
+        )
+
+    @override_settings(TASK_EVENTS_BACKEND='local')
+    async def test_local_backend(self):
+        self.event = TaskEvent(pk=1, task_id=task['pk'], action=UPDATED)
+
+        self.assertEqual(
+            await asyncio.wait_for(self.read_new_event(self.publish_local), 1),
+            [(1, {'id': task['pk'], 'action': UPDATED})],
+        )
+        self.assertFalse(event_backends.hub.queues)
+
+    @override_settings(TASK_EVENTS_BACKEND='database')
+    async def test_database_backend(self):
+        found = await asyncio.wait_for(self.read_new_event(self.publish_saved), 1)
+
+        self.assertEqual(
+            found,
+            [(self.event.pk, {'id': task['pk'], 'action': CREATED})],
+        )
@@ -0,0 +1,108 @@
+"""Project tasks export tests."""
+
+import csv
+import io
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.misc import TaskFactoryMixin, get_test_data
+from task_manager.tasks.models import Task
+
+test_data = get_test_data()
+
+user = test_data['users']['has_relationships']
+status = test_data['statuses']['existing']
+label = test_data['labels']['existing']
+task = test_data['tasks']['existing']
+
+TASKS = 30
+
+
+class ExportTestMixin(TaskFactoryMixin):
+    """Log in and create more tasks than fit in an export chunk."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+        self.create_tasks(TASKS)
+
+    def export(self, export_format, query=''):
+        response = self.client.get('{0}?{1}'.format(
+            reverse_lazy('tasks:export', args=[export_format]),
+            query,
+        ))
+
+        return b''.join(response.streaming_content).decode()
+
+
+class CSVExportTest(ExportTestMixin, TestCase):
+    """Task CSV export tests."""
+
+    def test_csv_export(self):
+        rows = list(csv.DictReader(io.StringIO(self.export('csv'))))
+
+        self.assertEqual(len(rows), Task.objects.count())
+        self.assertEqual(rows[-1]['labels'], label['name'])
+
+    def test_csv_formulas_escaped(self):
+        Task.objects.filter(pk=task['pk']).update(
+            name='=1+2',
+            description='@SUM(A1:A2)',
+        )
+        rows = csv.DictReader(io.StringIO(self.export('csv')))
+        rows_by_id = {row['id']: row for row in rows}
+        exported = rows_by_id[str(task['pk'])]
+
+        self.assertEqual(exported['name'], "'=1+2")
+        self.assertEqual(exported['description'], "'@SUM(A1:A2)")
+
+    def test_labels_queried_per_chunk(self):
+        with patch('task_manager.tasks.export.CHUNK_SIZE', 10):
+            with CaptureQueriesContext(connection) as context:
+                self.export('csv')
+                label_queries = [
+                    query for query in context.captured_queries
+                    if 'FROM "tasks_relationships"' in query['sql']
+                ]
+
+        self.assertEqual(len(label_queries), 4)
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse_lazy('tasks:export', args=['xml']))
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+class JSONExportTest(ExportTestMixin, TestCase):
+    """Task JSON export tests."""
+
+    def test_json_export(self):
+        query = 'status={0}'.format(status['pk'])
+        rows = json.loads(self.export('json', query))
+
+        self.assertEqual(
+            [row['id'] for row in rows],
+            list(
+                Task.objects.filter(status_id=status['pk']).order_by(
+                    'created_at', 'id',
+                ).values_list('pk', flat=True),
+            ),
+        )
+
+    def test_formulas_kept(self):
+        Task.objects.filter(pk=task['pk']).update(name='=1+2')
+        rows = json.loads(self.export('json'))
+
+        self.assertIn('=1+2', [row['name'] for row in rows])
+
+    def test_empty_json_export(self):
+        rows = json.loads(self.export('json', 'executor=0'))
+
+        self.assertEqual(rows, [])
@@ -7,8 +7,8 @@ from task_manager.misc import get_test_data
 from task_manager.tasks.models import Task
 
 
-class TaskFilterTest(TestCase):
-    """Task filters test."""
+class TaskFilterMixin(object):
+    """Log in the user with related tasks."""
 
     fixtures = ['data.json']
 
@@ -24,6 +24,10 @@ class TaskFilterTest(TestCase):
             password=user['password'],
         )
 
+
+class TaskFilterTest(TaskFilterMixin, TestCase):
+    """Task filters test."""
+
     def test_status_filter(self):
         status = self.test_data['statuses']['has_relationships']
         response = self.client.get(
@@ -54,7 +58,10 @@ class TaskFilterTest(TestCase):
 
     def test_label_filter(self):
         label = self.test_data['labels']['has_relationships']
-        response = self.client.get(reverse_lazy('tasks:index'), {'label': label['pk']})
+        response = self.client.get(
+            reverse_lazy('tasks:index'),
+            {'labels': label['pk']},
+        )
         filtered_tasks = Task.objects.filter(labels__id=label['pk'])
 
         self.assertQuerysetEqual(
@@ -73,3 +80,65 @@ class TaskFilterTest(TestCase):
             filtered_tasks,
             ordered=False,
         )
+
+
+class TaskSearchTest(TaskFilterMixin, TestCase):
+    """Task full-text search tests."""
+
+    def test_search_filter(self):
+        task = self.test_data['tasks']['existing']
+        response = self.client.get(reverse_lazy('tasks:index'), {'search': 'EMAIL'})
+
+        self.assertQuerysetEqual(
+            response.context['task_list'],
+            Task.objects.filter(pk=task['pk']),
+        )
+
+        response = self.client.get(
+            reverse_lazy('tasks:index'),
+            {'search': 'email "OR" missing*'},
+        )
+
+        self.assertQuerysetEqual(response.context['task_list'], [])
+
+    def test_search_ranking(self):
+        existing = self.test_data['tasks']['existing']
+        task = Task.objects.get(pk=existing['pk'])
+        Task.objects.bulk_create((
+            Task(
+                name='Reply',
+                description='Answer the email',
+                status_id=task.status_id,
+                created_by_id=task.created_by_id,
+            ),
+        ))
+        task.name = 'Email world'
+        task.save()
+
+        response = self.client.get(
+            reverse_lazy('tasks:index'),
+            {'search': 'email', 'status': task.status_id},
+        )
+
+        self.assertEqual(
+            [found.name for found in response.context['task_list']],
+            ['Email world', 'Reply'],
+        )
+
+    def test_search_index_update(self):
+        existing = self.test_data['tasks']['existing']
+        task = Task.objects.get(pk=existing['pk'])
+        task.name = 'Call the office'
+        task.description = ''
+        task.save()
+
+        for text, expected in (('email', []), ('office', [task])):
+            response = self.client.get(reverse_lazy('tasks:index'), {'search': text})
+
+            self.assertQuerysetEqual(response.context['task_list'], expected)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        response = self.client.get(reverse_lazy('tasks:index'), {'search': 'office'})
+
+        self.assertQuerysetEqual(response.context['task_list'], [])
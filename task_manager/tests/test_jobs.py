@@ -0,0 +1,272 @@
+"""Project background jobs tests."""
+
+import tempfile
+import threading
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+from types import MappingProxyType
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from task_manager.jobs.models import DONE, FAILED, QUEUED, Job
+from task_manager.jobs.queue import (
+    KEEP_FINISHED,
+    JobType,
+    delete_finished_jobs,
+    enqueue,
+    job_types,
+)
+from task_manager.jobs.worker import claim_job, finish_job, run_job
+from task_manager.misc import get_test_data
+from task_manager.tasks.jobs import (
+    EXPORT_JOB,
+    NOTIFY_ASSIGNMENT_JOB,
+    REBUILD_COUNTERS_JOB,
+)
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+test_data = get_test_data()
+
+user = test_data['users']['has_relationships']
+other_user = test_data['users']['existing']
+status = test_data['statuses']['existing']
+task = test_data['tasks']['existing']
+
+# Removed with its files when the tests exit.
+media_root = tempfile.TemporaryDirectory()
+
+
+def read_output(job):
+    with job.output.open('rb') as output:
+        return output.read()
+
+
+def take_turns(function, lock):
+    def wrapper(*args, **kwargs):
+        with lock:
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def succeed(text):
+    return ContentFile(text.encode(), name='result.txt')
+
+
+def fail():
+    raise RuntimeError('Broken')
+
+
+TEST_JOBS = MappingProxyType({
+    'test.succeed': JobType(succeed, 'Succeed', 3, 60),
+    'test.fail': JobType(fail, 'Fail', 2, 60),
+})
+
+
+@override_settings(MEDIA_ROOT=media_root.name)
+@patch.dict(job_types, TEST_JOBS)
+class JobQueueTest(TestCase):
+    """Job queue tests."""
+
+    def test_unknown_job(self):
+        with self.assertRaises(LookupError):
+            enqueue('test.unknown')
+
+    def test_success(self):
+        job = enqueue('test.succeed', text='Done')
+
+        run_job(claim_job())
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(read_output(job), b'Done')
+        self.assertEqual(job.output_name, 'result.txt')
+        self.assertIsNone(claim_job())
+
+    def test_retry_with_backoff(self):
+        job = enqueue('test.fail')
+
+        with self.assertLogs('task_manager.jobs.worker', 'ERROR'):
+            run_job(claim_job())
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, QUEUED)
+        self.assertIn('Broken', job.error)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIsNone(claim_job())
+
+    def test_failed_after_last_attempt(self):
+        job = enqueue('test.fail')
+        Job.objects.filter(pk=job.pk).update(attempts=1)
+
+        with self.assertLogs('task_manager.jobs.worker', 'ERROR'):
+            run_job(claim_job())
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.attempts, 2)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_claimed_once(self):
+        enqueue('test.succeed', text='Done')
+
+        self.assertIsNotNone(claim_job())
+        self.assertIsNone(claim_job())
+
+    def test_timed_out(self):
+        job = enqueue('test.succeed', text='Done')
+        claim_job()
+        Job.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1),
+            attempts=3,
+        )
+
+        run_job(claim_job())
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.attempts, 4)
+
+    def test_delete_finished_jobs(self):
+        job = enqueue('test.succeed', text='Done')
+        run_job(claim_job())
+        Job.objects.filter(pk=job.pk).update(
+            finished_at=timezone.now() - KEEP_FINISHED - timedelta(days=1),
+        )
+        output_name = Job.objects.get(pk=job.pk).output.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(delete_finished_jobs(), 1)
+
+        self.assertFalse(default_storage.exists(output_name))
+
+
+@override_settings(MEDIA_ROOT=media_root.name)
+@patch.dict(job_types, TEST_JOBS)
+class RunWorkerTest(TransactionTestCase):
+    """Worker command tests."""
+
+    def test_run_worker(self):
+        jobs = [enqueue('test.succeed', text=str(number)) for number in range(5)]
+        # The in-memory test database fails concurrent writes instead of
+        # waiting for them like a database file or PostgreSQL.
+        lock = threading.Lock()
+
+        with patch(
+            'task_manager.jobs.worker.claim_job',
+            take_turns(claim_job, lock),
+        ):
+            with patch(
+                'task_manager.jobs.worker.finish_job',
+                take_turns(finish_job, lock),
+            ):
+                call_command(
+                    'run_worker',
+                    '--burst',
+                    '--concurrency', '2',
+                    stdout=StringIO(),
+                )
+
+        self.assertEqual(
+            sorted(read_output(job).decode() for job in Job.objects.all()),
+            [job.kwargs['text'] for job in jobs],
+        )
+        self.assertFalse(Job.objects.exclude(status=DONE).exists())
+
+
+@override_settings(MEDIA_ROOT=media_root.name)
+class TaskJobsTest(TestCase):
+    """Task background jobs tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_export(self):
+        response = self.client.post(
+            '{0}?self_tasks=on'.format(reverse_lazy('tasks:export_job', args=['csv'])),
+        )
+        job = Job.objects.get(name=EXPORT_JOB)
+
+        self.assertRedirects(response, reverse_lazy('jobs:index'))
+        self.assertEqual(job.created_by_id, user['pk'])
+        self.assertEqual(job.kwargs['query'], 'self_tasks=on')
+
+        run_job(claim_job())
+        response = self.client.get(reverse_lazy('jobs:output', args=[job.pk]))
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn(
+            task['name'],
+            b''.join(response.streaming_content).decode(),
+        )
+
+        response = self.client.get(reverse_lazy('jobs:index'))
+
+        self.assertContains(response, reverse_lazy('jobs:output', args=[job.pk]))
+
+        self.client.login(
+            username=other_user['username'],
+            password=other_user['password'],
+        )
+        response = self.client.get(reverse_lazy('jobs:output', args=[job.pk]))
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_assignment_notification(self):
+        User.objects.filter(pk=other_user['pk']).update(email='luffy@example.com')
+
+        self.client.post(
+            reverse_lazy('tasks:create'),
+            {**test_data['tasks']['new'], 'executor': other_user['pk']},
+        )
+        created = Task.objects.get(name=test_data['tasks']['new']['name'])
+        job = Job.objects.get(name=NOTIFY_ASSIGNMENT_JOB)
+
+        self.assertEqual(
+            job.kwargs,
+            {'task_id': created.pk, 'executor_id': other_user['pk']},
+        )
+
+        run_job(claim_job())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['luffy@example.com'])
+        self.assertIn(created.name, mail.outbox[0].subject)
+
+    def test_bulk_reassign(self):
+        self.client.post(
+            reverse_lazy('tasks:bulk'),
+            {'tasks': [task['pk']], 'action': 'executor', 'executor': user['pk']},
+        )
+
+        self.assertEqual(
+            list(Job.objects.values_list('name', 'kwargs')),
+            [(
+                NOTIFY_ASSIGNMENT_JOB,
+                {'task_id': task['pk'], 'executor_id': user['pk']},
+            )],
+        )
+
+    def test_deferred_counters_rebuild(self):
+        call_command('task_counters', 'rebuild', '--defer', stdout=StringIO())
+
+        self.assertEqual(
+            list(Job.objects.values_list('name', flat=True)),
+            [REBUILD_COUNTERS_JOB],
+        )
+
+        run_job(claim_job())
+
+        self.assertEqual(Job.objects.get().status, DONE)
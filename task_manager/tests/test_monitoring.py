@@ -0,0 +1,105 @@
+"""Project slow query log tests."""
+
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.misc import get_test_data
+from task_manager.monitoring.models import QueryFingerprint
+from task_manager.monitoring.queries import get_fingerprint, normalize
+
+test_data = get_test_data()
+
+user = test_data['users']['existing']
+
+# Django's parameter placeholder, joined so that it is not taken for
+# string formatting.
+PLACEHOLDER = ''.join(('%', 's'))
+
+
+class NormalizeTest(TestCase):
+    """Query normalization tests."""
+
+    def test_literals(self):
+        sql = '\n'.join((
+            'SELECT "a"."id" FROM "a"  WHERE "a"."name" = \'it\'\'s\'',
+            'AND "a"."id" > 10 AND "a"."col1" = {0} LIMIT 21',
+        )).format(PLACEHOLDER)
+
+        self.assertEqual(
+            normalize(sql),
+            ' '.join((
+                'SELECT "a"."id" FROM "a" WHERE "a"."name" = ?',
+                'AND "a"."id" > ? AND "a"."col1" = ? LIMIT ?',
+            )),
+        )
+
+    def test_value_lists(self):
+        sql = 'SELECT 1 FROM a WHERE id IN ({0})'
+        two_placeholders = '{0}, {0}'.format(PLACEHOLDER)
+
+        self.assertEqual(
+            get_fingerprint(normalize(sql.format(PLACEHOLDER))),
+            get_fingerprint(normalize(sql.format(two_placeholders))),
+        )
+        self.assertEqual(
+            normalize('INSERT INTO a (b) VALUES ($1), ($2), ($3)'),
+            'INSERT INTO a (b) VALUES (...)',
+        )
+
+
+@override_settings(
+    MIDDLEWARE=[
+        'task_manager.monitoring.middleware.SlowQueryMiddleware',
+        *settings.MIDDLEWARE,
+    ],
+    SLOW_QUERY_FLUSH_INTERVAL=0,
+)
+class SlowQueryMiddlewareTest(TestCase):
+    """Slow query middleware tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_aggregation(self):
+        self.client.get(reverse_lazy('statuses:index'))
+        self.client.get(reverse_lazy('statuses:index'))
+
+        fingerprints = QueryFingerprint.objects.filter(view='statuses:index')
+
+        self.assertTrue(fingerprints.exists())
+        for query in fingerprints:
+            self.assertEqual(query.count, 2)
+            self.assertGreaterEqual(query.total_ms, query.max_ms)
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+    def test_slow_query_log(self):
+        with self.assertLogs('task_manager.monitoring', 'WARNING') as logs:
+            self.client.get(reverse_lazy('statuses:index'))
+            messages = [record.getMessage() for record in logs.records]
+
+        self.assertIn('Slow query in statuses:index', messages[0])
+        self.assertTrue(
+            any('statuses_status' in message for message in messages),
+        )
+
+    def test_command(self):
+        self.client.get(reverse_lazy('statuses:index'))
+        output = StringIO()
+
+        call_command(
+            'slow_queries',
+            '--view', 'statuses:index',
+            '--order', 'mean',
+            '--reset',
+            stdout=output,
+        )
+
+        self.assertIn('statuses:index', output.getvalue())
+        self.assertIn('"statuses_status"', output.getvalue())
+        self.assertFalse(QueryFingerprint.objects.exists())
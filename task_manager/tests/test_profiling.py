@@ -0,0 +1,89 @@
+"""Project request profiling tests."""
+
+import json
+import re
+from http import HTTPStatus
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.misc import get_test_data
+from task_manager.users.models import User
+
+test_data = get_test_data()
+
+user = test_data['users']['existing']
+
+
+@override_settings(
+    MIDDLEWARE=['task_manager.profiling.ProfilingMiddleware', *settings.MIDDLEWARE],
+    PROFILING_SAMPLE_RATE=0,
+)
+class ProfilingMiddlewareTest(TestCase):
+    """Profiling middleware tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_server_timing(self):
+        response = self.client.get(reverse_lazy('statuses:index'))
+        metrics = [
+            metric.split(';')[0]
+            for metric in response['Server-Timing'].split(', ')
+        ]
+
+        self.assertEqual(metrics, ['db', 'tpl', 'total'])
+        self.assertRegex(response['Server-Timing'], r'desc="[1-9]\d* queries"')
+
+    def test_template_time_of_cached_list(self):
+        # The first response sets the CSRF cookie the page cache needs.
+        self.client.get(reverse_lazy('index'))
+        cache.clear()
+
+        response = self.client.get(reverse_lazy('tasks:index'))
+        template_time = re.search(r'tpl;dur=([\d.]+)', response['Server-Timing'])
+
+        self.assertGreater(float(template_time.group(1)), 0)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_sampled_log(self):
+        with self.assertLogs('task_manager.profiling', 'INFO') as logs:
+            self.client.get(reverse_lazy('statuses:index'))
+            record = json.loads(logs.records[0].getMessage())
+
+        self.assertEqual(record['view'], 'statuses:index')
+        self.assertEqual(record['status'], HTTPStatus.OK)
+        self.assertGreater(record['queries'], 0)
+
+    def test_staff_profile(self):
+        User.objects.filter(username=user['username']).update(is_staff=True)
+
+        response = self.client.get(
+            reverse_lazy('statuses:index'),
+            {'profile': 'tottime'},
+        )
+
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertContains(response, 'function calls')
+
+    def test_profile_requires_staff(self):
+        response = self.client.get(
+            reverse_lazy('statuses:index'),
+            {'profile': ''},
+        )
+
+        self.assertTemplateUsed(response, 'statuses/status_list.html')
+
+    def test_profile_requires_safe_method(self):
+        User.objects.filter(username=user['username']).update(is_staff=True)
+
+        response = self.client.post(
+            '{0}?profile'.format(reverse_lazy('statuses:create')),
+            {'name': test_data['statuses']['new']['name']},
+        )
+
+        self.assertRedirects(response, reverse_lazy('statuses:index'))
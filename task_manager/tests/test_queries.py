@@ -0,0 +1,112 @@
+"""Project query budget tests."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+from parameterized import parameterized_class
+
+from task_manager.labels.models import Label
+from task_manager.misc import QueryBudgetMixin, get_test_data
+from task_manager.tasks.models import Relationships, Task
+
+test_data = get_test_data()
+
+user = test_data['users']['has_relationships']
+status = test_data['statuses']['existing']
+label = test_data['labels']['existing']
+task = test_data['tasks']['existing']
+
+
+@parameterized_class(
+    ('url', 'args', 'query', 'budget'),
+    [
+        ('index', [], '', 6),
+        ('users:index', [], '', 3),
+        ('users:autocomplete', [], 'q=a', 3),
+        ('users:create', [], '', 2),
+        ('users:update', [user['pk']], '', 3),
+        ('users:delete', [user['pk']], '', 4),
+        ('statuses:index', [], '', 3),
+        ('statuses:autocomplete', [], '', 3),
+        ('statuses:create', [], '', 2),
+        ('statuses:update', [status['pk']], '', 3),
+        ('statuses:delete', [status['pk']], '', 4),
+        ('labels:index', [], '', 3),
+        ('labels:autocomplete', [], '', 3),
+        ('labels:create', [], '', 2),
+        ('labels:update', [label['pk']], '', 3),
+        ('labels:delete', [label['pk']], '', 4),
+        ('tasks:index', [], '', 4),
+        ('tasks:index', [], 'status={0}'.format(status['pk']), 5),
+        ('tasks:index', [], 'executor={0}'.format(user['pk']), 6),
+        ('tasks:index', [], 'labels={0}'.format(label['pk']), 5),
+        ('tasks:index', [], 'self_tasks=on', 4),
+        ('tasks:index', [], 'search=task', 4),
+        ('tasks:board', [], '', 4),
+        ('tasks:board_column', [status['pk']], '', 3),
+        ('tasks:create', [], '', 2),
+        ('tasks:import', [], '', 2),
+        ('tasks:export', ['csv'], '', 4),
+        ('tasks:detail', [task['pk']], '', 4),
+        ('tasks:update', [task['pk']], '', 6),
+        ('tasks:delete', [task['pk']], '', 3),
+        ('jobs:index', [], '', 3),
+        ('api:tasks:list', [], '', 3),
+        ('api:tasks:list', [], 'include=status,author,labels', 7),
+        ('api:tasks:list', [], 'labels={0}'.format(label['pk']), 4),
+        ('api:tasks:detail', [task['pk']], 'include=labels', 5),
+        ('api:statuses:list', [], '', 3),
+        ('api:labels:list', [], '', 3),
+        ('api:users:list', [], '', 3),
+        ('login', [], '', 2),
+    ],
+)
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class QueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Pages run a fixed number of queries whatever the number of rows."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+        # The first response sets the CSRF cookie.
+        self.client.get(reverse_lazy('index'))
+
+    def grow(self):
+        call_command(
+            'seed_bench',
+            '--users', '5',
+            '--statuses', '5',
+            '--labels', '5',
+            '--tasks', '20',
+            stdout=StringIO(),
+        )
+        Relationships.objects.bulk_create(
+            (
+                Relationships(task_id=task['pk'], label=new_label)
+                for new_label in Label.objects.exclude(pk=label['pk'])
+            ),
+            ignore_conflicts=True,
+        )
+        Task.objects.filter(pk__gt=task['pk']).update(
+            created_by_id=user['pk'],
+        )
+
+    def test_query_budget(self):
+        url = '{0}?{1}'.format(reverse_lazy(self.url, args=self.args), self.query)
+
+        self.assert_query_budget(self.budget, url, self.grow)
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class LogoutQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Logout runs a fixed number of queries."""
+
+    fixtures = ['data.json']
+
+    def test_query_budget(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+        self.assertEqual(self.count_queries(reverse_lazy('logout'), 'post'), 4)
@@ -1,8 +1,12 @@
 """Project view tests."""
 
 from http import HTTPStatus
+from types import MappingProxyType
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from parameterized import parameterized_class
 
@@ -13,7 +17,9 @@ from task_manager.labels.views import (
     LabelDeleteView,
     LabelUpdateView,
 )
-from task_manager.misc import get_test_data
+from task_manager.misc import TaskFactoryMixin, get_test_data
+from task_manager.pagination import NEXT, encode_cursor
+from task_manager.statuses.choices import status_choices
 from task_manager.statuses.models import Status
 from task_manager.statuses.views import IndexView as StatusIndexView
 from task_manager.statuses.views import (
@@ -22,6 +28,7 @@ from task_manager.statuses.views import (
     StatusUpdateView,
 )
 from task_manager.tasks.models import Task
+from task_manager.tasks.views import BOARD_PAGE_SIZE, TASKS_PER_PAGE
 from task_manager.tasks.views import IndexView as TaskIndexView
 from task_manager.tasks.views import (
     TaskCreationView,
@@ -46,6 +53,15 @@ status = test_data['statuses']['existing']
 label = test_data['labels']['existing']
 task = test_data['tasks']['existing']
 
+# Tasks added to show that the query count does not grow with them.
+EXTRA_TASKS = 20
+
+# EXPLAIN output of a query reading the whole table.
+FULL_SCANS = MappingProxyType({
+    'sqlite': r'\bSCAN {0}\b',
+    'postgresql': r'\bSeq Scan on {0}\b',
+})
+
 
 class ViewsTest(TestCase):
     """Views tests."""
@@ -62,6 +78,24 @@ class ViewsTest(TestCase):
             IndexView.as_view().__name__,
         )
 
+    def test_index_dashboard(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+        response = self.client.get(reverse_lazy('index'))
+        dashboard = response.context['dashboard']
+
+        self.assertEqual(
+            [(row['name'], row['count']) for row in dashboard['status']],
+            [(Task.objects.get(pk=task['pk']).status.name, 1)],
+        )
+        self.assertContains(
+            response,
+            '{0}?labels={1}'.format(
+                reverse_lazy('tasks:index'),
+                dashboard['label'][0]['pk'],
+            ),
+        )
+
     def test_task_detal_view(self):
         self.client.login(username=user['username'], password=user['password'])
 
@@ -237,3 +271,266 @@ class CRUDPageTest(TestCase):
             response.resolver_match.func.__name__,
             self.view.as_view().__name__,
         )
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class TaskQueriesTest(TaskFactoryMixin, TestCase):
+    """Task pages query count tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        # Versions left by other tests may expire during this one.
+        cache.clear()
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_task_list_queries(self):
+        with self.assertNumQueries(4):
+            self.client.get(reverse_lazy('tasks:index'))
+
+        self.create_tasks(EXTRA_TASKS)
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse_lazy('tasks:index'))
+
+    def test_task_detail_queries(self):
+        self.create_tasks(EXTRA_TASKS)
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse_lazy('tasks:detail', args=[task['pk']]))
+
+
+@parameterized_class(
+    ('url_name', 'pk', 'table', 'table_queries'),
+    [
+        ('tasks:delete', task['pk'], 'tasks_task', 1),
+        # The session user is loaded from the same table.
+        ('users:update', user['pk'], 'users_user', 2),
+        ('users:delete', user['pk'], 'users_user', 2),
+    ],
+)
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class PermissionObjectQueriesTest(TestCase):
+    """Permission protected pages fetch their object once."""
+
+    fixtures = ['data.json']
+
+    def test_object_queries(self):
+        self.client.login(username=user['username'], password=user['password'])
+        url = reverse_lazy(self.url_name, args=[self.pk])
+
+        table_from = 'FROM "{0}"'.format(self.table)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+            table_queries = [
+                query for query in context.captured_queries
+                if query['sql'].startswith('SELECT') and table_from in query['sql']
+            ]
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(table_queries), self.table_queries)
+
+
+class TaskPaginationTest(TaskFactoryMixin, TestCase):
+    """Task list keyset pagination tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+        self.create_tasks(TASKS_PER_PAGE * 2)
+
+    def walk(self, query, direction):
+        pages = []
+        url = reverse_lazy('tasks:index')
+
+        while query is not None:
+            self.last_query = query
+            response = self.client.get('{0}?{1}'.format(url, query))
+            pages.append([row.pk for row in response.context['task_list']])
+            query = response.context[direction]
+
+        return pages
+
+    def test_pages(self):
+        pages = self.walk('', 'next_page_query')
+        ordered_ids = list(
+            Task.objects.order_by('created_at', 'id').values_list('pk', flat=True),
+        )
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(sum(pages, []), ordered_ids)
+
+    def test_previous_pages(self):
+        pages = self.walk('', 'next_page_query')
+        url = reverse_lazy('tasks:index')
+        cache.clear()
+        response = self.client.get('{0}?{1}'.format(url, self.last_query))
+        previous_pages = self.walk(
+            response.context['previous_page_query'],
+            'previous_page_query',
+        )
+
+        self.assertEqual(previous_pages, pages[-2::-1])
+
+    def test_filtered_pages(self):
+        pages = self.walk(
+            'status={0}'.format(status['pk']),
+            'next_page_query',
+        )
+        filtered_ids = list(
+            Task.objects.filter(status_id=status['pk']).order_by(
+                'created_at', 'id',
+            ).values_list('pk', flat=True),
+        )
+
+        self.assertEqual(sum(pages, []), filtered_ids)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse_lazy('tasks:index'), {'cursor': 'x'})
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_tampered_cursor(self):
+        for row_values in (['notadate', 1], [{'a': 1}, 1], [None, 1]):
+            cursor = encode_cursor(NEXT, row_values)
+
+            response = self.client.get(
+                reverse_lazy('tasks:index'),
+                {'cursor': cursor},
+            )
+
+            self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+        cursor = encode_cursor(NEXT, ['2021-01-01T00:00:00+00:00', 'x'])
+        response = self.client.get(
+            reverse_lazy('tasks:index'),
+            {'search': 'email', 'cursor': cursor},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+@parameterized_class(
+    ('url', 'term', 'expected', 'table'),
+    [
+        ('users:autocomplete', 'zo', [user['pk']], 'users_user'),
+        ('statuses:autocomplete', 'comp', [status['pk']], 'statuses_status'),
+        ('labels:autocomplete', 'qu', [label['pk']], 'labels_label'),
+    ],
+)
+class AutocompleteTest(TestCase):
+    """Autocomplete views tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        self.client.login(username=user['username'], password=user['password'])
+
+    def test_autocomplete(self):
+        response = self.client.get(reverse_lazy(self.url), {'q': self.term})
+        choices = response.json()
+
+        self.assertEqual(
+            [choice['id'] for choice in choices['results']],
+            self.expected,
+        )
+        self.assertIsNone(choices['next'])
+
+    def test_autocomplete_without_term(self):
+        response = self.client.get(reverse_lazy(self.url))
+        choices = response.json()['results']
+
+        self.assertGreater(len(choices), len(self.expected))
+
+    def test_autocomplete_uses_index(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse_lazy(self.url), {'q': self.term})
+            query = next(
+                executed['sql'] for executed in queries
+                if 'LIKE' in executed['sql'] and self.table in executed['sql']
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute('{0} {1}'.format(
+                connection.ops.explain_query_prefix(),
+                query,
+            ))
+            rows = cursor.fetchall()
+
+        plan = '\n'.join(str(row[-1]) for row in rows)
+
+        # Even "SCAN table USING INDEX" reads every row in index order.
+        self.assertNotRegex(plan, FULL_SCANS[connection.vendor].format(self.table))
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=None)
+class TaskBoardTest(TaskFactoryMixin, TestCase):
+    """Task board tests."""
+
+    fixtures = ['data.json']
+
+    def setUp(self):
+        # Versions left by other tests may expire during this one.
+        cache.clear()
+        # Moves validate the status against the cached choices.
+        status_choices.get()
+        self.client.login(username=user['username'], password=user['password'])
+        self.create_tasks(BOARD_PAGE_SIZE + 5)
+
+    def test_board(self):
+        response = self.client.get(reverse_lazy('tasks:board'))
+        columns = {column['pk']: column for column in response.context['columns']}
+        column_tasks = Task.objects.filter(status_id=status['pk']).order_by(
+            'created_at', 'id',
+        )
+        status_pks = Status.objects.values_list('pk', flat=True)
+
+        self.assertEqual(set(columns), set(status_pks))
+        self.assertEqual(
+            list(columns[status['pk']]['tasks']),
+            list(column_tasks[:BOARD_PAGE_SIZE]),
+        )
+        self.assertIn('next_page_query', columns[status['pk']])
+
+        response = self.client.get('{0}?{1}'.format(
+            reverse_lazy('tasks:board_column', args=[status['pk']]),
+            columns[status['pk']]['next_page_query'],
+        ))
+
+        self.assertEqual(
+            list(response.context['task_list']),
+            list(column_tasks[BOARD_PAGE_SIZE:]),
+        )
+        self.assertNotContains(response, 'data-board-more')
+
+    def test_move(self):
+        other_status = Status.objects.exclude(pk=status['pk']).first()
+
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                reverse_lazy('tasks:move', args=[task['pk']]),
+                {'status': other_status.pk},
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertEqual(Task.objects.get(pk=task['pk']).status, other_status)
+
+    def test_move_invalid(self):
+        url = reverse_lazy('tasks:move', args=[task['pk']])
+
+        response = self.client.post(url, {'status': 0})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
+
+        response = self.client.post(
+            reverse_lazy('tasks:move', args=[0]),
+            {'status': status['pk']},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
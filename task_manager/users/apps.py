@@ -2,9 +2,15 @@
 
 from django.apps import AppConfig
 
+from task_manager.caching import watch_model
+
 
 class UsersConfig(AppConfig):
     """Users config."""
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.users'
+
+    def ready(self):
+        """Track changes of users, except for logins."""
+        watch_model(self.get_model('User'), ignore_fields={'last_login'})
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+# The autocomplete matches names with istartswith: a LIKE on SQLite, which
+# needs NOCASE indexes, and UPPER(column::text) LIKE on PostgreSQL, which
+# needs expression indexes with pattern operators.
+COLUMNS = ('username', 'first_name', 'last_name')
+INDEXES = {
+    'sqlite': (
+        'CREATE INDEX IF NOT EXISTS users_{0}_prefix_idx '
+        'ON users_user ({0} COLLATE NOCASE)'
+    ),
+    'postgresql': (
+        'CREATE INDEX IF NOT EXISTS users_{0}_prefix_idx '
+        'ON users_user ((UPPER({0}::text)) text_pattern_ops)'
+    ),
+}
+
+
+def create_indexes(apps, schema_editor):
+    """Create the prefix search indexes of the database backend."""
+    statement = INDEXES.get(schema_editor.connection.vendor)
+    if statement is None:
+        return
+    for column in COLUMNS:
+        schema_editor.execute(statement.format(column))
+
+
+def drop_indexes(apps, schema_editor):
+    """Drop the prefix search indexes."""
+    if schema_editor.connection.vendor not in INDEXES:
+        return
+    for column in COLUMNS:
+        schema_editor.execute(
+            'DROP INDEX IF EXISTS users_{0}_prefix_idx'.format(column),
+        )
+
+
+class Migration(migrations.Migration):
+    """Index the user names for the case-insensitive autocomplete."""
+
+    dependencies = [
+        ('users', '0002_name_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -1,11 +1,25 @@
 """Users application models."""
 
 from django.contrib.auth.models import AbstractUser
+from django.db import models
 
 
 class User(AbstractUser):
     """Model representing a user account."""
 
+    class Meta(AbstractUser.Meta):
+        indexes = (
+            models.Index(
+                fields=('first_name', 'last_name', 'id'),
+                name='users_full_name_idx',
+            ),
+            models.Index(fields=('last_name',), name='users_last_name_idx'),
+        )
+
     def __str__(self):
         """Represent the model as a string."""
         return self.get_full_name()
+
+    def is_in_use(self):
+        """Return True if the user created a task or is assigned to one."""
+        return self.created_by.exists() or self.executor.exists()
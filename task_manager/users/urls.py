@@ -4,6 +4,7 @@ from django.urls import path
 
 from task_manager.users.views import (
     IndexView,
+    UserAutocompleteView,
     UserCreationView,
     UserDeleteView,
     UserUpdateView,
@@ -13,6 +14,7 @@ app_name = 'users'
 
 urlpatterns = [
     path('', IndexView.as_view(), name='index'),
+    path('autocomplete/', UserAutocompleteView.as_view(), name='autocomplete'),
     path('create/', UserCreationView.as_view(), name='create'),
     path('<int:pk>/update/', UserUpdateView.as_view(), name='update'),
     path('<int:pk>/delete/', UserDeleteView.as_view(), name='delete'),
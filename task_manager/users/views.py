@@ -9,11 +9,13 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.mixins import (
+    CachedListMixin,
     NoPermissionMixin,
     ProtectedErrorMixin,
     UserLoginRequiredMixin,
 )
 from task_manager.users.forms import UserCreateForm
+from task_manager.views import AutocompleteView
 
 CREATION_SUCCESS_MESSAGE = _('User successfully registered.')
 UPDATE_SUCCESS_MESSAGE = _('User successfully changed.')
@@ -26,10 +28,11 @@ PERMISSION_DENIED_MESSAGE = _('You have no rights to change another user.')
 PROTECTED_ERROR_MESSAGE = _('Unable to delete the user because it is in use.')
 
 
-class IndexView(ListView):
+class IndexView(CachedListMixin, ListView):
     """Users page view."""
 
     model = get_user_model()
+    watermark_models = (get_user_model(),)
 
 
 class UserCreationView(SuccessMessageMixin, CreateView):
@@ -100,6 +103,14 @@ class UserDeleteView(
         return self.request.user == user
 
 
+class UserAutocompleteView(AutocompleteView):
+    """User choices for autocomplete widgets."""
+
+    model = get_user_model()
+    search_fields = ('username', 'first_name', 'last_name')
+    keyset_ordering = ('first_name', 'last_name', 'id')
+
+
 class UserLoginView(SuccessMessageMixin, LoginView):
     """Login page view."""
 
@@ -1,9 +1,62 @@
 """Task manager project views."""
 
+from functools import reduce
+from operator import or_
+
+from django.db import models
+from django.http import JsonResponse
 from django.views.generic import TemplateView
+from django.views.generic.list import BaseListView
+
+from task_manager.mixins import KeysetPaginationMixin, UserLoginRequiredMixin
+from task_manager.tasks.dashboard import get_dashboard
+
+AUTOCOMPLETE_PAGE_SIZE = 20
 
 
 class IndexView(TemplateView):
     """Index page view."""
 
     template_name = 'index.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.request.user.is_authenticated:
+            context['dashboard'] = get_dashboard()
+
+        return context
+
+
+class AutocompleteView(
+    UserLoginRequiredMixin,
+    KeysetPaginationMixin,
+    BaseListView,
+):
+    """Base view returning JSON choices that start with the search term."""
+
+    paginate_by = AUTOCOMPLETE_PAGE_SIZE
+    search_kwarg = 'q'
+    search_fields = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        term = self.request.GET.get(self.search_kwarg, '').strip()
+
+        if not term:
+            return queryset
+
+        conditions = (
+            models.Q(**{'{0}__istartswith'.format(field): term})
+            for field in self.search_fields
+        )
+
+        return queryset.filter(reduce(or_, conditions))
+
+    def render_to_response(self, context, **response_kwargs):
+        return JsonResponse({
+            'results': [
+                {'id': choice.pk, 'text': str(choice)}
+                for choice in context['object_list']
+            ],
+            'next': context['page_obj'].next_cursor(),
+        })
@@ -0,0 +1,52 @@
+"""Task manager project widgets."""
+
+from contextlib import ExitStack
+
+from django import forms
+from django.urls import reverse_lazy
+
+from task_manager.fields import CachedChoiceIterator
+
+
+class AutocompleteMixin(object):
+    """Render only the selected options and load the rest on demand."""
+
+    def __init__(self, url, attrs=None):
+        """Remember the URL name of the autocomplete view."""
+        super().__init__(attrs)
+        self.url = url
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        """Point the client script at the autocomplete view."""
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs['data-autocomplete-url'] = reverse_lazy(self.url)
+
+        return attrs
+
+    def optgroups(self, name, selected_values, attrs=None):
+        """Query only the selected rows instead of the whole table."""
+        iterator = self.choices
+        selected = [choice for choice in selected_values if str(choice).isdigit()]
+
+        choices = []
+        if iterator.field.empty_label is not None:
+            choices.append(('', iterator.field.empty_label))
+
+        if isinstance(iterator, CachedChoiceIterator):
+            choices.extend(iterator.selected(selected))
+        else:
+            queryset = iterator.queryset.filter(pk__in=selected)
+            choices.extend(iterator.choice(choice) for choice in queryset)
+
+        self.choices = choices
+        with ExitStack() as stack:
+            stack.callback(setattr, self, 'choices', iterator)
+            return super().optgroups(name, selected_values, attrs)
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    """Select widget with options fetched from an autocomplete view."""
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    """Multiple select widget with options fetched from an autocomplete view."""